@@ -1,6 +1,12 @@
 # Frame_Ayirici/core/__init__.py
 
-from .video_processor import VideoProcessor
-from .protocols import SignalProtocol
+from .video_processor import VideoProcessor, ProcessingCancelled
+from .protocols import SignalProtocol, CancellationProtocol, CancellationToken
 
-__all__ = ['VideoProcessor', 'SignalProtocol']
+__all__ = [
+    'VideoProcessor',
+    'ProcessingCancelled',
+    'SignalProtocol',
+    'CancellationProtocol',
+    'CancellationToken'
+]
@@ -0,0 +1,12 @@
+# Frame_Ayirici/core/__main__.py
+"""
+Allows running the headless CLI with `python -m core`.
+"""
+
+import sys
+
+from core.cli import main
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,107 @@
+# Frame_Ayirici/core/analysis.py
+"""
+Per-frame analysis artefacts shared between strategies.
+When several strategies consume one decode stream, derived images such
+as a downscaled grayscale frame are computed by the first strategy that
+asks and reused by the others.
+"""
+
+from typing import Callable, Dict, Hashable, Tuple
+
+import cv2
+import numpy as np
+
+# Nearest-neighbour decimation keeps an unbiased sample of pixel values
+# and is the cheapest resize
+DEFAULT_INTERPOLATION = cv2.INTER_NEAREST
+
+
+def downscale_gray(
+    frame: np.ndarray,
+    width: int = 0,
+    interpolation: int = DEFAULT_INTERPOLATION
+) -> np.ndarray:
+    """
+    Shrink a BGR frame to a width, keeping the aspect ratio, and convert
+    it to grayscale. Shrinking first keeps the color conversion cheap.
+    
+    Args:
+        frame: BGR frame from OpenCV
+        width: Target width in pixels (0 or wider than the frame = full size)
+        interpolation: OpenCV interpolation flag used for resizing
+        
+    Returns:
+        Grayscale image of shape (H, W)
+    """
+    height, frame_width = frame.shape[:2]
+    
+    if 0 < width < frame_width:
+        scaled_height = max(int(round(height * width / frame_width)), 1)
+        frame = cv2.resize(frame, (width, scaled_height), interpolation=interpolation)
+    
+    return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+
+
+class SharedAnalysis:
+    """
+    Cache of analysis artefacts for the frames currently being decided.
+    
+    Artefacts are keyed by name and frame index, so strategies deciding
+    the same frame (or the same batch) get one computation between them.
+    The processor calls clear() once every strategy has seen the frame.
+    Results are shared and must not be modified.
+    """
+    
+    def __init__(self):
+        self._artefacts: Dict[Tuple[Hashable, int], np.ndarray] = {}
+    
+    def get(
+        self,
+        name: Hashable,
+        frame_index: int,
+        compute: Callable[[], np.ndarray]
+    ) -> np.ndarray:
+        """
+        Return an artefact of a frame, computing it on first use.
+        
+        Args:
+            name: Artefact key, including any parameters it depends on
+            frame_index: Index of the frame the artefact belongs to
+            compute: Builds the artefact when it is not cached
+            
+        Returns:
+            The cached or newly computed artefact
+        """
+        key = (name, frame_index)
+        artefact = self._artefacts.get(key)
+        if artefact is None:
+            artefact = self._artefacts[key] = compute()
+        return artefact
+    
+    def gray(
+        self,
+        frame: np.ndarray,
+        frame_index: int,
+        width: int = 0,
+        interpolation: int = DEFAULT_INTERPOLATION
+    ) -> np.ndarray:
+        """
+        Shared downscale_gray() of a frame.
+        
+        Args:
+            frame: BGR frame from OpenCV
+            frame_index: Index of the frame
+            width: Target width in pixels (0 = full size)
+            interpolation: OpenCV interpolation flag used for resizing
+            
+        Returns:
+            Grayscale image of shape (H, W)
+        """
+        return self.get(
+            ('gray', width, interpolation), frame_index,
+            lambda: downscale_gray(frame, width, interpolation)
+        )
+    
+    def clear(self) -> None:
+        """Drop the artefacts of the frames decided so far."""
+        self._artefacts.clear()
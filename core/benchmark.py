@@ -0,0 +1,671 @@
+# Frame_Ayirici/core/benchmark.py
+"""
+Benchmark suite for strategies, encoders and sinks.
+Generates synthetic test videos with cv2.VideoWriter, measures every
+registered strategy and output format, and writes a JSON report that
+can be compared against an earlier report to spot regressions.
+
+Usage:
+    python -m core.benchmark --output bench.json
+    python -m core.benchmark --sizes 720p --lengths 120 --compare bench.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from core.encoders import ENCODERS, create_encoder
+from core.frame_store import STORE_ENV
+from core.sinks import SINKS, encode_frame
+from core.video_processor import VideoProcessor
+from utils.cache import CACHE_ENV
+from utils.formatters import format_duration
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# Report format version; bump when metrics change meaning
+REPORT_VERSION = 1
+
+# Named resolutions for --sizes
+RESOLUTIONS: Dict[str, Tuple[int, int]] = {
+    '360p': (640, 360),
+    '720p': (1280, 720),
+    '1080p': (1920, 1080),
+}
+
+DEFAULT_SIZES = ('360p', '720p', '1080p')
+DEFAULT_LENGTHS = (60, 240)
+
+# Frame rate of the synthetic videos
+SYNTHETIC_FPS = 30.0
+
+# Frames per synthetic scene; scene mode has a cut to find every N frames
+SCENE_LENGTH = 30
+
+# Frames encoded per format when timing encoders
+ENCODE_SAMPLES = 8
+
+# Relative change treated as a regression by compare_reports()
+DEFAULT_TOLERANCE = 0.10
+
+# Metrics where a larger value is better; all others are costs
+HIGHER_IS_BETTER = ('decode_fps', 'fps')
+
+# Numeric fields that describe the case rather than its performance
+NOT_COMPARED = ('frames', 'files')
+
+
+class SilentSignals:
+    """SignalProtocol implementation that discards every update."""
+    
+    def emit_progress(self, value: int) -> None:
+        pass
+    
+    def emit_status(self, message: str) -> None:
+        pass
+
+
+def _log(message: str) -> None:
+    print(message, file=sys.stderr, flush=True)
+
+
+def peak_rss_mb() -> Optional[float]:
+    """
+    Return the peak resident set size of the current process.
+    
+    Returns:
+        Peak RSS in MiB, or None where the resource module is unavailable
+    """
+    if resource is None:
+        return None
+    
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return round(peak / divisor, 1)
+
+
+def directory_size(path: Path) -> int:
+    """Return the total size of all files below path."""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            total += os.path.getsize(os.path.join(root, name))
+    return total
+
+
+def synthetic_video(work_dir: Path, size: str, frame_count: int) -> Path:
+    """
+    Create (or reuse) a deterministic synthetic test video.
+    
+    Each scene is a random texture scrolling sideways with a moving box;
+    consecutive scenes differ strongly, so scene mode has cuts to find.
+    
+    Args:
+        work_dir: Directory for generated videos
+        size: Key of RESOLUTIONS
+        frame_count: Number of frames
+        
+    Returns:
+        Path to the video file
+        
+    Raises:
+        IOError: If the video cannot be written
+    """
+    width, height = RESOLUTIONS[size]
+    path = work_dir / "videos" / f"synthetic_{size}_{frame_count}.mp4"
+    if path.exists():
+        return path
+    
+    os.makedirs(path.parent, exist_ok=True)
+    temp_path = path.with_name(f"{path.stem}.part.mp4")
+    writer = cv2.VideoWriter(
+        str(temp_path), cv2.VideoWriter_fourcc(*'mp4v'), SYNTHETIC_FPS, (width, height)
+    )
+    if not writer.isOpened():
+        raise IOError(f"Test videosu oluşturulamadı: {path}")
+    
+    rng = np.random.default_rng(frame_count * 10000 + width)
+    box = max(height // 6, 8)
+    
+    try:
+        for index in range(frame_count):
+            if index % SCENE_LENGTH == 0:
+                # Coarse random texture upscaled (compressible but not flat)
+                # over a random tint, so every scene has its own histogram
+                texture = rng.integers(0, 64, (height // 8 + 1, width // 8 + 1, 3), dtype=np.uint8)
+                texture = cv2.resize(texture, (width, height), interpolation=cv2.INTER_LINEAR)
+                texture += rng.integers(0, 192, 3, dtype=np.uint8)
+            
+            offset = index % SCENE_LENGTH
+            frame = np.roll(texture, offset * 4, axis=1)
+            x = (offset * width // SCENE_LENGTH) % max(width - box, 1)
+            frame[height // 3:height // 3 + box, x:x + box] = 255
+            writer.write(frame)
+    finally:
+        writer.release()
+    
+    os.replace(temp_path, path)
+    return path
+
+
+def strategy_kwargs(mode: str, frame_count: int) -> Dict:
+    """
+    Return the strategy parameters used for a benchmark mode.
+    
+    Args:
+        mode: Key of VideoProcessor.STRATEGIES
+        frame_count: Number of frames in the video
+        
+    Returns:
+        Keyword arguments for the strategy
+    """
+    if mode == 'range':
+        # Middle half of the video
+        duration = frame_count / SYNTHETIC_FPS
+        return {
+            'start_time': format_duration(duration / 4),
+            'end_time': format_duration(duration * 3 / 4),
+        }
+    
+    if mode == 'ranges':
+        # Three separate tenths of the video, so the pass seeks between them
+        duration = frame_count / SYNTHETIC_FPS
+        return {
+            'ranges': [
+                (round(duration * start / 10, 3), round(duration * (start + 1) / 10, 3))
+                for start in (1, 4, 7)
+            ],
+        }
+    return {}
+
+
+def measure_video(
+    video_path: Path,
+    modes: Sequence[str],
+    formats: Sequence[str]
+) -> Tuple[Dict, List[Dict], List[Dict]]:
+    """
+    Time decoding, strategy analysis and encoding on one video, in one pass.
+    
+    Strategies are created without a video path, so persisted analysis
+    indexes are not used and every frame is analysed.
+    
+    Args:
+        video_path: Path to the video file
+        modes: Strategies to time
+        formats: Output formats to time
+        
+    Returns:
+        (decode record, analysis records, encode records)
+    """
+    cap = cv2.VideoCapture(str(video_path))
+    frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    
+    strategies = {}
+    for mode in modes:
+        strategy = VideoProcessor.STRATEGIES[mode](
+            fps=SYNTHETIC_FPS, total_frames=frame_count, **strategy_kwargs(mode, frame_count)
+        )
+        strategy.reset()
+        strategies[mode] = strategy
+    
+    pending: Dict[str, List] = {mode: [] for mode in modes}
+    analysis_time = dict.fromkeys(modes, 0.0)
+    samples = []
+    sample_step = max(frame_count // ENCODE_SAMPLES, 1)
+    decode_time = 0.0
+    decoded = 0
+    
+    def analyse(mode: str, frames: List[np.ndarray], first_index: int) -> None:
+        start = time.perf_counter()
+        strategies[mode].select_batch(frames, range(first_index, first_index + len(frames)))
+        analysis_time[mode] += time.perf_counter() - start
+    
+    try:
+        while True:
+            start = time.perf_counter()
+            ret, frame = cap.read()
+            if not ret:
+                break
+            decode_time += time.perf_counter() - start
+            
+            for mode, strategy in strategies.items():
+                batch = pending[mode]
+                batch.append(frame if strategy.needs_pixels else None)
+                if len(batch) >= strategy.batch_size:
+                    analyse(mode, batch, decoded - len(batch) + 1)
+                    batch.clear()
+            
+            if decoded % sample_step == 0 and len(samples) < ENCODE_SAMPLES:
+                samples.append(frame)
+            decoded += 1
+    finally:
+        cap.release()
+    
+    for mode, batch in pending.items():
+        if batch:
+            analyse(mode, batch, decoded - len(batch))
+    
+    decode = {
+        'frames': decoded,
+        'decode_fps': round(decoded / decode_time, 1) if decode_time > 0 else 0.0,
+    }
+    
+    analysis = [
+        {
+            'mode': mode,
+            'analysis_ms_per_frame': round(analysis_time[mode] * 1000 / max(decoded, 1), 4),
+        }
+        for mode in modes
+    ]
+    
+    encoding = []
+    for output_format in formats:
+        encoder = create_encoder(output_format)
+        encode_time = 0.0
+        encoded_bytes = 0
+        for frame in samples:
+            start = time.perf_counter()
+            data = encode_frame(frame, encoder)
+            encode_time += time.perf_counter() - start
+            encoded_bytes += len(data) if data else 0
+        
+        count = max(len(samples), 1)
+        encoding.append({
+            'format': output_format,
+            'encode_ms_per_frame': round(encode_time * 1000 / count, 3),
+            'bytes_per_frame': encoded_bytes // count,
+        })
+    
+    return decode, analysis, encoding
+
+
+def _run_case(
+    video_path: str,
+    output_dir: str,
+    mode: str,
+    output_format: str,
+    output_sink: str,
+    workers: int,
+    kwargs: Dict
+) -> Dict:
+    """
+    Run one full extraction. Executed in a fresh process so peak RSS and
+    caches belong to this case alone.
+    
+    Returns:
+        Wall time and peak RSS
+    """
+    processor = VideoProcessor(
+        video_path=video_path,
+        output_dir=output_dir,
+        mode=mode,
+        signals=SilentSignals(),
+        workers=workers,
+        output_format=output_format,
+        output_sink=output_sink,
+        **kwargs
+    )
+    
+    start = time.perf_counter()
+    processor.run()
+    wall_time = time.perf_counter() - start
+    
+    return {'wall_s': wall_time, 'peak_rss_mb': peak_rss_mb()}
+
+
+def run_case(
+    video_path: Path,
+    work_dir: Path,
+    mode: str,
+    output_format: str,
+    output_sink: str,
+    workers: int,
+    repeat: int,
+    kwargs: Dict
+) -> Dict:
+    """
+    Run a full extraction repeat times, each in a fresh process with an
+    empty output directory, an empty analysis cache and an empty frame
+    store.
+    
+    Returns:
+        Best wall time, files written, bytes written (including blobs
+        written to the frame store) and peak RSS
+    """
+    output_dir = work_dir / "output"
+    cache_root = work_dir / "cache"
+    store_root = cache_root / "frame_store"
+    context = multiprocessing.get_context("spawn")
+    
+    best: Optional[Dict] = None
+    for _ in range(max(repeat, 1)):
+        shutil.rmtree(output_dir, ignore_errors=True)
+        shutil.rmtree(cache_root, ignore_errors=True)
+        
+        # Spawned processes import utils.cache fresh and pick this up
+        os.environ[CACHE_ENV] = str(cache_root)
+        os.environ[STORE_ENV] = str(store_root)
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            result = executor.submit(
+                _run_case, str(video_path), str(output_dir),
+                mode, output_format, output_sink, workers, kwargs
+            ).result()
+        
+        if best is None or result['wall_s'] < best['wall_s']:
+            best = result
+    
+    files = [
+        name for name in os.listdir(output_dir)
+        if not name.startswith('.')
+    ] if output_dir.is_dir() else []
+    
+    return {
+        'wall_s': round(best['wall_s'], 4),
+        'files': len(files),
+        'bytes_written': directory_size(output_dir) + directory_size(store_root),
+        'peak_rss_mb': best['peak_rss_mb'],
+    }
+
+
+def run_benchmark(
+    work_dir: Path,
+    sizes: Sequence[str] = DEFAULT_SIZES,
+    lengths: Sequence[int] = DEFAULT_LENGTHS,
+    modes: Sequence[str] = tuple(VideoProcessor.STRATEGIES),
+    formats: Sequence[str] = tuple(ENCODERS),
+    sinks: Sequence[str] = ('directory',),
+    workers: int = VideoProcessor.WRITER_WORKERS,
+    repeat: int = 1
+) -> Dict:
+    """
+    Run the whole benchmark matrix.
+    
+    Args:
+        work_dir: Directory for synthetic videos and scratch output
+        sizes: Keys of RESOLUTIONS
+        lengths: Video lengths in frames
+        modes: Strategies to benchmark
+        formats: Output formats to benchmark
+        sinks: Output sinks to benchmark
+        workers: Encode/write pool size (0 = CPU count)
+        repeat: Full runs per case; the fastest one is reported
+        
+    Returns:
+        JSON-serializable report
+    """
+    previous_env = {name: os.environ.get(name) for name in (CACHE_ENV, STORE_ENV)}
+    report = {
+        'version': REPORT_VERSION,
+        'environment': {
+            'python': platform.python_version(),
+            'opencv': cv2.__version__,
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+        },
+        'config': {
+            'sizes': list(sizes),
+            'lengths': list(lengths),
+            'modes': list(modes),
+            'formats': list(formats),
+            'sinks': list(sinks),
+            'workers': workers,
+            'repeat': repeat,
+        },
+        'videos': [],
+        'analysis': [],
+        'encoding': [],
+        'runs': [],
+    }
+    
+    try:
+        for size in sizes:
+            for length in lengths:
+                video_path = synthetic_video(work_dir, size, length)
+                video = f"{size}_{length}"
+                _log(f"[{video}] decode/analiz/kodlama ölçülüyor...")
+                
+                decode, analysis, encoding = measure_video(video_path, modes, formats)
+                report['videos'].append({'video': video, **decode})
+                report['analysis'].extend({'video': video, **record} for record in analysis)
+                report['encoding'].extend({'video': video, **record} for record in encoding)
+                
+                for mode in modes:
+                    for output_sink in sinks:
+                        # The tensor sink stores raw pixels; the format does not apply
+                        case_formats = formats[:1] if output_sink == 'tensor' else formats
+                        for output_format in case_formats:
+                            _log(f"[{video}] {mode} / {output_format} / {output_sink}")
+                            result = run_case(
+                                video_path, work_dir, mode, output_format,
+                                output_sink, workers, repeat,
+                                strategy_kwargs(mode, decode['frames'])
+                            )
+                            result['fps'] = round(decode['frames'] / result['wall_s'], 1)
+                            report['runs'].append({
+                                'video': video,
+                                'mode': mode,
+                                'format': output_format,
+                                'sink': output_sink,
+                                **result,
+                            })
+    finally:
+        for name, value in previous_env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        shutil.rmtree(work_dir / "output", ignore_errors=True)
+        shutil.rmtree(work_dir / "cache", ignore_errors=True)
+    
+    return report
+
+
+def _record_key(section: str, record: Dict) -> Tuple:
+    """Identify a record across reports by its non-metric fields."""
+    fields = {
+        'videos': ('video',),
+        'analysis': ('video', 'mode'),
+        'encoding': ('video', 'format'),
+        'runs': ('video', 'mode', 'format', 'sink'),
+    }[section]
+    return tuple(record.get(field) for field in fields)
+
+
+def compare_reports(
+    baseline: Dict,
+    current: Dict,
+    tolerance: float = DEFAULT_TOLERANCE
+) -> List[str]:
+    """
+    List metrics that got worse by more than tolerance.
+    
+    Records are matched by video, mode, format and sink; records missing
+    from either report are ignored. Peak RSS and bytes are compared
+    like timings (lower is better).
+    
+    Args:
+        baseline: Earlier report
+        current: New report
+        tolerance: Allowed relative change (0.10 = 10%)
+        
+    Returns:
+        One line per regression
+    """
+    regressions = []
+    
+    for section in ('videos', 'analysis', 'encoding', 'runs'):
+        baseline_records = {
+            _record_key(section, record): record
+            for record in baseline.get(section, [])
+        }
+        
+        for record in current.get(section, []):
+            key = _record_key(section, record)
+            old = baseline_records.get(key)
+            if old is None:
+                continue
+            
+            for metric, new_value in record.items():
+                old_value = old.get(metric)
+                if (
+                    not isinstance(new_value, (int, float))
+                    or not isinstance(old_value, (int, float))
+                    or isinstance(new_value, bool)
+                    or old_value <= 0
+                    or metric in NOT_COMPARED
+                ):
+                    continue
+                
+                change = (new_value - old_value) / old_value
+                if metric in HIGHER_IS_BETTER:
+                    change = -change
+                
+                if change > tolerance:
+                    label = "/".join(str(part) for part in key)
+                    regressions.append(
+                        f"{section} {label} {metric}: {old_value} -> {new_value} "
+                        f"(%{change * 100:.1f} kötüleşme)"
+                    )
+    
+    return regressions
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Create the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="python -m core.benchmark",
+        description="Frame Extractor - strateji ve kodlayıcı performans ölçümü"
+    )
+    parser.add_argument(
+        "--sizes", default=",".join(DEFAULT_SIZES),
+        help=f"Çözünürlükler, virgülle ayrılmış ({', '.join(RESOLUTIONS)})"
+    )
+    parser.add_argument(
+        "--lengths", default=",".join(str(length) for length in DEFAULT_LENGTHS),
+        help="Video uzunlukları (frame), virgülle ayrılmış"
+    )
+    parser.add_argument(
+        "--modes", default=",".join(VideoProcessor.STRATEGIES),
+        help="Ölçülecek ayırma modları"
+    )
+    parser.add_argument(
+        "--formats", default=",".join(ENCODERS),
+        help="Ölçülecek çıktı formatları"
+    )
+    parser.add_argument(
+        "--sinks", default="directory",
+        help=f"Ölçülecek çıktı hedefleri ({', '.join(SINKS)})"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=VideoProcessor.WRITER_WORKERS,
+        help="Kodlama/yazma havuzu boyutu (0 = CPU sayısı)"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=1,
+        help="Her tam çalıştırmanın tekrar sayısı; en hızlısı raporlanır"
+    )
+    parser.add_argument(
+        "--work-dir", default="",
+        help="Test videoları ve geçici çıktı dizini (varsayılan: sistem geçici dizini)"
+    )
+    parser.add_argument("-o", "--output", default="", help="JSON raporunun yazılacağı dosya")
+    parser.add_argument(
+        "--compare", default="",
+        help="Önceki bir JSON raporu; kötüleşen ölçümler listelenir"
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=DEFAULT_TOLERANCE,
+        help="Gerileme sayılan göreli değişim (varsayılan: 0.10)"
+    )
+    return parser
+
+
+def _split(value: str, choices: Sequence[str], option: str) -> List[str]:
+    items = [item.strip() for item in value.split(",") if item.strip()]
+    unknown = [item for item in items if item not in choices]
+    if unknown:
+        raise ValueError(
+            f"{option} için bilinmeyen değer: {', '.join(unknown)} "
+            f"(geçerli: {', '.join(choices)})"
+        )
+    return items
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Benchmark entry point.
+    
+    Args:
+        argv: Argument list (default: sys.argv[1:])
+        
+    Returns:
+        Process exit code (1 = regressions against --compare)
+    """
+    args = build_parser().parse_args(argv)
+    
+    try:
+        sizes = _split(args.sizes, list(RESOLUTIONS), "--sizes")
+        modes = _split(args.modes, list(VideoProcessor.STRATEGIES), "--modes")
+        formats = _split(args.formats, list(ENCODERS), "--formats")
+        sinks = _split(args.sinks, list(SINKS), "--sinks")
+        lengths = [int(length) for length in args.lengths.split(",") if length.strip()]
+    except ValueError as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 2
+    
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    
+    if args.work_dir:
+        work_dir = Path(args.work_dir)
+        os.makedirs(work_dir, exist_ok=True)
+    else:
+        work_dir = Path(tempfile.gettempdir()) / "frame_extractor_benchmark"
+    
+    report = run_benchmark(
+        work_dir, sizes, lengths, modes, formats, sinks, args.workers, args.repeat
+    )
+    
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+        _log(f"Rapor yazıldı: {args.output}")
+    else:
+        print(text)
+    
+    if baseline is None:
+        return 0
+    
+    regressions = compare_reports(baseline, report, args.tolerance)
+    for line in regressions:
+        _log(f"GERİLEME {line}")
+    if not regressions:
+        _log("Gerileme bulunmadı.")
+    
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
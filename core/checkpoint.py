@@ -0,0 +1,139 @@
+# Frame_Ayirici/core/checkpoint.py
+"""
+Checkpoint journal for resumable extraction runs.
+A small JSON file in the output directory records how far a run got, so
+a rerun with identical parameters continues instead of starting over.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Callable, Dict, NamedTuple, Optional
+
+from utils.cache import file_cache_key
+
+
+class Checkpoint(NamedTuple):
+    """State of a run at its last committed frame."""
+    
+    # First frame index that was not yet processed
+    next_frame: int
+    
+    # Frames saved (and fully written) before next_frame
+    saved_count: int
+    
+    # ExtractionStrategy.get_state() at next_frame
+    strategy_state: Dict
+
+
+class CheckpointJournal:
+    """
+    Reads and writes the checkpoint of one output directory.
+    
+    A checkpoint only counts if it was written for the same video
+    contents and the same output-affecting parameters.
+    """
+    
+    # Journal file name inside the output directory
+    FILE_NAME = ".frame_extractor_checkpoint.json"
+    
+    # Seconds between periodic checkpoints
+    SAVE_INTERVAL = 10.0
+    
+    # Journal format version
+    VERSION = 1
+    
+    def __init__(
+        self,
+        output_path: Path,
+        params_hash: str,
+        interval: float = SAVE_INTERVAL,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize CheckpointJournal.
+        
+        Args:
+            output_path: Output directory holding the journal
+            params_hash: Hash from make_params_hash() identifying the run
+            interval: Minimum seconds between periodic checkpoints
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.path = output_path / self.FILE_NAME
+        self.params_hash = params_hash
+        self.interval = interval
+        self._clock = clock
+        self._last_save = clock()
+    
+    @staticmethod
+    def make_params_hash(video_path: str, **params) -> str:
+        """
+        Hash the video contents and the parameters that affect the output.
+        
+        Args:
+            video_path: Path to the video file
+            **params: JSON-serializable run parameters
+            
+        Returns:
+            Hex digest
+        """
+        return file_cache_key(video_path, json.dumps(params, sort_keys=True, default=str))
+    
+    def load(self) -> Optional[Checkpoint]:
+        """
+        Read the checkpoint left by an interrupted run with the same parameters.
+        
+        Returns:
+            Checkpoint instance, or None if there is nothing to resume
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            
+            if data.get("version") != self.VERSION or data.get("params_hash") != self.params_hash:
+                return None
+            
+            return Checkpoint(
+                int(data["next_frame"]),
+                int(data["saved_count"]),
+                dict(data.get("strategy_state") or {})
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
+    def due(self) -> bool:
+        """True once interval seconds passed since the last save."""
+        return self._clock() - self._last_save >= self.interval
+    
+    def save(self, next_frame: int, saved_count: int, strategy_state: Dict) -> None:
+        """
+        Atomically write a checkpoint.
+        Callers must make sure every saved frame is on disk first.
+        
+        Args:
+            next_frame: First frame index that was not yet processed
+            saved_count: Frames saved before next_frame
+            strategy_state: ExtractionStrategy.get_state()
+        """
+        data = {
+            "version": self.VERSION,
+            "params_hash": self.params_hash,
+            "next_frame": next_frame,
+            "saved_count": saved_count,
+            "strategy_state": strategy_state,
+        }
+        
+        temp_path = self.path.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(temp_path, self.path)
+        
+        self._last_save = self._clock()
+    
+    def clear(self) -> None:
+        """Remove the journal after a completed run."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
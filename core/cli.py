@@ -0,0 +1,485 @@
+# Frame_Ayirici/core/cli.py
+"""
+Headless command line interface.
+Runs VideoProcessor without Qt, for servers and batch pipelines.
+
+Usage:
+    python -m core video.mp4 --mode scene --output frames/
+    python -m core "videos/*.mp4" --jobs 4
+    python -m core video.mp4 --mode scene,interval --interval 5
+"""
+
+import argparse
+import cProfile
+import glob
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from core.encoders import ENCODERS
+from core.frame_store import MATERIALIZE_METHODS
+from core.perceptual_hash import HASHES
+from core.sinks import SINKS
+from core.timing import format_report
+from core.video_processor import VideoProcessor, ProcessingCancelled
+
+
+class ConsoleSignals:
+    """
+    SignalProtocol implementation that prints to stdout.
+    Lines are prefixed with the job name so concurrent jobs stay readable.
+    """
+    
+    # Print progress only every N percent
+    PROGRESS_STEP = 10
+    
+    def __init__(self, prefix: str = "", quiet: bool = False):
+        """
+        Initialize ConsoleSignals.
+        
+        Args:
+            prefix: Text printed before every line (e.g. video name)
+            quiet: Suppress progress and status output
+        """
+        self.prefix = prefix
+        self.quiet = quiet
+        self._last_step = -1
+    
+    def _print(self, message: str) -> None:
+        if not self.quiet:
+            print(f"[{self.prefix}] {message}" if self.prefix else message, flush=True)
+    
+    def emit_progress(self, value: int) -> None:
+        """Print progress at PROGRESS_STEP intervals."""
+        step = value // self.PROGRESS_STEP
+        if step != self._last_step:
+            self._last_step = step
+            self._print(f"%{value}")
+    
+    def emit_status(self, message: str) -> None:
+        """Print a status message."""
+        self._print(message)
+
+
+def expand_inputs(patterns: Sequence[str]) -> List[str]:
+    """
+    Expand file names and glob patterns into a list of video paths.
+    
+    Args:
+        patterns: File paths or glob patterns (** is supported)
+        
+    Returns:
+        Unique paths in the order they were given
+    """
+    paths: List[str] = []
+    seen = set()
+    
+    for pattern in patterns:
+        if os.path.isfile(pattern):
+            matches = [pattern]
+        else:
+            matches = sorted(glob.glob(pattern, recursive=True))
+        
+        for match in matches:
+            if os.path.isfile(match) and match not in seen:
+                seen.add(match)
+                paths.append(match)
+    
+    return paths
+
+
+def parse_modes(value: str) -> str:
+    """
+    Validate a mode or a comma-separated list of modes.
+    
+    Args:
+        value: Option value, e.g. 'scene' or 'scene,interval'
+        
+    Returns:
+        Normalized comma-separated mode list
+        
+    Raises:
+        argparse.ArgumentTypeError: If a mode is not recognized
+    """
+    modes = VideoProcessor.split_modes(value)
+    unknown = [mode for mode in modes if mode not in VideoProcessor.STRATEGIES]
+    if unknown:
+        available = ', '.join(sorted(VideoProcessor.STRATEGIES))
+        raise argparse.ArgumentTypeError(
+            f"geçersiz mod: {', '.join(unknown)} (seçenekler: {available})"
+        )
+    return ','.join(modes)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Create the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="python -m core",
+        description="Frame Extractor - videolardan arayüzsüz frame ayırma"
+    )
+    parser.add_argument(
+        "inputs", nargs="+",
+        help="Video dosyaları veya glob desenleri (ör. 'videos/*.mp4')"
+    )
+    parser.add_argument(
+        "-m", "--mode", default="all", type=parse_modes,
+        help="Ayırma modu: " + ", ".join(sorted(VideoProcessor.STRATEGIES)) + " (varsayılan: all). "
+             "Virgülle birden çok mod verilirse (ör. scene,interval) video bir kez decode "
+             "edilir ve her modun frame'leri kendi alt klasörüne kaydedilir"
+    )
+    parser.add_argument(
+        "-o", "--output", default="",
+        help="Çıktı kök dizini; her video için <video_adı>_frames alt klasörü açılır "
+             "(varsayılan: Masaüstü)"
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1,
+        help="Aynı anda işlenecek video sayısı (varsayılan: 1)"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=VideoProcessor.WRITER_WORKERS,
+        help="Video başına kodlama/yazma havuzu boyutu (0 = CPU sayısı)"
+    )
+    parser.add_argument(
+        "--writer-backend", default=VideoProcessor.WRITER_BACKEND,
+        choices=("thread", "process"),
+        help="Kodlama/yazma havuzu tipi"
+    )
+    parser.add_argument(
+        "--segments", type=int, default=VideoProcessor.SEGMENTS,
+        help="Tek videoyu keyframe hizalı segmentlere bölüp paralel işle "
+             "(1 = kapalı, 0 = CPU sayısı)"
+    )
+    parser.add_argument(
+        "-f", "--format", default=VideoProcessor.OUTPUT_FORMAT, choices=list(ENCODERS),
+        help="Çıktı formatı (varsayılan: jpg)"
+    )
+    parser.add_argument(
+        "--sink", default=VideoProcessor.OUTPUT_SINK, choices=list(SINKS),
+        help="Çıktı hedefi: her frame ayrı dosya (directory), tek zip arşivi (zip), "
+             "bellek eşlemeli NumPy dizisi (tensor) veya aynı frame'leri bir kez "
+             "saklayan içerik adresli depo (store)"
+    )
+    parser.add_argument(
+        "--store-dir", default="",
+        help="store hedefinin depo klasörü (varsayılan: önbellek klasörü veya "
+             "FRAME_EXTRACTOR_STORE_DIR)"
+    )
+    parser.add_argument(
+        "--materialize", default="none", choices=list(MATERIALIZE_METHODS),
+        help="store hedefinde frame dosyalarını da oluştur: hardlink, reflink "
+             "(yazarken kopyalanır) veya copy (varsayılan: none, sadece manifest)"
+    )
+    parser.add_argument(
+        "--quality", type=int,
+        help="jpg/webp kalitesi (0-100; webp için >100 kayıpsız)"
+    )
+    parser.add_argument(
+        "--compression", type=int,
+        help="png sıkıştırma seviyesi (0 = en hızlı, 9 = en küçük)"
+    )
+    parser.add_argument(
+        "--exact-count", action="store_true",
+        help="Frame sayısını başlıktan okumak yerine konteyneri tarayarak kesin hesapla"
+    )
+    parser.add_argument("--start", default="00:00:00", help="range modu başlangıcı (HH:MM:SS)")
+    parser.add_argument("--end", default="99:99:99", help="range modu bitişi (HH:MM:SS)")
+    parser.add_argument("--threshold", type=float, help="scene modu korelasyon eşiği (0.0-1.0)")
+    parser.add_argument(
+        "--interval", type=float,
+        help="interval modu: kaydedilen frame'ler arası saniye (varsayılan: 1)"
+    )
+    parser.add_argument(
+        "--target-fps", type=float,
+        help="interval modu: hedef frame hızı, ör. 2 = saniyede 2 frame (--interval yerine)"
+    )
+    parser.add_argument(
+        "--hash", choices=sorted(HASHES),
+        help="dedup modu: algısal özet (dhash hızlı, phash parlaklık değişimine dayanıklı)"
+    )
+    parser.add_argument(
+        "--max-distance", type=int,
+        help="dedup modu: kopya sayılan en büyük Hamming uzaklığı (64 bit üzerinden, varsayılan: 4)"
+    )
+    parser.add_argument(
+        "--motion-threshold", type=float,
+        help="motion modu: kayıt için biriken ortalama piksel farkı (gri seviye, varsayılan: 40)"
+    )
+    parser.add_argument(
+        "--ranges", default="",
+        help='ranges modu: virgülle ayrılmış aralıklar, ör. "00:00:05-00:00:12, 95.5-101"'
+    )
+    parser.add_argument(
+        "--ranges-file", default="",
+        help="ranges modu: aralık listesi dosyası (CSV: başlangıç,bitiş sütunları; .edl: CMX3600)"
+    )
+    parser.add_argument(
+        "--timings", action="store_true",
+        help="Aşama sürelerini (decode, analiz, kodlama, yazma) ölç ve raporla"
+    )
+    parser.add_argument(
+        "--timings-json", default="",
+        help="Aşama süresi raporunu JSON olarak bu dosyaya yaz (--timings içerir; "
+             "birden çok videoda dosya adına video adı eklenir)"
+    )
+    parser.add_argument(
+        "--profile", default="",
+        help="Frame döngüsünü cProfile ile profille ve istatistikleri bu dosyaya yaz "
+             "(birden çok videoda dosya adına video adı eklenir)"
+    )
+    parser.add_argument("-q", "--quiet", action="store_true", help="İlerleme çıktısını gizle")
+    return parser
+
+
+def build_strategy_kwargs(args: argparse.Namespace) -> Dict:
+    """
+    Translate CLI options into VideoProcessor keyword arguments.
+    
+    Args:
+        args: Parsed arguments
+        
+    Returns:
+        Keyword arguments for the strategy
+    """
+    kwargs: Dict = {}
+    modes = VideoProcessor.split_modes(args.mode)
+    
+    if "range" in modes:
+        kwargs["start_time"] = args.start
+        kwargs["end_time"] = args.end
+    
+    if args.threshold is not None:
+        kwargs["threshold"] = args.threshold
+    
+    if "interval" in modes:
+        if args.interval is not None:
+            kwargs["interval"] = args.interval
+        if args.target_fps is not None:
+            kwargs["target_fps"] = args.target_fps
+    
+    if "dedup" in modes:
+        if args.hash is not None:
+            kwargs["hash"] = args.hash
+        if args.max_distance is not None:
+            kwargs["max_distance"] = args.max_distance
+    
+    if "motion" in modes and args.motion_threshold is not None:
+        kwargs["motion_threshold"] = args.motion_threshold
+    
+    if "ranges" in modes:
+        if args.ranges:
+            kwargs["ranges"] = args.ranges
+        if args.ranges_file:
+            kwargs["ranges_file"] = os.path.abspath(args.ranges_file)
+    
+    return kwargs
+
+
+def build_encoder_options(args: argparse.Namespace) -> Dict:
+    """
+    Translate CLI options into encoder options.
+    
+    Args:
+        args: Parsed arguments
+        
+    Returns:
+        Keyword arguments for the output encoder
+    """
+    options: Dict = {}
+    
+    if args.quality is not None:
+        options["quality"] = args.quality
+    
+    if args.compression is not None:
+        options["compression"] = args.compression
+    
+    return options
+
+
+def build_sink_options(args: argparse.Namespace) -> Dict:
+    """
+    Translate CLI options into sink options.
+    
+    Args:
+        args: Parsed arguments
+        
+    Returns:
+        Keyword arguments for the output sink
+    """
+    options: Dict = {}
+    
+    if args.sink == 'store':
+        if args.store_dir:
+            options["store_dir"] = os.path.abspath(args.store_dir)
+        options["materialize"] = args.materialize
+    
+    return options
+
+
+def job_output_dir(video_path: str, output_root: str) -> str:
+    """
+    Return the output directory of one job.
+    
+    Args:
+        video_path: Path to the video file
+        output_root: Root given with --output (empty = VideoProcessor default)
+        
+    Returns:
+        Output directory for VideoProcessor
+    """
+    if not output_root:
+        return ""
+    return str(Path(output_root) / f"{Path(video_path).stem}_frames")
+
+
+def per_video_path(base_path: str, video_path: str, video_count: int) -> str:
+    """
+    Return the report file (--profile, --timings-json) of one job.
+    With several videos the video name is appended to the file name.
+    
+    Args:
+        base_path: Path given on the command line (empty = disabled)
+        video_path: Path to the video file
+        video_count: Number of videos in this invocation
+        
+    Returns:
+        Output file, or an empty string if the report is disabled
+    """
+    if not base_path or video_count <= 1:
+        return base_path
+    base = Path(base_path)
+    return str(base.with_name(f"{base.stem}_{Path(video_path).stem}{base.suffix}"))
+
+
+def run_job(
+    video_path: str,
+    output_dir: str,
+    mode: str,
+    quiet: bool,
+    workers: int,
+    writer_backend: str,
+    segments: int,
+    output_format: str,
+    encoder_options: Dict,
+    output_sink: str,
+    exact_frame_count: bool,
+    kwargs: Dict,
+    timings: bool = False,
+    timings_json: str = "",
+    profile_output: str = "",
+    sink_options: Optional[Dict] = None
+) -> str:
+    """
+    Run a single extraction. Module-level so it can run in a worker process.
+    
+    Returns:
+        VideoProcessor result message
+    """
+    profiler = cProfile.Profile() if profile_output else None
+    
+    processor = VideoProcessor(
+        video_path=video_path,
+        output_dir=output_dir,
+        mode=mode,
+        signals=ConsoleSignals(Path(video_path).name, quiet),
+        workers=workers,
+        writer_backend=writer_backend,
+        segments=segments,
+        output_format=output_format,
+        encoder_options=encoder_options,
+        output_sink=output_sink,
+        sink_options=sink_options,
+        exact_frame_count=exact_frame_count,
+        timings=timings or bool(timings_json),
+        profiler=profiler,
+        **kwargs
+    )
+    
+    try:
+        return processor.run()
+    finally:
+        report = processor.timing_report
+        if report is not None:
+            prefix = f"[{Path(video_path).name}] "
+            print("\n".join(prefix + line for line in format_report(report)), file=sys.stderr)
+            if timings_json:
+                with open(timings_json, "w", encoding="utf-8") as f:
+                    json.dump({'video': video_path, **report}, f, indent=2)
+        
+        if profiler is not None:
+            profiler.dump_stats(profile_output)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    CLI entry point.
+    
+    Args:
+        argv: Argument list (default: sys.argv[1:])
+        
+    Returns:
+        Process exit code (0 = every job succeeded)
+    """
+    args = build_parser().parse_args(argv)
+    videos = expand_inputs(args.inputs)
+    
+    if not videos:
+        print("Hata: Eşleşen video dosyası bulunamadı.", file=sys.stderr)
+        return 2
+    
+    kwargs = build_strategy_kwargs(args)
+    encoder_options = build_encoder_options(args)
+    sink_options = build_sink_options(args)
+    jobs = max(min(args.jobs, len(videos)), 1)
+    
+    # Share the cores between concurrent jobs instead of oversubscribing
+    workers = args.workers
+    if workers <= 0 and jobs > 1:
+        workers = max((os.cpu_count() or 1) // jobs, 1)
+    
+    failures: List[Tuple[str, str]] = []
+    
+    def job_args(video: str) -> tuple:
+        return (
+            video, job_output_dir(video, args.output), args.mode, args.quiet,
+            workers, args.writer_backend, args.segments,
+            args.format, encoder_options, args.sink, args.exact_count, kwargs,
+            args.timings, per_video_path(args.timings_json, video, len(videos)),
+            per_video_path(args.profile, video, len(videos)), sink_options
+        )
+    
+    try:
+        if jobs == 1:
+            for video in videos:
+                try:
+                    print(run_job(*job_args(video)), flush=True)
+                except (ProcessingCancelled, KeyboardInterrupt):
+                    raise
+                except Exception as e:
+                    failures.append((video, str(e)))
+        else:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                futures = {
+                    executor.submit(run_job, *job_args(video)): video
+                    for video in videos
+                }
+                try:
+                    for future in as_completed(futures):
+                        try:
+                            print(future.result(), flush=True)
+                        except Exception as e:
+                            failures.append((futures[future], str(e)))
+                except KeyboardInterrupt:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+    except (ProcessingCancelled, KeyboardInterrupt):
+        print("İşlem iptal edildi.", file=sys.stderr)
+        return 130
+    
+    for video, message in failures:
+        print(f"Hata [{video}]: {message}", file=sys.stderr)
+    
+    return 1 if failures else 0
@@ -0,0 +1,224 @@
+# Frame_Ayirici/core/encoders.py
+"""
+Output encoders for saved frames.
+Each encoder trades encode speed against file size; new formats can be
+added to the ENCODERS registry without modifying VideoProcessor.
+"""
+
+import io
+from abc import ABC, abstractmethod
+from typing import BinaryIO, Dict, List, Optional, Type
+
+import cv2
+import numpy as np
+
+
+class FrameEncoder(ABC):
+    """
+    Abstract base class for frame encoders.
+    
+    Encoders are plain picklable objects so they can be sent to
+    process-pool workers.
+    """
+    
+    # File extension including the dot
+    extension: str = ""
+    
+    # True if decoding the output gives back the exact frame
+    lossless: bool = False
+    
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Return the encoder name for display purposes."""
+        pass
+    
+    @abstractmethod
+    def encode(self, frame: np.ndarray) -> Optional[bytes]:
+        """
+        Encode a frame into an in-memory buffer.
+        
+        Args:
+            frame: BGR frame from OpenCV
+            
+        Returns:
+            Encoded bytes-like buffer, or None if encoding failed
+        """
+        pass
+    
+    def write(self, frame: np.ndarray, file: BinaryIO) -> bool:
+        """
+        Encode a frame straight into an open binary file.
+        Override when the format can be streamed without a full copy.
+        
+        Args:
+            frame: BGR frame from OpenCV
+            file: File opened in binary write mode
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        buffer = self.encode(frame)
+        if buffer is None:
+            return False
+        file.write(buffer)
+        return True
+
+
+class OpenCVEncoder(FrameEncoder):
+    """Base class for formats encoded with cv2.imencode."""
+    
+    def _params(self) -> List[int]:
+        """Return cv2.imencode parameters."""
+        return []
+    
+    def encode(self, frame: np.ndarray) -> Optional[bytes]:
+        is_success, buffer = cv2.imencode(self.extension, frame, self._params())
+        return buffer if is_success else None
+
+
+class JpegEncoder(OpenCVEncoder):
+    """
+    JPEG output. Lossy; quality 0-100 (higher = larger, slightly slower).
+    """
+    
+    extension = ".jpg"
+    DEFAULT_QUALITY = 95
+    
+    def __init__(self, quality: int = DEFAULT_QUALITY, **kwargs):
+        self.quality = int(quality)
+    
+    @property
+    def name(self) -> str:
+        return f"JPEG (q={self.quality})"
+    
+    def _params(self) -> List[int]:
+        return [cv2.IMWRITE_JPEG_QUALITY, self.quality]
+
+
+class WebpEncoder(OpenCVEncoder):
+    """
+    WebP output. Quality 1-100 is lossy and usually much smaller than JPEG;
+    quality above 100 switches to lossless mode (slow, compact).
+    """
+    
+    extension = ".webp"
+    DEFAULT_QUALITY = 90
+    
+    def __init__(self, quality: int = DEFAULT_QUALITY, **kwargs):
+        self.quality = int(quality)
+        self.lossless = self.quality > 100
+    
+    @property
+    def name(self) -> str:
+        return "WebP (kayıpsız)" if self.lossless else f"WebP (q={self.quality})"
+    
+    def _params(self) -> List[int]:
+        return [cv2.IMWRITE_WEBP_QUALITY, self.quality]
+
+
+class PngEncoder(OpenCVEncoder):
+    """
+    PNG output. Lossless; compression 0-9 (0 = fastest/largest,
+    9 = slowest/smallest).
+    """
+    
+    extension = ".png"
+    lossless = True
+    DEFAULT_COMPRESSION = 1
+    
+    def __init__(self, compression: int = DEFAULT_COMPRESSION, **kwargs):
+        self.compression = min(max(int(compression), 0), 9)
+    
+    @property
+    def name(self) -> str:
+        return f"PNG (sıkıştırma={self.compression})"
+    
+    def _params(self) -> List[int]:
+        return [cv2.IMWRITE_PNG_COMPRESSION, self.compression]
+
+
+class NpyEncoder(FrameEncoder):
+    """
+    Uncompressed NumPy .npy output (H x W x 3 uint8, BGR).
+    Zero encode cost; loadable with np.load(..., mmap_mode='r').
+    """
+    
+    extension = ".npy"
+    lossless = True
+    
+    def __init__(self, **kwargs):
+        pass
+    
+    @property
+    def name(self) -> str:
+        return "NumPy (.npy)"
+    
+    def encode(self, frame: np.ndarray) -> Optional[bytes]:
+        buffer = io.BytesIO()
+        np.lib.format.write_array(buffer, frame, allow_pickle=False)
+        return buffer.getvalue()
+    
+    def write(self, frame: np.ndarray, file: BinaryIO) -> bool:
+        # write_array streams real files with tofile(), without a bytes copy
+        np.lib.format.write_array(file, frame, allow_pickle=False)
+        return True
+
+
+class RawEncoder(FrameEncoder):
+    """
+    Headerless raw BGR24 output (.bgr): H x W x 3 bytes per frame.
+    Fastest possible path; width and height come from the source video.
+    """
+    
+    extension = ".bgr"
+    lossless = True
+    
+    def __init__(self, **kwargs):
+        pass
+    
+    @property
+    def name(self) -> str:
+        return "Ham BGR24"
+    
+    def encode(self, frame: np.ndarray) -> Optional[bytes]:
+        return np.ascontiguousarray(frame).tobytes()
+    
+    def write(self, frame: np.ndarray, file: BinaryIO) -> bool:
+        file.write(memoryview(np.ascontiguousarray(frame)))
+        return True
+
+
+# Encoder registry - maps format names to encoder classes
+ENCODERS: Dict[str, Type[FrameEncoder]] = {
+    'jpg': JpegEncoder,
+    'webp': WebpEncoder,
+    'png': PngEncoder,
+    'npy': NpyEncoder,
+    'raw': RawEncoder,
+}
+
+
+def create_encoder(output_format: str, **options) -> FrameEncoder:
+    """
+    Factory function to create an encoder.
+    
+    Args:
+        output_format: Key of ENCODERS ('jpg', 'webp', 'png', 'npy', 'raw')
+        **options: Encoder-specific options ('quality', 'compression')
+        
+    Returns:
+        FrameEncoder instance
+        
+    Raises:
+        ValueError: If the format is not recognized
+    """
+    encoder_class = ENCODERS.get(output_format)
+    
+    if encoder_class is None:
+        available = ', '.join(ENCODERS.keys())
+        raise ValueError(
+            f"Unknown output format: '{output_format}'. Available formats: {available}"
+        )
+    
+    return encoder_class(**options)
@@ -0,0 +1,203 @@
+# Frame_Ayirici/core/filmstrip.py
+"""
+Filmstrip thumbnails for the timeline.
+Decodes a few evenly spaced frames at thumbnail size and caches the
+JPEG bytes on disk, so reopening a video shows its filmstrip instantly.
+"""
+
+import bisect
+import os
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence
+
+import cv2
+
+from core.probe import probe_video
+from core.seeking import SeekPlanner, cached_keyframes
+from utils.cache import cache_dir, file_cache_key
+
+
+class Filmstrip:
+    """
+    Generates the thumbnails of one video.
+    
+    Thumbnails are identified by (key, index); the key changes whenever
+    the video file or the filmstrip settings change.
+    """
+    
+    # Cache subdirectory for thumbnail files
+    CACHE_NAME = "filmstrip"
+    
+    # Number of thumbnails across the timeline
+    DEFAULT_COUNT = 16
+    
+    # Thumbnail height in pixels (width follows the aspect ratio)
+    DEFAULT_HEIGHT = 54
+    
+    # JPEG quality of cached thumbnails
+    JPEG_QUALITY = 80
+    
+    def __init__(
+        self,
+        video_path: str,
+        count: int = DEFAULT_COUNT,
+        height: int = DEFAULT_HEIGHT
+    ):
+        """
+        Initialize Filmstrip.
+        
+        Args:
+            video_path: Path to the video file
+            count: Number of thumbnails
+            height: Thumbnail height in pixels
+            
+        Raises:
+            OSError: If the video file does not exist
+        """
+        self.video_path = video_path
+        self.count = max(int(count), 1)
+        self.height = max(int(height), 1)
+        self.key = file_cache_key(video_path, self.count, self.height)
+    
+    @staticmethod
+    def positions(frame_count: int, count: int, keyframes: Sequence[int] = ()) -> List[int]:
+        """
+        Pick the centre frame of each of count equal slices of the timeline.
+        A frame moves back to the preceding keyframe only when that keyframe
+        lies in the same slice (a single-frame decode); otherwise the exact
+        frame is decoded, so long GOPs never repeat a thumbnail.
+        
+        Args:
+            frame_count: Total number of frames
+            count: Number of thumbnails
+            keyframes: Sorted keyframe indices (empty = exact frames)
+            
+        Returns:
+            Frame index of every thumbnail
+        """
+        if frame_count <= 0:
+            return []
+        
+        positions = []
+        for index in range(count):
+            start = int(index * frame_count / count)
+            target = min(int((index + 0.5) * frame_count / count), frame_count - 1)
+            
+            if keyframes:
+                position = bisect.bisect_right(keyframes, target)
+                if position > 0 and keyframes[position - 1] >= start:
+                    target = keyframes[position - 1]
+            
+            positions.append(target)
+        
+        return positions
+    
+    @classmethod
+    def thumbnail_path(cls, key: str, index: int) -> Path:
+        """Return the cache file of one thumbnail."""
+        return cache_dir(cls.CACHE_NAME) / f"{key}_{index:03d}.jpg"
+    
+    @classmethod
+    def read_cached(cls, key: str, index: int) -> Optional[bytes]:
+        """
+        Read a cached thumbnail.
+        
+        Args:
+            key: Filmstrip key
+            index: Thumbnail index
+            
+        Returns:
+            JPEG bytes, or None if the thumbnail is not cached
+        """
+        try:
+            with open(cls.thumbnail_path(key, index), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+    
+    def _write_cached(self, index: int, data: bytes) -> None:
+        """Store a thumbnail in the disk cache."""
+        path = self.thumbnail_path(self.key, index)
+        temp_path = path.with_suffix(".part")
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    
+    def _encode(self, frame) -> Optional[bytes]:
+        """Shrink a frame to thumbnail height and encode it as JPEG."""
+        height, width = frame.shape[:2]
+        scaled_width = max(int(round(width * self.height / height)), 1)
+        
+        thumbnail = cv2.resize(
+            frame, (scaled_width, self.height), interpolation=cv2.INTER_AREA
+        )
+        is_success, buffer = cv2.imencode(
+            ".jpg", thumbnail, [cv2.IMWRITE_JPEG_QUALITY, self.JPEG_QUALITY]
+        )
+        return buffer.tobytes() if is_success else None
+    
+    def generate(
+        self,
+        on_thumbnail: Callable[[int, bytes], None],
+        is_cancelled: Callable[[], bool] = lambda: False
+    ) -> None:
+        """
+        Produce every thumbnail, reporting each one as soon as it exists.
+        Cached thumbnails are reported first, then the missing ones are
+        decoded in timeline order.
+        
+        Args:
+            on_thumbnail: Called with (index, JPEG bytes) per thumbnail
+            is_cancelled: Polled between thumbnails; stops early when True
+        """
+        missing = []
+        for index in range(self.count):
+            data = self.read_cached(self.key, index)
+            if data is None:
+                missing.append(index)
+            else:
+                on_thumbnail(index, data)
+        
+        if not missing or is_cancelled():
+            return
+        
+        metadata = probe_video(self.video_path)
+        
+        # Waiting for a full container scan would delay the first thumbnail;
+        # without a cached one the exact frames are decoded instead
+        keyframes = cached_keyframes(self.video_path) or ()
+        positions = self.positions(metadata.frame_count, self.count, keyframes)
+        if not positions:
+            return
+        
+        planner = SeekPlanner(keyframes, metadata.fps)
+        current = 0
+        
+        cap = cv2.VideoCapture(self.video_path)
+        if not cap.isOpened():
+            return
+        
+        try:
+            for index in missing:
+                if is_cancelled():
+                    return
+                
+                current = planner.advance(cap, current, positions[index])
+                ret, frame = cap.read()
+                if not ret:
+                    return
+                current += 1
+                
+                data = self._encode(frame)
+                if data is None:
+                    continue
+                
+                try:
+                    self._write_cached(index, data)
+                except OSError:
+                    # The disk cache is an optimization; still show the thumbnail
+                    pass
+                
+                on_thumbnail(index, data)
+        finally:
+            cap.release()
@@ -0,0 +1,85 @@
+# Frame_Ayirici/core/frame_buffer.py
+"""
+Reusable ring buffer of decoded frames for batch strategies.
+Frames are decoded straight into preallocated slots, so a batch run
+does not allocate a new array per frame.
+"""
+
+from typing import List
+
+import cv2
+import numpy as np
+
+
+class FrameRingBuffer:
+    """
+    Fixed-capacity buffer that VideoCapture decodes into.
+    
+    Slots are reused after clear(); callers that keep a frame beyond the
+    current batch must copy it.
+    """
+    
+    def __init__(self, capacity: int):
+        """
+        Initialize FrameRingBuffer.
+        
+        Args:
+            capacity: Number of frames per batch
+        """
+        self.capacity = max(int(capacity), 1)
+        self._frames: np.ndarray = None
+        self._indices: List[int] = []
+    
+    def __len__(self) -> int:
+        return len(self._indices)
+    
+    @property
+    def full(self) -> bool:
+        """True when the buffer holds capacity frames."""
+        return len(self._indices) >= self.capacity
+    
+    @property
+    def frames(self) -> np.ndarray:
+        """View of the buffered frames, shape (N, H, W, C)."""
+        if self._frames is None:
+            return np.empty((0,), dtype=np.uint8)
+        return self._frames[:len(self._indices)]
+    
+    @property
+    def indices(self) -> List[int]:
+        """Frame index of each buffered frame."""
+        return self._indices
+    
+    def read(self, cap: cv2.VideoCapture, frame_index: int) -> bool:
+        """
+        Decode the next frame from the capture into a free slot.
+        
+        Args:
+            cap: Opened VideoCapture
+            frame_index: Index of the frame being read
+            
+        Returns:
+            True if a frame was read, False at end of stream
+        """
+        if self._frames is None:
+            # Frame shape is only known after the first decode
+            ret, frame = cap.read()
+            if not ret:
+                return False
+            self._frames = np.empty((self.capacity,) + frame.shape, dtype=frame.dtype)
+            self._frames[0] = frame
+        else:
+            slot = self._frames[len(self._indices)]
+            ret, frame = cap.read(slot)
+            if not ret:
+                return False
+            if frame.ctypes.data != slot.ctypes.data:
+                # OpenCV reallocated (unexpected shape); keep the slot contract
+                slot[...] = frame
+        
+        self._indices.append(frame_index)
+        return True
+    
+    def clear(self) -> None:
+        """Mark every slot as free, keeping the allocation."""
+        self._indices = []
@@ -0,0 +1,184 @@
+# Frame_Ayirici/core/frame_store.py
+"""
+Content-addressed storage for encoded frames.
+Every distinct encoded frame is stored once under its SHA-256 digest in a
+store shared by all runs; a run records which blob each saved frame uses
+in a small manifest, from which core.materialize recreates a plain folder
+of frame files as hardlinks or reflinks to the blobs.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Dict, Tuple, Union
+
+from utils.cache import CACHE_ROOT
+
+
+# Environment variable overriding the default store location
+STORE_ENV = "FRAME_EXTRACTOR_STORE_DIR"
+
+# Store shared by every run that does not name its own
+DEFAULT_STORE_ROOT = Path(os.environ.get(STORE_ENV) or CACHE_ROOT / "frame_store")
+
+# Manifest file name inside the output directory
+MANIFEST_NAME = "manifest.json"
+
+MANIFEST_VERSION = 1
+
+# Ways to turn blobs into frame files. Hardlinked files share the blob's
+# data, so editing them edits the store; reflinks are copy-on-write.
+# Both fall back to a plain copy where the filesystem cannot link.
+MATERIALIZE_METHODS = ('none', 'hardlink', 'reflink', 'copy')
+
+# Linux ioctl that clones a file's extents (Btrfs, XFS, ...)
+FICLONE = 0x40049409
+
+
+def blob_path(store_root: Union[str, Path], digest: str, extension: str) -> Path:
+    """
+    Location of a blob in the store (objects/<2 hex digits>/<rest><ext>).
+    
+    Args:
+        store_root: Store directory
+        digest: SHA-256 hex digest of the encoded frame
+        extension: Output file extension including the dot
+        
+    Returns:
+        Blob path
+    """
+    return Path(store_root) / "objects" / digest[:2] / f"{digest[2:]}{extension}"
+
+
+def store_blob(data: bytes, store_root: Union[str, Path], extension: str) -> Tuple[str, bool]:
+    """
+    Store encoded bytes unless an identical blob already exists.
+    
+    Args:
+        data: Encoded frame
+        store_root: Store directory
+        extension: Output file extension including the dot
+        
+    Returns:
+        Tuple of (digest, True if the blob was written by this call)
+    """
+    digest = hashlib.sha256(data).hexdigest()
+    path = blob_path(store_root, digest, extension)
+    if path.exists():
+        return digest, False
+    
+    path.parent.mkdir(parents=True, exist_ok=True)
+    
+    # Written under a unique name and renamed, so concurrent writers of
+    # the same blob never expose a partial file
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(temp_path, "wb") as f:
+        f.write(data)
+    os.replace(temp_path, path)
+    return digest, True
+
+
+def _reflink(source: Path, target: Path) -> bool:
+    """Clone source into target; False if the platform or filesystem cannot."""
+    try:
+        import fcntl
+    except ImportError:
+        return False
+    
+    try:
+        with open(source, "rb") as src, open(target, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        return True
+    except OSError:
+        target.unlink(missing_ok=True)
+        return False
+
+
+def link_blob(source: Path, target: Path, method: str) -> str:
+    """
+    Create a frame file from a blob, replacing an existing file.
+    
+    Args:
+        source: Blob path
+        target: Frame file to create
+        method: 'hardlink', 'reflink' or 'copy'
+        
+    Returns:
+        Method actually used ('copy' after a failed link)
+    """
+    if target.exists() or target.is_symlink():
+        target.unlink()
+    
+    if method == 'hardlink':
+        try:
+            os.link(source, target)
+            return 'hardlink'
+        except OSError:
+            # Different filesystem, or no hardlink support
+            pass
+    elif method == 'reflink' and _reflink(source, target):
+        return 'reflink'
+    
+    shutil.copyfile(source, target)
+    return 'copy'
+
+
+def write_manifest(
+    output_path: Path,
+    store_root: Path,
+    extension: str,
+    entries: Dict[int, Tuple[int, str]]
+) -> Path:
+    """
+    Write the manifest of a run.
+    
+    Args:
+        output_path: Output directory
+        store_root: Store the blobs live in
+        extension: Output file extension including the dot
+        entries: Saved frame number -> (frame index, digest)
+        
+    Returns:
+        Manifest path
+    """
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'store': str(Path(store_root).resolve()),
+        'extension': extension,
+        'columns': ['number', 'frame_index', 'blob'],
+        'frames': [
+            [number, frame_index, digest]
+            for number, (frame_index, digest) in sorted(entries.items())
+        ],
+    }
+    
+    path = output_path / MANIFEST_NAME
+    temp_path = path.with_name(path.name + ".tmp")
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, separators=(",", ":"))
+    os.replace(temp_path, path)
+    return path
+
+
+def read_manifest(path: Union[str, Path]) -> Dict:
+    """
+    Read a manifest written by write_manifest().
+    
+    Args:
+        path: Manifest file
+        
+    Returns:
+        Manifest dict
+        
+    Raises:
+        ValueError: If the manifest version is not supported
+    """
+    with open(path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    
+    if manifest.get('version') != MANIFEST_VERSION:
+        raise ValueError(f"Unsupported manifest version: {manifest.get('version')}")
+    return manifest
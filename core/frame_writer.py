@@ -0,0 +1,238 @@
+# Frame_Ayirici/core/frame_writer.py
+"""
+Bounded encode/write stage for extracted frames.
+Moves frame encoding and disk writes off the decode loop so that
+VideoProcessor throughput is limited by decoding only.
+"""
+
+import os
+import threading
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor
+)
+from typing import Any, Callable, List, Optional
+
+import numpy as np
+
+from core.encoders import FrameEncoder
+
+
+def encode_and_write(frame: np.ndarray, save_path: str, encoder: FrameEncoder) -> bool:
+    """
+    Encode a frame with the given encoder and write it to disk.
+    Module-level so it can be pickled by a process pool.
+    
+    Args:
+        frame: OpenCV frame (numpy array)
+        save_path: Path where to save the frame
+        encoder: Output encoder (JPEG, PNG, WebP, ...)
+        
+    Returns:
+        True if save was successful, False otherwise
+    """
+    # Write to a temporary file first so an interrupted write never
+    # leaves a truncated image behind (handles Unicode paths correctly)
+    temp_path = save_path + ".part"
+    with open(temp_path, "wb") as f:
+        is_success = encoder.write(frame, f)
+    
+    if not is_success:
+        os.remove(temp_path)
+        return False
+    
+    os.replace(temp_path, save_path)
+    return True
+
+
+class FrameWriter:
+    """
+    Runs encode/write tasks on a thread or process pool.
+    
+    The number of frames waiting in the pool is bounded; submit() blocks
+    the producer when the limit is reached, so memory stays flat no matter
+    how much faster decoding is than encoding.
+    """
+    
+    # Supported pool backends
+    BACKENDS = ('thread', 'process')
+    
+    # Pending frames allowed per worker before submit() blocks
+    QUEUE_FACTOR = 2
+    
+    def __init__(
+        self,
+        encoder: FrameEncoder,
+        workers: int = 0,
+        backend: str = 'thread',
+        max_pending: int = 0
+    ):
+        """
+        Initialize FrameWriter.
+        
+        Args:
+            encoder: Output encoder used by every encode task
+            workers: Pool size (0 = CPU count)
+            backend: 'thread' or 'process'
+            max_pending: Maximum queued frames (0 = workers * QUEUE_FACTOR)
+            
+        Raises:
+            ValueError: If backend is not recognized
+        """
+        if backend not in self.BACKENDS:
+            available = ', '.join(self.BACKENDS)
+            raise ValueError(
+                f"Unknown writer backend: '{backend}'. Available backends: {available}"
+            )
+        
+        self.encoder = encoder
+        self.workers = workers if workers > 0 else (os.cpu_count() or 1)
+        self.backend = backend
+        self.max_pending = max_pending if max_pending > 0 else self.workers * self.QUEUE_FACTOR
+        
+        self._executor: Optional[Executor] = None
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._pending: List[Future] = []
+        self._failed_count = 0
+        self._error: Optional[BaseException] = None
+    
+    def __enter__(self) -> "FrameWriter":
+        self.start()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+    
+    @property
+    def failed_count(self) -> int:
+        """Number of frames the encoder refused to encode."""
+        return self._failed_count
+    
+    def start(self) -> None:
+        """Create the underlying pool."""
+        if self._executor is not None:
+            return
+        
+        if self.backend == 'process':
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers,
+                thread_name_prefix="frame-writer"
+            )
+    
+    def submit(self, frame: np.ndarray, save_path: str) -> None:
+        """
+        Queue a frame for encoding and writing.
+        Blocks while max_pending frames are already in flight.
+        
+        Args:
+            frame: OpenCV frame (numpy array), must not be modified afterwards
+            save_path: Destination file path
+            
+        Raises:
+            Exception: Re-raises the first error raised by a worker
+        """
+        self.submit_call(encode_and_write, frame, save_path, self.encoder)
+    
+    def submit_call(
+        self,
+        fn: Callable[..., Any],
+        *args,
+        callback: Optional[Callable[[Any], None]] = None
+    ) -> None:
+        """
+        Queue an arbitrary task with the same backpressure as submit().
+        A falsy result counts as a failed frame; a truthy result is passed
+        to callback in the producer's process.
+        
+        Args:
+            fn: Picklable callable run in the pool
+            *args: Arguments for fn
+            callback: Called with the result of fn (optional)
+            
+        Raises:
+            Exception: Re-raises the first error raised by a worker
+        """
+        self._raise_pending_error()
+        self.start()
+        
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        
+        with self._lock:
+            self._pending.append(future)
+        future.add_done_callback(lambda done: self._on_done(done, callback))
+    
+    def _on_done(
+        self,
+        future: Future,
+        callback: Optional[Callable[[Any], None]] = None
+    ) -> None:
+        """Release the queue slot and record the outcome of a task."""
+        try:
+            if future.cancelled():
+                return
+            
+            error = future.exception()
+            if error is None and future.result() and callback is not None:
+                try:
+                    callback(future.result())
+                except BaseException as e:
+                    error = e
+            
+            with self._lock:
+                if error is not None:
+                    if self._error is None:
+                        self._error = error
+                elif not future.result():
+                    self._failed_count += 1
+        finally:
+            with self._lock:
+                self._pending.remove(future)
+                self._idle.notify_all()
+            self._slots.release()
+    
+    def _raise_pending_error(self) -> None:
+        """Propagate a worker error to the producer thread."""
+        if self._error is not None:
+            raise self._error
+    
+    def cancel(self) -> None:
+        """
+        Drop queued frames that have not started yet.
+        Frames already being encoded or written are allowed to finish.
+        """
+        with self._lock:
+            pending = list(self._pending)
+        
+        for future in pending:
+            future.cancel()
+    
+    def flush(self) -> None:
+        """Wait until every queued frame has been written."""
+        # Waits for done callbacks too, not just for the results
+        with self._lock:
+            while self._pending:
+                self._idle.wait()
+        
+        self._raise_pending_error()
+    
+    def close(self) -> None:
+        """Flush outstanding frames and shut the pool down."""
+        if self._executor is None:
+            return
+        
+        try:
+            self.flush()
+        finally:
+            self._executor.shutdown(wait=True)
+            self._executor = None
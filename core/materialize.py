@@ -0,0 +1,94 @@
+# Frame_Ayirici/core/materialize.py
+"""
+Recreate a plain folder of frame files from a frame store manifest.
+Files are hardlinks or reflinks to the store's blobs, so a folder of any
+size appears almost instantly and takes no extra space.
+
+Usage:
+    python -m core.materialize frames/manifest.json plain_folder/ --method reflink
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Union
+
+from core.frame_store import (
+    MANIFEST_NAME,
+    MATERIALIZE_METHODS,
+    blob_path,
+    link_blob,
+    read_manifest
+)
+from core.sinks import DirectorySink
+
+
+def materialize(
+    manifest_path: Union[str, Path],
+    target_dir: Union[str, Path],
+    method: str = 'hardlink'
+) -> Dict[str, int]:
+    """
+    Create a plain folder of frame files from a manifest, named like the
+    directory sink's output (frame_000001.jpg, ...).
+    
+    Args:
+        manifest_path: Manifest file
+        target_dir: Folder to create the frame files in
+        method: 'hardlink', 'reflink' or 'copy'
+        
+    Returns:
+        Number of files per method actually used
+    """
+    manifest = read_manifest(manifest_path)
+    store_root, extension = manifest['store'], manifest['extension']
+    
+    target = Path(target_dir)
+    target.mkdir(parents=True, exist_ok=True)
+    
+    counts: Dict[str, int] = {}
+    for number, _frame_index, digest in manifest['frames']:
+        used = link_blob(
+            blob_path(store_root, digest, extension),
+            target / DirectorySink.frame_name(number, extension),
+            method
+        )
+        counts[used] = counts.get(used, 0) + 1
+    return counts
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Materialize a manifest from the command line.
+    
+    Args:
+        argv: Argument list (default: sys.argv[1:])
+        
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m core.materialize",
+        description="İçerik adresli frame deposundaki bir manifestten düz frame klasörü oluşturur."
+    )
+    parser.add_argument("manifest", help=f"{MANIFEST_NAME} dosyası")
+    parser.add_argument("target", help="Frame dosyalarının oluşturulacağı klasör")
+    parser.add_argument(
+        "--method", default="hardlink", choices=[m for m in MATERIALIZE_METHODS if m != 'none'],
+        help="hardlink (varsayılan), reflink (yazarken kopyalanır) veya copy"
+    )
+    args = parser.parse_args(argv)
+    
+    try:
+        counts = materialize(args.manifest, args.target, args.method)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 1
+    
+    summary = ", ".join(f"{method}: {count}" for method, count in sorted(counts.items()))
+    print(f"'{args.target}' klasörü oluşturuldu ({summary or '0 frame'}).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
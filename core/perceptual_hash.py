@@ -0,0 +1,153 @@
+# Frame_Ayirici/core/perceptual_hash.py
+"""
+Perceptual hashes of frames and a BK-tree index for near-duplicate lookup.
+Hashes are 64-bit integers (for the default 8x8 hash size) compared by
+Hamming distance; similar-looking frames differ in only a few bits.
+"""
+
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+
+def _bits_to_int(bits: np.ndarray) -> int:
+    """Pack a boolean array into an integer, first element most significant."""
+    return int.from_bytes(np.packbits(bits.ravel()).tobytes(), 'big')
+
+
+def dhash(gray: np.ndarray, hash_size: int = 8) -> int:
+    """
+    Difference hash: one bit per horizontally adjacent pixel pair of the
+    image shrunk to (hash_size + 1) x hash_size.
+    
+    Args:
+        gray: Grayscale image
+        hash_size: Bits per row and column (8 = 64-bit hash)
+        
+    Returns:
+        Hash as an integer
+    """
+    small = cv2.resize(gray, (hash_size + 1, hash_size), interpolation=cv2.INTER_AREA)
+    return _bits_to_int(small[:, 1:] > small[:, :-1])
+
+
+def phash(gray: np.ndarray, hash_size: int = 8) -> int:
+    """
+    DCT hash: one bit per low-frequency DCT coefficient of the image
+    shrunk to 4 * hash_size square, set when above the median.
+    More robust to brightness and compression changes than dhash().
+    
+    Args:
+        gray: Grayscale image
+        hash_size: Bits per row and column (8 = 64-bit hash)
+        
+    Returns:
+        Hash as an integer
+    """
+    size = hash_size * 4
+    small = cv2.resize(gray, (size, size), interpolation=cv2.INTER_AREA)
+    low = cv2.dct(np.float32(small))[:hash_size, :hash_size]
+    
+    # The DC term only reflects overall brightness
+    median = np.median(low.ravel()[1:])
+    return _bits_to_int(low > median)
+
+
+# Hash functions by name
+HASHES: Dict[str, Callable[[np.ndarray, int], int]] = {
+    'dhash': dhash,
+    'phash': phash,
+}
+
+
+def hamming(first: int, second: int) -> int:
+    """Number of differing bits between two hashes."""
+    return (first ^ second).bit_count()
+
+
+class BKTree:
+    """
+    Burkhard-Keller tree over Hamming distance.
+    
+    Each child edge is labelled with its distance to the parent, so a
+    search within radius r only descends edges labelled d - r .. d + r
+    and visits a small part of the index.
+    """
+    
+    def __init__(self, hashes: Iterable[int] = ()):
+        """
+        Initialize BKTree.
+        
+        Args:
+            hashes: Initial hashes
+        """
+        # Node: (hash, {distance: child node})
+        self._root: Optional[Tuple[int, Dict[int, tuple]]] = None
+        self._size = 0
+        for value in hashes:
+            self.add(value)
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def add(self, value: int) -> None:
+        """
+        Insert a hash (duplicates are stored once).
+        
+        Args:
+            value: Hash to insert
+        """
+        if self._root is None:
+            self._root = (value, {})
+            self._size = 1
+            return
+        
+        node = self._root
+        while True:
+            distance = hamming(value, node[0])
+            if distance == 0:
+                return
+            
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = (value, {})
+                self._size += 1
+                return
+            node = child
+    
+    def find(self, value: int, max_distance: int) -> Optional[int]:
+        """
+        Find a stored hash within a Hamming distance.
+        
+        Args:
+            value: Hash to look up
+            max_distance: Largest accepted distance
+            
+        Returns:
+            A stored hash within max_distance, or None
+        """
+        if self._root is None:
+            return None
+        
+        stack = [self._root]
+        while stack:
+            stored, children = stack.pop()
+            distance = hamming(value, stored)
+            if distance <= max_distance:
+                return stored
+            
+            for edge, child in children.items():
+                if distance - max_distance <= edge <= distance + max_distance:
+                    stack.append(child)
+        return None
+    
+    def values(self) -> List[int]:
+        """All stored hashes, parents first so re-adding them rebuilds the same tree."""
+        result = []
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            stored, children = stack.pop()
+            result.append(stored)
+            stack.extend(children.values())
+        return result
@@ -0,0 +1,107 @@
+# Frame_Ayirici/core/probe.py
+"""
+Cached video metadata probe.
+Shared by the UI and VideoProcessor so a file's properties are read
+(and validated) once per file version instead of once per caller.
+"""
+
+import os
+from functools import lru_cache
+from typing import NamedTuple
+
+import cv2
+
+from core.seeking import scan_container
+
+
+# FPS used when the container reports a missing or implausible value
+DEFAULT_FPS = 30.0
+
+# Largest FPS accepted as genuine
+MAX_FPS = 1000.0
+
+
+class VideoMetadata(NamedTuple):
+    """Immutable properties of a video file."""
+    
+    width: int
+    height: int
+    fps: float
+    frame_count: int
+    file_size: int
+    
+    # True if frame_count comes from a container scan rather than the header
+    exact_frame_count: bool
+    
+    @property
+    def duration(self) -> float:
+        """Duration in seconds."""
+        return self.frame_count / self.fps if self.fps > 0 else 0.0
+
+
+def validate_fps(fps: float) -> float:
+    """
+    Replace invalid FPS values reported by some videos.
+    
+    Args:
+        fps: Value read from CAP_PROP_FPS
+        
+    Returns:
+        fps, or DEFAULT_FPS if it is missing or out of range
+    """
+    if fps is None or fps <= 0 or fps > MAX_FPS:
+        return DEFAULT_FPS
+    return fps
+
+
+@lru_cache(maxsize=32)
+def _probe(video_path: str, size: int, mtime: float, exact_frame_count: bool) -> VideoMetadata:
+    """
+    Read video properties. Cached per (path, size, mtime).
+    
+    Raises:
+        IOError: If the video cannot be opened
+    """
+    cap = cv2.VideoCapture(video_path)
+    
+    if not cap.isOpened():
+        raise IOError(
+            "Video dosyası açılamadı. Dosya yolu veya format bozuk olabilir."
+        )
+    
+    try:
+        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        fps = validate_fps(cap.get(cv2.CAP_PROP_FPS))
+        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    finally:
+        cap.release()
+    
+    exact = False
+    if exact_frame_count:
+        # CAP_PROP_FRAME_COUNT is estimated from duration x fps and is often
+        # off; counting packets is exact and still decodes nothing
+        scanned = scan_container(video_path).frame_count
+        if scanned > 0:
+            frame_count, exact = scanned, True
+    
+    return VideoMetadata(width, height, fps, max(frame_count, 0), size, exact)
+
+
+def probe_video(video_path: str, exact_frame_count: bool = False) -> VideoMetadata:
+    """
+    Return the metadata of a video file, reusing earlier probes of the
+    same file version.
+    
+    Args:
+        video_path: Path to the video file
+        exact_frame_count: Count frames with a demux-only container scan
+        
+    Returns:
+        VideoMetadata instance
+        
+    Raises:
+        IOError: If the file is missing or cannot be opened
+    """
+    stat = os.stat(video_path)
+    return _probe(video_path, stat.st_size, stat.st_mtime, exact_frame_count)
@@ -0,0 +1,117 @@
+# Frame_Ayirici/core/progress.py
+"""
+Rate-limited progress reporting.
+Coalesces per-frame progress into a few signal emissions per second
+so cross-thread UI updates do not slow down extraction.
+"""
+
+import time
+from typing import Callable, Optional
+
+from core.protocols import SignalProtocol
+from core.timing import StageTimings
+from utils.formatters import format_duration
+
+
+class ProgressReporter:
+    """
+    Throttles progress and status updates sent through a SignalProtocol.
+    
+    Progress is emitted only when the integer percentage changes.
+    Status messages (with frames/sec and ETA) are emitted at most
+    max_hz times per second.
+    """
+    
+    # Maximum status updates per second
+    MAX_HZ = 4.0
+    
+    def __init__(
+        self,
+        signals: SignalProtocol,
+        total: int,
+        max_hz: float = MAX_HZ,
+        clock: Callable[[], float] = time.monotonic,
+        initial: int = 0,
+        timings: Optional[StageTimings] = None
+    ):
+        """
+        Initialize ProgressReporter.
+        
+        Args:
+            signals: Object implementing SignalProtocol
+            total: Number of frames to process (0 = unknown)
+            max_hz: Maximum status updates per second
+            clock: Monotonic clock function (seconds)
+            initial: Frames already processed before this run (resumed runs)
+            timings: Stage timings appended to status messages (optional)
+        """
+        self.signals = signals
+        self.total = total
+        self.min_interval = 1.0 / max_hz if max_hz > 0 else 0.0
+        self._clock = clock
+        
+        self._start = clock()
+        self._last_status = self._start
+        self._last_percent = -1
+        self._initial = initial
+        self._processed = initial
+        self._timings = timings
+    
+    @property
+    def processed(self) -> int:
+        """Number of frames reported so far."""
+        return self._processed
+    
+    @property
+    def fps(self) -> float:
+        """Average processing speed in frames per second."""
+        elapsed = self._clock() - self._start
+        return (self._processed - self._initial) / elapsed if elapsed > 0 else 0.0
+    
+    @property
+    def eta(self) -> Optional[float]:
+        """Estimated remaining seconds, or None if unknown."""
+        fps = self.fps
+        if self.total <= 0 or fps <= 0:
+            return None
+        return max(self.total - self._processed, 0) / fps
+    
+    def update(self, processed: int) -> None:
+        """
+        Report the number of processed frames.
+        
+        Args:
+            processed: Frames processed so far
+        """
+        self._processed = processed
+        
+        if self.total <= 0:
+            return
+        
+        percent = min(int(processed * 100 / self.total), 100)
+        if percent != self._last_percent:
+            self._last_percent = percent
+            self.signals.emit_progress(percent)
+        
+        now = self._clock()
+        if now - self._last_status >= self.min_interval:
+            self._last_status = now
+            self.signals.emit_status(self.format_status())
+    
+    def format_status(self) -> str:
+        """
+        Build the status line shown while processing.
+        
+        Returns:
+            Status message with frame counter, speed and ETA
+        """
+        message = f"İşleniyor... Frame {self._processed}/{self.total} • {self.fps:.1f} fps"
+        
+        eta = self.eta
+        if eta is not None:
+            message += f" • Kalan: {format_duration(eta)}"
+        
+        if self._timings is not None:
+            message += f" • {self._timings.summary()}"
+        
+        return message
@@ -4,7 +4,8 @@ Protocol definitions for Dependency Inversion Principle.
 Abstracts signal interfaces to decouple VideoProcessor from Qt-specific implementations.
 """
 
-from typing import Protocol, runtime_checkable
+import threading
+from typing import Callable, Optional, Protocol, runtime_checkable
 
 
 @runtime_checkable
@@ -25,10 +26,74 @@ class SignalProtocol(Protocol):
         ...
 
 
+@runtime_checkable
+class CancellationProtocol(Protocol):
+    """
+    Protocol for cooperative cancellation.
+    VideoProcessor polls is_cancelled() once per frame and stops cleanly
+    (draining in-flight writes, releasing the capture) when it returns True.
+    """
+    
+    def is_cancelled(self) -> bool:
+        """Return True if processing should stop."""
+        ...
+
+
+class ProcessingCancelled(Exception):
+    """Raised by VideoProcessor.run when the cancellation token is set."""
+    pass
+
+
+class CancellationToken:
+    """
+    Thread-safe cancellation token for callers without a Qt thread.
+    """
+    
+    def __init__(self, event=None):
+        """
+        Initialize token.
+        
+        Args:
+            event: Optional event to share (e.g. a multiprocessing.Event
+                for worker processes); a threading.Event by default
+        """
+        self._event = event if event is not None else threading.Event()
+    
+    def cancel(self) -> None:
+        """Request cancellation."""
+        self._event.set()
+    
+    def is_cancelled(self) -> bool:
+        """Return True once cancel() has been called."""
+        return self._event.is_set()
+
+
+class InterruptionAdapter:
+    """
+    Adapter that exposes a Qt interruption check through CancellationProtocol.
+    Typically wraps QThread.isInterruptionRequested.
+    """
+    
+    def __init__(self, interruption_check: Callable[[], bool]):
+        """
+        Initialize adapter with an interruption check.
+        
+        Args:
+            interruption_check: Callable returning True when interruption was requested
+        """
+        self._interruption_check = interruption_check
+    
+    def is_cancelled(self) -> bool:
+        """Return the result of the wrapped interruption check."""
+        return bool(self._interruption_check())
+
+
 class SignalAdapter:
     """
     Adapter class to bridge Qt signals with the SignalProtocol.
     This allows VideoProcessor to remain decoupled from Qt.
+    Repeated progress values are dropped to avoid redundant
+    cross-thread signal deliveries.
     """
     
     def __init__(self, progress_signal, status_signal):
@@ -41,9 +106,13 @@ class SignalAdapter:
         """
         self._progress_signal = progress_signal
         self._status_signal = status_signal
+        self._last_progress: Optional[int] = None
     
     def emit_progress(self, value: int) -> None:
-        """Emit progress update through Qt signal."""
+        """Emit progress update through Qt signal if the value changed."""
+        if value == self._last_progress:
+            return
+        self._last_progress = value
         self._progress_signal.emit(value)
     
     def emit_status(self, message: str) -> None:
@@ -0,0 +1,229 @@
+# Frame_Ayirici/core/ranges.py
+"""
+Frame range lists for multi-range mode.
+Ranges are given inline ("00:00:05-00:00:12, 95.5-101") or read from the
+CSV and CMX3600 EDL files editors export, then sorted and merged into
+disjoint [start, end) frame intervals.
+"""
+
+import csv
+import re
+from pathlib import Path
+from typing import Iterable, List, Sequence, Tuple, Union
+
+# Half-open [start_frame, end_frame) interval
+FrameRange = Tuple[int, int]
+
+# HH:MM:SS:FF timecode (';' before the frames marks drop-frame)
+TIMECODE_PATTERN = re.compile(r"^(\d+):(\d{2}):(\d{2})[:;](\d{2})$")
+
+# Timecodes anywhere in an EDL event line
+EDL_TIMECODE_PATTERN = re.compile(r"\b\d{2}:\d{2}:\d{2}[:;]\d{2}\b")
+
+# File extensions read as EDL; everything else is read as CSV
+EDL_EXTENSIONS = ('.edl',)
+
+
+def parse_time(text: str, fps: float) -> int:
+    """
+    Convert a time to a frame index.
+    
+    Accepts seconds ("12.5"), [HH:]MM:SS with an optional fraction
+    ("00:01:02.5") and HH:MM:SS:FF timecodes. Timecode frames count at
+    the nominal rate (30 for 29.97 fps); drop-frame is not compensated.
+    
+    Args:
+        text: Time string
+        fps: Frames per second
+        
+    Returns:
+        Frame index
+        
+    Raises:
+        ValueError: If the time cannot be parsed
+    """
+    value = text.strip()
+    
+    match = TIMECODE_PATTERN.match(value)
+    if match:
+        hours, minutes, seconds, frames = map(int, match.groups())
+        nominal_fps = max(int(round(fps)), 1)
+        return ((hours * 60 + minutes) * 60 + seconds) * nominal_fps + frames
+    
+    parts = value.split(':')
+    seconds = 0.0
+    try:
+        if not value or len(parts) > 3:
+            raise ValueError
+        for part in parts:
+            seconds = seconds * 60 + float(part)
+    except ValueError:
+        raise ValueError(f"Invalid time: '{text}'") from None
+    
+    if seconds < 0:
+        raise ValueError(f"Invalid time: '{text}'")
+    
+    # Rounded first so fractional seconds such as 2.3 * 30 do not
+    # land one frame early through float error
+    return int(round(seconds * fps, 6))
+
+
+def parse_range(start: str, end: str, fps: float) -> FrameRange:
+    """
+    Convert a start/end time pair to a frame range.
+    
+    Args:
+        start: Start time (see parse_time)
+        end: End time, exclusive
+        fps: Frames per second
+        
+    Returns:
+        Tuple of (start_frame, end_frame)
+    """
+    return parse_time(start, fps), parse_time(end, fps)
+
+
+def parse_range_spec(spec: str, fps: float) -> List[FrameRange]:
+    """
+    Parse an inline range list such as "00:00:05-00:00:12, 95.5-101".
+    
+    Args:
+        spec: Comma or newline separated "start-end" pairs
+        fps: Frames per second
+        
+    Returns:
+        Frame ranges in the given order
+        
+    Raises:
+        ValueError: If an entry is not a "start-end" pair
+    """
+    ranges = []
+    for entry in re.split(r"[,\n]", spec):
+        entry = entry.strip()
+        if not entry:
+            continue
+        
+        bounds = entry.split('-')
+        if len(bounds) != 2:
+            raise ValueError(f"Invalid range: '{entry}'. Expected start-end")
+        ranges.append(parse_range(bounds[0], bounds[1], fps))
+    return ranges
+
+
+def read_csv_ranges(path: Union[str, Path], fps: float) -> List[FrameRange]:
+    """
+    Read ranges from a CSV file with start and end in the first two columns.
+    
+    A header row, blank lines and lines starting with '#' are skipped;
+    further columns (labels, notes) are ignored.
+    
+    Args:
+        path: CSV file
+        fps: Frames per second
+        
+    Returns:
+        Frame ranges in file order
+        
+    Raises:
+        ValueError: If a row cannot be parsed
+    """
+    ranges = []
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        # Comment and blank lines confuse the sniffer into its ',' fallback
+        sample = "".join(
+            line for line in f.read(4096).splitlines(keepends=True)
+            if line.strip() and not line.lstrip().startswith('#')
+        )
+        f.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+        except csv.Error:
+            dialect = csv.excel
+        
+        first_row = True
+        for line_number, row in enumerate(csv.reader(f, dialect), start=1):
+            if not row or not row[0].strip() or row[0].lstrip().startswith('#'):
+                continue
+            
+            try:
+                if len(row) < 2:
+                    raise ValueError("expected start and end columns")
+                ranges.append(parse_range(row[0], row[1], fps))
+            except ValueError as e:
+                if first_row:
+                    # Header row
+                    first_row = False
+                    continue
+                raise ValueError(f"{path}:{line_number}: {e}") from None
+            first_row = False
+    return ranges
+
+
+def read_edl_ranges(path: Union[str, Path], fps: float) -> List[FrameRange]:
+    """
+    Read the source in/out points of every event in a CMX3600 EDL.
+    
+    Source timecodes are taken relative to the start of the video file;
+    EDLs whose sources start at 01:00:00:00 need a matching export.
+    
+    Args:
+        path: EDL file
+        fps: Frames per second
+        
+    Returns:
+        Frame ranges in event order
+    """
+    ranges = []
+    with open(path, encoding='utf-8-sig', errors='replace') as f:
+        for line in f:
+            # Event lines start with the event number; TITLE, FCM and
+            # comment lines do not
+            if not line[:1].isdigit():
+                continue
+            
+            # Source in, source out, record in, record out
+            timecodes = EDL_TIMECODE_PATTERN.findall(line)
+            if len(timecodes) >= 4:
+                ranges.append(parse_range(timecodes[0], timecodes[1], fps))
+    return ranges
+
+
+def read_ranges_file(path: Union[str, Path], fps: float) -> List[FrameRange]:
+    """
+    Read ranges from a CSV or EDL file, chosen by extension.
+    
+    Args:
+        path: Range list file
+        fps: Frames per second
+        
+    Returns:
+        Frame ranges in file order
+    """
+    if Path(path).suffix.lower() in EDL_EXTENSIONS:
+        return read_edl_ranges(path, fps)
+    return read_csv_ranges(path, fps)
+
+
+def merge_ranges(ranges: Iterable[Sequence[int]], total_frames: int = 0) -> List[FrameRange]:
+    """
+    Sort ranges and merge overlapping or touching ones.
+    
+    Args:
+        ranges: (start_frame, end_frame) pairs in any order
+        total_frames: Clamp ends to this frame count (0 = unknown)
+        
+    Returns:
+        Disjoint, sorted, non-empty frame ranges
+    """
+    merged: List[FrameRange] = []
+    for start, end in sorted((int(start), int(end)) for start, end in ranges):
+        if total_frames > 0:
+            end = min(end, total_frames)
+        if end <= start:
+            continue
+        
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
@@ -0,0 +1,112 @@
+# Frame_Ayirici/core/scene_index.py
+"""
+Persisted per-frame signature index for scene detection.
+Stores the histogram correlation between every frame and its predecessor,
+so scene cuts for any threshold are a vectorized lookup instead of a
+full decode of the video.
+"""
+
+import os
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from utils.cache import cache_dir, file_cache_key
+
+
+class SceneIndex:
+    """
+    Per-frame histogram correlations of a single video.
+    
+    correlations[i] is the correlation between frame i and frame i - 1;
+    correlations[0] is NaN because the first frame has no predecessor.
+    """
+    
+    # Cache subdirectory for index files
+    CACHE_NAME = "scene_index"
+    
+    def __init__(self, correlations: np.ndarray):
+        """
+        Initialize SceneIndex.
+        
+        Args:
+            correlations: 1-D array of per-frame correlations
+        """
+        self.correlations = np.asarray(correlations, dtype=np.float32)
+    
+    def __len__(self) -> int:
+        return len(self.correlations)
+    
+    @classmethod
+    def _index_path(cls, video_path: str, *settings) -> Path:
+        """Return the cache file for a video and analysis settings."""
+        key = file_cache_key(video_path, *settings)
+        return cache_dir(cls.CACHE_NAME) / f"{key}.npy"
+    
+    @classmethod
+    def load(cls, video_path: str, *settings) -> Optional["SceneIndex"]:
+        """
+        Load the index of a video if one was saved for its current contents.
+        
+        Args:
+            video_path: Path to the video file
+            *settings: Every analysis setting that affects the correlations
+                (resolution, interpolation, histogram bins, ...)
+            
+        Returns:
+            SceneIndex instance, or None if no valid index exists
+        """
+        try:
+            path = cls._index_path(video_path, *settings)
+            if not path.exists():
+                return None
+            return cls(np.load(path, allow_pickle=False))
+        except (OSError, ValueError):
+            return None
+    
+    def save(self, video_path: str, *settings) -> None:
+        """
+        Persist the index, keyed by video path, size, mtime and settings.
+        
+        Args:
+            video_path: Path to the video file
+            *settings: Analysis settings the index was built with
+        """
+        path = self._index_path(video_path, *settings)
+        temp_path = path.with_suffix(".tmp.npy")
+        np.save(temp_path, self.correlations, allow_pickle=False)
+        os.replace(temp_path, path)
+    
+    def scene_cuts(self, threshold: float) -> np.ndarray:
+        """
+        Return the frames a SceneChangeStrategy run would save.
+        
+        Args:
+            threshold: Correlation threshold (0.0-1.0)
+            
+        Returns:
+            Sorted array of frame indices, always starting with frame 0
+        """
+        if len(self.correlations) == 0:
+            return np.empty(0, dtype=np.int64)
+        
+        # NaN at index 0 compares False; the first frame is always saved
+        cuts = np.flatnonzero(self.correlations < threshold)
+        if len(cuts) and cuts[0] == 0:
+            return cuts
+        return np.concatenate(([0], cuts))
+    
+    def count_cuts(self, threshold: float) -> int:
+        """
+        Count scene cuts for a threshold without building the index array.
+        
+        Args:
+            threshold: Correlation threshold (0.0-1.0)
+            
+        Returns:
+            Number of frames that would be saved
+        """
+        if len(self.correlations) == 0:
+            return 0
+        return int(np.count_nonzero(self.correlations[1:] < threshold)) + 1
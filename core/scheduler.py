@@ -0,0 +1,357 @@
+# Frame_Ayirici/core/scheduler.py
+"""
+Job queue bookkeeping for running many extractions.
+Decides which queued jobs start next and how many may run at once; the
+UI layer owns the threads that actually run them.
+"""
+
+import itertools
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+
+class JobState:
+    """Lifecycle states of a Job."""
+    
+    QUEUED = "queued"
+    RUNNING = "running"
+    PAUSED = "paused"
+    DONE = "done"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+    
+    # States a job never leaves
+    FINISHED = (DONE, FAILED, CANCELLED)
+
+
+class Job:
+    """
+    One queued extraction.
+    
+    A Job also implements CancellationProtocol: VideoProcessor polls
+    is_cancelled() once per frame. Pausing a running job makes the poll
+    return True, so the run commits a checkpoint and stops, releasing its
+    threads and its slot. A resumed job is queued again and continues from
+    the checkpoint (the zip and tensor sinks keep no journal and start over).
+    """
+    
+    def __init__(
+        self,
+        job_id: int,
+        video_path: str,
+        output_dir: str,
+        mode: str,
+        kwargs: Dict,
+        priority: int = 0
+    ):
+        """
+        Initialize Job.
+        
+        Args:
+            job_id: Unique id within the scheduler
+            video_path: Path to the video file
+            output_dir: Output directory (empty string for auto-desktop)
+            mode: Extraction mode ('all', 'range', 'scene', 'interval')
+            kwargs: Additional VideoProcessor/strategy parameters
+            priority: Higher values start first
+        """
+        self.job_id = job_id
+        self.video_path = video_path
+        self.output_dir = output_dir
+        self.mode = mode
+        self.kwargs = kwargs
+        self.priority = priority
+        
+        self.state = JobState.QUEUED
+        self.progress = 0
+        self.message = ""
+        
+        # True from next_jobs() until the worker running the job reports back
+        self.running = False
+        
+        # Working seconds of the current run, kept up to date by the caller
+        # (StageTimings.busy_seconds()); the adaptive limit is derived from it
+        self.busy_seconds = 0.0
+        self._sampled_busy: Optional[float] = None
+        
+        self._cancelled = False
+        self._stop = threading.Event()
+    
+    @property
+    def finished(self) -> bool:
+        """True once the job is done, failed or cancelled."""
+        return self.state in JobState.FINISHED
+    
+    def is_cancelled(self) -> bool:
+        """Report whether the run should stop (job cancelled or paused)."""
+        return self._stop.is_set()
+    
+    def _pause(self) -> None:
+        self._stop.set()
+    
+    def _resume(self) -> None:
+        if not self._cancelled:
+            self._stop.clear()
+    
+    def _cancel(self) -> None:
+        self._cancelled = True
+        self._stop.set()
+
+
+class JobScheduler:
+    """
+    Priority queue of Jobs with a bounded number of concurrent runs.
+    
+    With max_concurrent=0 the limit adapts to the machine: the busy time
+    each running job reports per wall second is sampled while jobs run,
+    and as many jobs are allowed as the CPU count can feed at that cost.
+    Jobs must keep all their work in threads that report busy time (the
+    thread writer backend, a single segment). Stage times are wall time,
+    so an oversubscribed machine inflates them and lowers the limit.
+    """
+    
+    # Assumed cores per job until a measurement exists (decode + encode)
+    DEFAULT_JOB_COST = 2.0
+    
+    # Lower bound for the measured cost; avoids runaway limits for
+    # jobs that are waiting on disk
+    MIN_JOB_COST = 0.5
+    
+    # Minimum seconds between load samples
+    SAMPLE_INTERVAL = 2.0
+    
+    # Weight of a new sample in the moving average
+    SAMPLE_WEIGHT = 0.3
+    
+    def __init__(
+        self,
+        max_concurrent: int = 0,
+        cpu_count: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize JobScheduler.
+        
+        Args:
+            max_concurrent: Fixed concurrency limit (0 = adaptive)
+            cpu_count: Number of cores (default: os.cpu_count())
+            clock: Monotonic wall clock (injectable for tests)
+        """
+        self.max_concurrent = max_concurrent
+        self.cpu_count = cpu_count or os.cpu_count() or 1
+        self.job_cost = self.DEFAULT_JOB_COST
+        
+        self._jobs: List[Job] = []
+        self._ids = itertools.count(1)
+        self._sequence: Dict[int, int] = {}
+        self._clock = clock
+        self._last_sample = clock()
+    
+    @property
+    def jobs(self) -> List[Job]:
+        """All jobs in scheduling order (priority, then submission)."""
+        return sorted(
+            self._jobs,
+            key=lambda job: (-job.priority, self._sequence[job.job_id])
+        )
+    
+    @property
+    def concurrency(self) -> int:
+        """Number of jobs that may run at the same time."""
+        if self.max_concurrent > 0:
+            return self.max_concurrent
+        return max(1, min(self.cpu_count, int(self.cpu_count / self.job_cost)))
+    
+    @property
+    def writer_workers(self) -> int:
+        """Encode/write pool size per job, sharing the cores between jobs."""
+        return max(self.cpu_count // self.concurrency, 1)
+    
+    @property
+    def active_count(self) -> int:
+        """Jobs with a running worker, including paused ones still stopping."""
+        return sum(1 for job in self._jobs if job.running)
+    
+    def get(self, job_id: int) -> Optional[Job]:
+        """Return a job by id, or None."""
+        for job in self._jobs:
+            if job.job_id == job_id:
+                return job
+        return None
+    
+    def add(
+        self,
+        video_path: str,
+        output_dir: str,
+        mode: str,
+        priority: int = 0,
+        **kwargs
+    ) -> Job:
+        """
+        Queue a new job.
+        
+        Returns:
+            The created Job
+        """
+        job = Job(next(self._ids), video_path, output_dir, mode, kwargs, priority)
+        self._sequence[job.job_id] = len(self._sequence)
+        self._jobs.append(job)
+        return job
+    
+    def next_jobs(self) -> List[Job]:
+        """
+        Pick queued jobs that may start now and mark them running.
+        
+        Returns:
+            Jobs the caller must start, in priority order
+        """
+        free = self.concurrency - self.active_count
+        started = []
+        
+        for job in self.jobs:
+            if free <= 0:
+                break
+            if job.state == JobState.QUEUED and not job.running:
+                job.state = JobState.RUNNING
+                job.running = True
+                started.append(job)
+                free -= 1
+        
+        return started
+    
+    def sample_load(self) -> None:
+        """
+        Update the per-job cost from the busy time of the running jobs.
+        Call periodically (e.g. from a UI timer) after refreshing
+        Job.busy_seconds; cheap when not due.
+        """
+        now = self._clock()
+        elapsed = now - self._last_sample
+        
+        if elapsed < self.SAMPLE_INTERVAL:
+            return
+        
+        self._last_sample = now
+        busy = 0.0
+        sampled = 0
+        
+        for job in self._jobs:
+            if not job.running:
+                job._sampled_busy = None
+                continue
+            
+            # A job seen for the first time, or restarted since the last
+            # sample, only sets its baseline
+            if job._sampled_busy is not None and job.busy_seconds >= job._sampled_busy:
+                busy += job.busy_seconds - job._sampled_busy
+                sampled += 1
+            job._sampled_busy = job.busy_seconds
+        
+        if sampled == 0:
+            return
+        
+        cost = max(busy / elapsed / sampled, self.MIN_JOB_COST)
+        self.job_cost += self.SAMPLE_WEIGHT * (cost - self.job_cost)
+    
+    def pause(self, job_id: int) -> bool:
+        """
+        Hold a queued job, or stop a running one at its next frame.
+        The run commits a checkpoint first; its slot is freed by stopped().
+        
+        Returns:
+            True if the job was paused
+        """
+        job = self.get(job_id)
+        if job is None or job.state not in (JobState.QUEUED, JobState.RUNNING):
+            return False
+        
+        job.state = JobState.PAUSED
+        job._pause()
+        return True
+    
+    def resume(self, job_id: int) -> bool:
+        """
+        Queue a paused job again; it continues from its checkpoint.
+        A run that has not noticed the pause yet simply carries on.
+        
+        Returns:
+            True if the job was resumed
+        """
+        job = self.get(job_id)
+        if job is None or job.state != JobState.PAUSED:
+            return False
+        
+        job.state = JobState.RUNNING if job.running else JobState.QUEUED
+        job._resume()
+        return True
+    
+    def set_priority(self, job_id: int, priority: int) -> bool:
+        """
+        Change a job's priority; affects jobs that have not started.
+        
+        Returns:
+            True if the job exists
+        """
+        job = self.get(job_id)
+        if job is None:
+            return False
+        
+        job.priority = priority
+        return True
+    
+    def cancel(self, job_id: int) -> bool:
+        """
+        Cancel a job. A running job stops at its next frame; the caller
+        reports that through stopped().
+        
+        Returns:
+            True if the job was not already finished
+        """
+        job = self.get(job_id)
+        if job is None or job.finished:
+            return False
+        
+        job._cancel()
+        if not job.running:
+            job.state = JobState.CANCELLED
+        return True
+    
+    def stopped(self, job: Job, message: str = "") -> None:
+        """
+        Record that a job's run stopped at a cancellation poll.
+        A cancelled job ends, a paused job waits for resume(), and a job
+        resumed while it was stopping is queued again.
+        
+        Args:
+            job: The job whose run stopped
+            message: Message of the stopped run
+        """
+        job.running = False
+        if job._cancelled:
+            job.state = JobState.CANCELLED
+            job.message = message
+        elif job.state == JobState.PAUSED:
+            job.message = "Duraklatıldı."
+        else:
+            job.state = JobState.QUEUED
+    
+    def finish(self, job: Job, state: str, message: str = "") -> None:
+        """
+        Record the outcome of a started job.
+        
+        Args:
+            job: The job that stopped running
+            state: JobState.DONE, FAILED or CANCELLED
+            message: Result or error message
+        """
+        job.running = False
+        job.state = state
+        job.message = message
+        if state == JobState.DONE:
+            job.progress = 100
+    
+    def remove_finished(self) -> None:
+        """Drop jobs that are done, failed or cancelled."""
+        self._jobs = [job for job in self._jobs if not job.finished]
@@ -0,0 +1,267 @@
+# Frame_Ayirici/core/seeking.py
+"""
+Keyframe-aware seek planning.
+Decides whether reaching a target frame is cheaper by seeking or by
+grabbing frames sequentially, so skipped frames are never fully decoded.
+"""
+
+import bisect
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from utils.cache import cache_dir, file_cache_key
+
+# Cache subdirectory for persisted container scans
+SCAN_CACHE_NAME = "keyframes"
+
+
+class ContainerScan(NamedTuple):
+    """Result of a demux-only pass over a video container."""
+    
+    # Sorted keyframe indices (empty if the backend cannot report them)
+    keyframes: Tuple[int, ...]
+    
+    # Exact number of video packets (0 if the container could not be read)
+    frame_count: int
+
+
+def _scan_path(video_path: str) -> Path:
+    """Return the cache file of a video's container scan."""
+    return cache_dir(SCAN_CACHE_NAME) / f"{file_cache_key(video_path)}.npy"
+
+
+def _load_scan(video_path: str) -> Optional[ContainerScan]:
+    """Load a persisted container scan, or None if there is none."""
+    try:
+        path = _scan_path(video_path)
+        if not path.exists():
+            return None
+        # Element 0 is the frame count, the rest are keyframe indices
+        values = np.load(path, allow_pickle=False)
+        return ContainerScan(tuple(values[1:].tolist()), int(values[0]))
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _save_scan(video_path: str, scan: ContainerScan) -> None:
+    """Persist a container scan; failures are ignored (it is a cache)."""
+    try:
+        path = _scan_path(video_path)
+        temp_path = path.with_suffix(".tmp.npy")
+        np.save(temp_path, np.array((scan.frame_count,) + scan.keyframes, dtype=np.int64))
+        os.replace(temp_path, path)
+    except OSError:
+        pass
+
+
+@lru_cache(maxsize=16)
+def _scan_container(video_path: str, size: int, mtime: float) -> ContainerScan:
+    """
+    Read keyframe positions and the frame count from the container
+    without decoding. Cached per (path, size, mtime) in this process and
+    on disk, so each file is demuxed once across runs, segment worker
+    processes and the UI.
+    
+    Args:
+        video_path: Path to the video file
+        size: File size in bytes (cache key)
+        mtime: File modification time (cache key)
+        
+    Returns:
+        ContainerScan instance
+    """
+    scan = _load_scan(video_path)
+    if scan is not None:
+        return scan
+    
+    # CAP_PROP_FORMAT = -1 makes the FFmpeg backend return raw packets,
+    # so grab() only demuxes and no frame is decoded
+    cap = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG, [cv2.CAP_PROP_FORMAT, -1])
+    
+    if not cap.isOpened():
+        return ContainerScan((), 0)
+    
+    keyframes: List[int] = []
+    index = 0
+    try:
+        while cap.grab():
+            if cap.get(cv2.CAP_PROP_LRF_HAS_KEY_FRAME):
+                keyframes.append(index)
+            index += 1
+    finally:
+        cap.release()
+    
+    scan = ContainerScan(tuple(keyframes), index)
+    if index > 0:
+        _save_scan(video_path, scan)
+    return scan
+
+
+def scan_container(video_path: str) -> ContainerScan:
+    """
+    Return the keyframe index and exact frame count of a video file.
+    
+    Args:
+        video_path: Path to the video file
+        
+    Returns:
+        ContainerScan instance (empty if unavailable)
+    """
+    try:
+        stat = os.stat(video_path)
+    except OSError:
+        return ContainerScan((), 0)
+    
+    return _scan_container(video_path, stat.st_size, stat.st_mtime)
+
+
+def cached_keyframes(video_path: str) -> Optional[Tuple[int, ...]]:
+    """
+    Return the keyframe index of a video scanned before, without demuxing.
+    
+    Args:
+        video_path: Path to the video file
+        
+    Returns:
+        Sorted tuple of keyframe indices, or None if no scan is cached
+    """
+    scan = _load_scan(video_path)
+    return scan.keyframes if scan is not None else None
+
+
+def scan_keyframes(video_path: str) -> Tuple[int, ...]:
+    """
+    Return the keyframe index of a video file.
+    
+    Args:
+        video_path: Path to the video file
+        
+    Returns:
+        Sorted tuple of keyframe indices (empty if unavailable)
+    """
+    return scan_container(video_path).keyframes
+
+
+class SeekPlanner:
+    """
+    Positions a VideoCapture on target frames as cheaply as possible.
+    
+    With a keyframe index, seeking pays off only if a keyframe lies between
+    the current position and the target; otherwise decoding restarts from
+    a keyframe at or before the current position and sequential grab() is
+    never slower. Without an index, a frame distance threshold is used.
+    """
+    
+    # Fallback seek threshold in seconds of video when no index is available
+    DEFAULT_SEEK_SECONDS = 2.0
+    
+    # OpenCV's FFmpeg backend seeks this many frames before the requested
+    # one and decodes forward from the keyframe preceding that point to
+    # the requested frame. Seeks therefore name the target frame itself;
+    # asking for a keyframe would land one whole GOP earlier.
+    SEEK_BACKOFF = 16
+    
+    def __init__(
+        self,
+        keyframes: Sequence[int] = (),
+        fps: float = 30.0,
+        seek_seconds: float = DEFAULT_SEEK_SECONDS
+    ):
+        """
+        Initialize SeekPlanner.
+        
+        Args:
+            keyframes: Sorted keyframe indices (empty = unknown)
+            fps: Frames per second, used for the fallback threshold
+            seek_seconds: Fallback threshold in seconds of video
+        """
+        self.keyframes = list(keyframes)
+        self.seek_distance = max(int(fps * seek_seconds), 1)
+    
+    @classmethod
+    def from_video(cls, video_path: str, fps: float) -> "SeekPlanner":
+        """
+        Create a planner using the container's keyframe index.
+        
+        Args:
+            video_path: Path to the video file
+            fps: Frames per second
+            
+        Returns:
+            SeekPlanner instance
+        """
+        return cls(scan_keyframes(video_path), fps)
+    
+    def preceding_keyframe(self, frame_index: int) -> Optional[int]:
+        """
+        Find the nearest keyframe at or before a frame.
+        
+        Args:
+            frame_index: Target frame index
+            
+        Returns:
+            Keyframe index, or None if unknown
+        """
+        position = bisect.bisect_right(self.keyframes, frame_index)
+        if position == 0:
+            return None
+        return self.keyframes[position - 1]
+    
+    def seek_target(self, current: int, target: int) -> Optional[int]:
+        """
+        Decide where to seek before reaching a target frame.
+        
+        Args:
+            current: Index of the next frame the capture would return
+            target: Index of the frame to read next
+            
+        Returns:
+            Frame index to seek to (the target itself, decoded up to by the
+            backend), or None to grab() sequentially
+        """
+        if target < current:
+            # Going backwards always requires a seek
+            return target
+        
+        if self.keyframes:
+            # A seek restarts decoding at the keyframe before target - backoff;
+            # it only saves work if that keyframe lies ahead of the position
+            landing = self.preceding_keyframe(max(target - self.SEEK_BACKOFF, 0))
+            if landing is not None and landing > current:
+                return target
+            return None
+        
+        if target - current > self.seek_distance:
+            return target
+        return None
+    
+    def advance(self, cap: cv2.VideoCapture, current: int, target: int) -> int:
+        """
+        Position the capture so that the next read returns the target frame.
+        Skipped frames are consumed with grab() and never retrieved.
+        
+        Args:
+            cap: Opened VideoCapture
+            current: Index of the next frame the capture would return
+            target: Index of the frame to read next
+            
+        Returns:
+            Index of the next frame the capture will return
+        """
+        seek_to = self.seek_target(current, target)
+        
+        if seek_to is not None:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, seek_to)
+            current = seek_to
+        
+        while current < target:
+            if not cap.grab():
+                break
+            current += 1
+        
+        return current
@@ -0,0 +1,239 @@
+# Frame_Ayirici/core/segments.py
+"""
+Segment-parallel extraction for a single long video.
+The frame range is split into keyframe-aligned segments, each decoded by
+its own process with its own VideoCapture, under one global frame numbering.
+"""
+
+import bisect
+import multiprocessing
+import os
+from concurrent.futures import FIRST_EXCEPTION, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from core.protocols import CancellationToken, ProcessingCancelled
+
+
+# Seconds between progress polls in the parent process
+POLL_INTERVAL = 0.2
+
+# Shared state handed to each worker process by _init_worker
+_worker_state: Dict = {}
+
+
+def segment_frame_name(frame_index: int, extension: str = ".jpg") -> str:
+    """
+    Temporary file name of a frame saved by a segment worker.
+    Carries the global frame index so segments can be merged in order.
+    
+    Args:
+        frame_index: Global frame index
+        extension: Output file extension including the dot
+        
+    Returns:
+        File name
+    """
+    return f"_segment_{frame_index:09d}{extension}"
+
+
+def plan_segments(
+    start_frame: int,
+    end_frame: int,
+    count: int,
+    keyframes: Sequence[int] = ()
+) -> List[Tuple[int, int]]:
+    """
+    Split a frame range into roughly equal keyframe-aligned segments.
+    
+    Args:
+        start_frame: First frame of the range
+        end_frame: Frame index to stop before
+        count: Desired number of segments
+        keyframes: Sorted keyframe indices (empty = align to frames)
+        
+    Returns:
+        List of (start, end) pairs covering the range without gaps
+    """
+    total = end_frame - start_frame
+    if total <= 0:
+        return []
+    
+    count = max(1, min(count, total))
+    boundaries = [start_frame]
+    
+    for k in range(1, count):
+        boundary = start_frame + total * k // count
+        
+        if keyframes:
+            # Snap to the nearest keyframe so each segment starts decoding
+            # without first decoding frames it will not use
+            position = bisect.bisect_left(keyframes, boundary)
+            candidates = keyframes[max(position - 1, 0):position + 1]
+            boundary = min(candidates, key=lambda keyframe: abs(keyframe - boundary))
+        
+        if boundaries[-1] < boundary < end_frame:
+            boundaries.append(boundary)
+    
+    boundaries.append(end_frame)
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+class _NullSignals:
+    """SignalProtocol implementation that discards updates from workers."""
+    
+    def emit_progress(self, value: int) -> None:
+        pass
+    
+    def emit_status(self, message: str) -> None:
+        pass
+
+
+class _SharedProgress:
+    """Writes a worker's processed frame count into shared memory."""
+    
+    def __init__(self, slot: int):
+        self.slot = slot
+    
+    def update(self, processed: int) -> None:
+        _worker_state['progress'][self.slot] = processed
+
+
+def _init_worker(progress, cancel_event) -> None:
+    """Store shared progress counters and the cancel event in the worker."""
+    _worker_state['progress'] = progress
+    _worker_state['cancel_event'] = cancel_event
+
+
+def _segment_worker(
+    video_path: str,
+    output_dir: str,
+    mode: str,
+    output_format: str,
+    encoder_options: Dict,
+    kwargs: Dict,
+    slot: int,
+    start_frame: int,
+    end_frame: int
+) -> List[int]:
+    """
+    Extract one segment in a worker process.
+    
+    Returns:
+        Global indices of the frames that were saved
+    """
+    # Imported here to avoid a circular import with video_processor
+    from core.video_processor import VideoProcessor
+    
+    processor = VideoProcessor(
+        video_path=video_path,
+        output_dir=output_dir,
+        mode=mode,
+        signals=_NullSignals(),
+        workers=1,
+        cancel_token=CancellationToken(_worker_state['cancel_event']),
+        output_format=output_format,
+        encoder_options=encoder_options,
+        **kwargs
+    )
+    return processor.run_segment(
+        Path(output_dir), start_frame, end_frame, _SharedProgress(slot)
+    )
+
+
+def run_segments(
+    processor,
+    output_path: Path,
+    segments: Sequence[Tuple[int, int]],
+    reporter,
+    is_cancelled: Callable[[], bool]
+) -> Optional[List[int]]:
+    """
+    Run every segment in its own process and wait for all of them.
+    
+    Args:
+        processor: VideoProcessor whose settings the workers copy
+        output_path: Output directory
+        segments: (start, end) pairs from plan_segments()
+        reporter: ProgressReporter receiving the combined frame count
+        is_cancelled: Polled while waiting; cancels every worker when True
+        
+    Returns:
+        Sorted global indices of saved frames, or None if cancelled
+    """
+    # spawn: the parent may be a Qt application, which must not be forked
+    context = multiprocessing.get_context('spawn')
+    progress = context.Array('q', len(segments), lock=False)
+    cancel_event = context.Event()
+    
+    with ProcessPoolExecutor(
+        max_workers=len(segments),
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(progress, cancel_event)
+    ) as executor:
+        futures = [
+            executor.submit(
+                _segment_worker, processor.video_path, str(output_path),
+                processor.mode, processor.output_format, processor.encoder_options,
+                processor.kwargs, slot, start, end
+            )
+            for slot, (start, end) in enumerate(segments)
+        ]
+        
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=POLL_INTERVAL, return_when=FIRST_EXCEPTION)
+            reporter.update(sum(progress))
+            
+            if is_cancelled() or any(future.exception() for future in done):
+                # Workers poll the event once per frame and drain their writes
+                cancel_event.set()
+                wait(pending)
+                break
+        
+        if is_cancelled():
+            return None
+        
+        # Report the worker error that caused the stop, not the
+        # cancellations it triggered in the other workers
+        errors = [future.exception() for future in futures if future.exception()]
+        for error in errors:
+            if not isinstance(error, ProcessingCancelled):
+                raise error
+        if errors:
+            raise errors[0]
+        
+        saved_indices: List[int] = []
+        for future in futures:
+            saved_indices.extend(future.result())
+    
+    saved_indices.sort()
+    return saved_indices
+
+
+def rename_segment_frames(
+    output_path: Path,
+    saved_indices: Sequence[int],
+    extension: str,
+    final_path: Callable[[int], str]
+) -> int:
+    """
+    Rename segment outputs to sequential frame numbers.
+    
+    Args:
+        output_path: Output directory
+        saved_indices: Sorted global frame indices that were saved
+        extension: Output file extension including the dot
+        final_path: Maps a 1-based frame number to its final path
+        
+    Returns:
+        Number of frames renamed
+    """
+    for number, frame_index in enumerate(saved_indices, start=1):
+        os.replace(
+            output_path / segment_frame_name(frame_index, extension),
+            final_path(number)
+        )
+    
+    return len(saved_indices)
@@ -0,0 +1,601 @@
+# Frame_Ayirici/core/sinks.py
+"""
+Output sinks for saved frames.
+A sink decides where saved frames end up: one file per frame, a single
+archive that copies as one file and is still readable by frame number,
+a raw memory-mapped array for training pipelines, or a content-addressed
+store that keeps each distinct encoded frame once across runs.
+"""
+
+import struct
+import threading
+import zipfile
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple, Type
+
+import numpy as np
+
+from core.encoders import FrameEncoder
+from core.frame_store import (
+    DEFAULT_STORE_ROOT,
+    MANIFEST_NAME,
+    MATERIALIZE_METHODS,
+    blob_path,
+    link_blob,
+    store_blob,
+    write_manifest
+)
+from core.frame_writer import FrameWriter
+
+
+def encode_frame(frame: np.ndarray, encoder: FrameEncoder) -> Optional[bytes]:
+    """
+    Encode a frame into bytes.
+    Module-level so it can be pickled by a process pool.
+    
+    Args:
+        frame: OpenCV frame (numpy array)
+        encoder: Output encoder
+        
+    Returns:
+        Encoded bytes, or None if encoding failed
+    """
+    buffer = encoder.encode(frame)
+    if buffer is None:
+        return None
+    return buffer if isinstance(buffer, bytes) else bytes(buffer)
+
+
+def encode_and_store(
+    frame: np.ndarray,
+    encoder: FrameEncoder,
+    store_root: str,
+    target_path: str = "",
+    method: str = 'none'
+) -> Optional[Tuple[str, bool]]:
+    """
+    Encode a frame into the content-addressed store and optionally
+    materialize it as a frame file.
+    Module-level so it can be pickled by a process pool.
+    
+    Args:
+        frame: OpenCV frame (numpy array)
+        encoder: Output encoder
+        store_root: Store directory
+        target_path: Frame file to create from the blob (optional)
+        method: 'hardlink', 'reflink' or 'copy' for target_path
+        
+    Returns:
+        Tuple of (digest, True if the blob was new), or None if encoding failed
+    """
+    data = encode_frame(frame, encoder)
+    if data is None:
+        return None
+    
+    digest, created = store_blob(data, store_root, encoder.extension)
+    if target_path and method != 'none':
+        link_blob(blob_path(store_root, digest, encoder.extension), Path(target_path), method)
+    return digest, created
+
+
+class FrameSink(ABC):
+    """
+    Abstract base class for frame destinations.
+    
+    Sinks receive frames in decode order from VideoProcessor and hand the
+    expensive work to the shared FrameWriter pool.
+    """
+    
+    # Used in the result message ("'<location>' klasörüne ...")
+    LOCATION_LABEL = "klasörüne"
+    
+    # True if a run can continue writing into the output of an
+    # interrupted run (see core.checkpoint)
+    RESUMABLE = False
+    
+    def __init__(
+        self,
+        output_path: Path,
+        writer: FrameWriter,
+        fps: float = 30.0,
+        expected_frames: int = 0
+    ):
+        """
+        Initialize the sink.
+        
+        Args:
+            output_path: Output directory
+            writer: Encode/write pool (also provides the encoder)
+            fps: Video frames per second
+            expected_frames: Estimated number of frames to save (0 = unknown)
+        """
+        self.output_path = output_path
+        self.writer = writer
+        self.fps = fps
+        self.expected_frames = expected_frames
+    
+    @property
+    def location(self) -> Path:
+        """Path shown to the user once the run finished."""
+        return self.output_path
+    
+    @abstractmethod
+    def add(self, frame: np.ndarray, number: int, frame_index: int) -> None:
+        """
+        Queue a selected frame.
+        
+        Args:
+            frame: OpenCV frame, must not be modified afterwards
+            number: 1-based saved frame number
+            frame_index: Index of the frame in the video
+        """
+        pass
+    
+    def cancel(self) -> None:
+        """Drop queued frames that have not started yet."""
+        self.writer.cancel()
+    
+    def flush(self) -> None:
+        """Wait until every queued frame has been stored."""
+        self.writer.flush()
+    
+    def close(self) -> None:
+        """Flush outstanding frames and release resources."""
+        self.writer.close()
+
+
+class DirectorySink(FrameSink):
+    """Writes every frame as its own file (frame_000001.jpg, ...)."""
+    
+    # Frame files have deterministic names, so a resumed run overwrites
+    # anything written after the last checkpoint
+    RESUMABLE = True
+    
+    def __init__(
+        self,
+        output_path: Path,
+        writer: FrameWriter,
+        fps: float = 30.0,
+        expected_frames: int = 0,
+        name_frame: Optional[Callable[[int, int], str]] = None
+    ):
+        """
+        Initialize DirectorySink.
+        
+        Args:
+            output_path: Output directory
+            writer: Encode/write pool
+            fps: Video frames per second
+            expected_frames: Estimated number of frames to save
+            name_frame: Maps (saved number, frame index) to a file path
+                (default: sequential frame_XXXXXX names)
+        """
+        super().__init__(output_path, writer, fps, expected_frames)
+        self.name_frame = name_frame or self._default_name
+    
+    @staticmethod
+    def frame_name(number: int, extension: str) -> str:
+        """
+        Build the deterministic file name of a saved frame.
+        
+        Args:
+            number: 1-based saved frame number
+            extension: Output file extension including the dot
+            
+        Returns:
+            File name
+        """
+        return f"frame_{number:06d}{extension}"
+    
+    def _default_name(self, number: int, frame_index: int) -> str:
+        return str(self.output_path / self.frame_name(number, self.writer.encoder.extension))
+    
+    def add(self, frame: np.ndarray, number: int, frame_index: int) -> None:
+        self.writer.submit(frame, self.name_frame(number, frame_index))
+
+
+class ZipSink(FrameSink):
+    """
+    Appends every frame to a single uncompressed zip archive.
+    
+    Frames are encoded in the writer pool and appended by whichever task
+    finishes first; the archive's central directory maps member names to
+    offsets, so frame N is still one lookup and one seek away.
+    """
+    
+    # Archive file name inside the output directory
+    ARCHIVE_NAME = "frames.zip"
+    
+    LOCATION_LABEL = "dosyasına"
+    
+    def __init__(
+        self,
+        output_path: Path,
+        writer: FrameWriter,
+        fps: float = 30.0,
+        expected_frames: int = 0
+    ):
+        super().__init__(output_path, writer, fps, expected_frames)
+        self._lock = threading.Lock()
+        # Stored, not deflated: encoded images do not compress further and
+        # stored members can be read in place with mmap
+        self._archive = zipfile.ZipFile(
+            self.location, "w", compression=zipfile.ZIP_STORED, allowZip64=True
+        )
+    
+    @property
+    def location(self) -> Path:
+        return self.output_path / self.ARCHIVE_NAME
+    
+    def add(self, frame: np.ndarray, number: int, frame_index: int) -> None:
+        name = DirectorySink.frame_name(number, self.writer.encoder.extension)
+        self.writer.submit_call(
+            encode_frame, frame, self.writer.encoder,
+            callback=lambda data: self._append(name, data)
+        )
+    
+    def _append(self, name: str, data: bytes) -> None:
+        """Append one encoded frame; called from writer callbacks."""
+        with self._lock:
+            self._archive.writestr(name, data)
+    
+    def close(self) -> None:
+        # Writing the central directory also makes a cancelled run's
+        # archive readable with the frames saved so far
+        try:
+            super().close()
+        finally:
+            with self._lock:
+                self._archive.close()
+
+
+class FrameArchive:
+    """
+    Random-access reader for archives written by ZipSink.
+    
+    Example:
+        with FrameArchive("frames.zip") as archive:
+            frame = cv2.imdecode(np.frombuffer(archive.read(42), np.uint8), cv2.IMREAD_COLOR)
+    """
+    
+    # Size of the fixed part of a zip local file header
+    LOCAL_HEADER_SIZE = 30
+    
+    def __init__(self, path: str):
+        """
+        Open an archive.
+        
+        Args:
+            path: Path to the archive
+        """
+        self._archive = zipfile.ZipFile(path, "r")
+        self._members: Dict[int, zipfile.ZipInfo] = {}
+        
+        for info in self._archive.infolist():
+            stem = Path(info.filename).stem
+            if stem.startswith("frame_"):
+                self._members[int(stem[len("frame_"):])] = info
+    
+    def __enter__(self) -> "FrameArchive":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+    
+    def __len__(self) -> int:
+        return len(self._members)
+    
+    def read(self, number: int) -> bytes:
+        """
+        Read the encoded bytes of a saved frame.
+        
+        Args:
+            number: 1-based saved frame number
+            
+        Returns:
+            Encoded frame bytes
+            
+        Raises:
+            KeyError: If the archive has no such frame
+        """
+        return self._archive.read(self._members[number])
+    
+    def locate(self, number: int) -> Tuple[int, int]:
+        """
+        Find the raw byte range of a saved frame inside the archive file,
+        for readers that seek or mmap the file directly.
+        
+        Args:
+            number: 1-based saved frame number
+            
+        Returns:
+            Tuple of (data offset, size in bytes)
+            
+        Raises:
+            KeyError: If the archive has no such frame
+        """
+        info = self._members[number]
+        
+        # The local header's name/extra lengths may differ from the
+        # central directory's, so read them from the local header
+        handle = self._archive.fp
+        handle.seek(info.header_offset + 26)
+        name_length, extra_length = struct.unpack("<HH", handle.read(4))
+        
+        offset = info.header_offset + self.LOCAL_HEADER_SIZE + name_length + extra_length
+        return offset, info.compress_size
+    
+    def close(self) -> None:
+        """Close the archive file."""
+        self._archive.close()
+
+
+class TensorSink(FrameSink):
+    """
+    Copies raw frames into one memory-mapped frames.npy array of shape
+    (N, H, W, C), next to a frames_index.npy with the source frame index
+    and timestamp of every row.
+    
+    Nothing is encoded; consumers open the result with
+    np.load("frames.npy", mmap_mode="r") and read frames zero-copy.
+    The file is preallocated from the expected frame count, grown in
+    chunks when the estimate is exceeded and trimmed on close().
+    """
+    
+    # Array and index file names inside the output directory
+    ARRAY_NAME = "frames.npy"
+    INDEX_NAME = "frames_index.npy"
+    
+    # Fixed .npy header size; leaves room to rewrite the shape in place
+    HEADER_SIZE = 128
+    
+    # Minimum number of frames added when the array has to grow
+    GROW_CHUNK = 256
+    
+    # Row layout of the sidecar index
+    INDEX_DTYPE = np.dtype([('frame_index', '<i8'), ('timestamp', '<f8')])
+    
+    LOCATION_LABEL = "dosyasına"
+    
+    def __init__(
+        self,
+        output_path: Path,
+        writer: FrameWriter,
+        fps: float = 30.0,
+        expected_frames: int = 0
+    ):
+        super().__init__(output_path, writer, fps, expected_frames)
+        self._file = None
+        self._array: Optional[np.memmap] = None
+        self._frame_shape: Tuple[int, ...] = ()
+        self._dtype = np.dtype(np.uint8)
+        self._capacity = 0
+        self._count = 0
+        self._index = np.empty(0, dtype=self.INDEX_DTYPE)
+    
+    @property
+    def location(self) -> Path:
+        return self.output_path / self.ARRAY_NAME
+    
+    def add(self, frame: np.ndarray, number: int, frame_index: int) -> None:
+        if self._array is None:
+            self._open(frame)
+        elif frame.shape != self._frame_shape:
+            raise ValueError(
+                f"Frame shape changed from {self._frame_shape} to {frame.shape}"
+            )
+        
+        if self._count >= self._capacity:
+            self._grow(self._capacity + max(self.GROW_CHUNK, self._capacity // 2))
+        
+        self._array[self._count] = frame
+        self._index[self._count] = (frame_index, frame_index / self.fps)
+        self._count += 1
+    
+    def _open(self, frame: np.ndarray) -> None:
+        """Create the array file once the frame shape is known."""
+        self._frame_shape = frame.shape
+        self._dtype = frame.dtype
+        self._file = open(self.location, "w+b")
+        # Unknown counts (pixel-based strategies) start small and grow
+        # instead of reserving the whole video
+        self._grow(self.expected_frames if self.expected_frames > 0 else self.GROW_CHUNK)
+    
+    def _write_header(self, rows: int) -> None:
+        """Write a version 1.0 .npy header padded to HEADER_SIZE bytes."""
+        header = repr({
+            'descr': np.lib.format.dtype_to_descr(self._dtype),
+            'fortran_order': False,
+            'shape': (rows,) + self._frame_shape,
+        }).encode("latin1")
+        prefix = np.lib.format.magic(1, 0) + struct.pack("<H", self.HEADER_SIZE - 10)
+        
+        self._file.seek(0)
+        self._file.write(prefix + header.ljust(self.HEADER_SIZE - len(prefix) - 1) + b"\n")
+    
+    def _map(self, rows: int) -> None:
+        """Resize the file to rows frames and map it."""
+        if self._array is not None:
+            self._array.flush()
+            self._array = None
+        
+        frame_bytes = int(np.prod(self._frame_shape)) * self._dtype.itemsize
+        self._file.truncate(self.HEADER_SIZE + rows * frame_bytes)
+        self._write_header(rows)
+        self._file.flush()
+        
+        if rows > 0:
+            self._array = np.memmap(
+                self._file, dtype=self._dtype, mode="r+",
+                offset=self.HEADER_SIZE, shape=(rows,) + self._frame_shape
+            )
+    
+    def _grow(self, rows: int) -> None:
+        """Enlarge the array and the index to hold rows frames."""
+        self._map(rows)
+        index = np.empty(rows, dtype=self.INDEX_DTYPE)
+        index[:self._count] = self._index[:self._count]
+        self._index = index
+        self._capacity = rows
+    
+    def flush(self) -> None:
+        super().flush()
+        if self._array is not None:
+            self._array.flush()
+    
+    def close(self) -> None:
+        # Trim to the frames actually saved, so a cancelled run still
+        # leaves a valid array of everything written so far
+        try:
+            super().close()
+        finally:
+            if self._file is not None:
+                self._map(self._count)
+                self._array = None
+                self._file.close()
+                self._file = None
+                
+                np.save(
+                    self.output_path / self.INDEX_NAME,
+                    self._index[:self._count], allow_pickle=False
+                )
+
+
+class ContentStoreSink(FrameSink):
+    """
+    Stores every distinct encoded frame once in a content-addressed store
+    and writes a manifest.json mapping saved frame numbers to blobs.
+    
+    The store is shared by all runs, so re-extracting a video, or frames
+    identical to ones saved before, costs an encode and a hash but no
+    write. With materialize set, a plain folder of frame files is also
+    created as hardlinks or reflinks to the blobs (see core.frame_store).
+    """
+    
+    LOCATION_LABEL = "dosyasına"
+    
+    def __init__(
+        self,
+        output_path: Path,
+        writer: FrameWriter,
+        fps: float = 30.0,
+        expected_frames: int = 0,
+        store_dir: str = "",
+        materialize: str = 'none'
+    ):
+        """
+        Initialize ContentStoreSink.
+        
+        Args:
+            output_path: Output directory (receives the manifest)
+            writer: Encode/write pool
+            fps: Video frames per second
+            expected_frames: Estimated number of frames to save
+            store_dir: Store directory (default: DEFAULT_STORE_ROOT)
+            materialize: Also create frame files in output_path:
+                'none', 'hardlink', 'reflink' or 'copy'
+                
+        Raises:
+            ValueError: If materialize is not recognized
+        """
+        super().__init__(output_path, writer, fps, expected_frames)
+        
+        if materialize not in MATERIALIZE_METHODS:
+            available = ', '.join(MATERIALIZE_METHODS)
+            raise ValueError(
+                f"Unknown materialize method: '{materialize}'. Available methods: {available}"
+            )
+        
+        self.store_root = Path(store_dir) if store_dir else DEFAULT_STORE_ROOT
+        self.materialize = materialize
+        self._lock = threading.Lock()
+        self._entries: Dict[int, Tuple[int, str]] = {}
+        
+        # Blobs written by this run vs. found in the store already
+        self.stored_count = 0
+        self.reused_count = 0
+    
+    @property
+    def location(self) -> Path:
+        return self.output_path / MANIFEST_NAME
+    
+    def add(self, frame: np.ndarray, number: int, frame_index: int) -> None:
+        target_path = ""
+        if self.materialize != 'none':
+            target_path = str(
+                self.output_path / DirectorySink.frame_name(number, self.writer.encoder.extension)
+            )
+        
+        self.writer.submit_call(
+            encode_and_store, frame, self.writer.encoder, str(self.store_root),
+            target_path, self.materialize,
+            callback=lambda result: self._record(number, frame_index, result)
+        )
+    
+    def _record(self, number: int, frame_index: int, result: Tuple[str, bool]) -> None:
+        """Add a stored frame to the manifest; called from writer callbacks."""
+        digest, created = result
+        with self._lock:
+            self._entries[number] = (frame_index, digest)
+            if created:
+                self.stored_count += 1
+            else:
+                self.reused_count += 1
+    
+    def close(self) -> None:
+        # Written for cancelled runs too, listing the frames stored so far
+        try:
+            super().close()
+        finally:
+            with self._lock:
+                write_manifest(
+                    self.output_path, self.store_root,
+                    self.writer.encoder.extension, self._entries
+                )
+
+
+# Sink registry - maps sink names to sink classes
+SINKS: Dict[str, Type[FrameSink]] = {
+    'directory': DirectorySink,
+    'zip': ZipSink,
+    'tensor': TensorSink,
+    'store': ContentStoreSink,
+}
+
+
+def create_sink(
+    name: str,
+    output_path: Path,
+    writer: FrameWriter,
+    fps: float = 30.0,
+    expected_frames: int = 0,
+    **options
+) -> FrameSink:
+    """
+    Factory function to create a sink.
+    
+    Args:
+        name: Key of SINKS ('directory', 'zip', 'tensor', 'store')
+        output_path: Output directory
+        writer: Encode/write pool
+        fps: Video frames per second
+        expected_frames: Estimated number of frames to save
+        **options: Sink-specific options, e.g. 'store_dir' and
+            'materialize' for the store sink
+        
+    Returns:
+        FrameSink instance
+        
+    Raises:
+        ValueError: If the sink is not recognized
+    """
+    sink_class = SINKS.get(name)
+    
+    if sink_class is None:
+        available = ', '.join(SINKS.keys())
+        raise ValueError(
+            f"Unknown output sink: '{name}'. Available sinks: {available}"
+        )
+    
+    return sink_class(output_path, writer, fps, expected_frames, **options)
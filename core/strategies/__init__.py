@@ -8,10 +8,18 @@ from .base import ExtractionStrategy
 from .all_frames import AllFramesStrategy
 from .time_range import TimeRangeStrategy
 from .scene_change import SceneChangeStrategy
+from .interval import IntervalStrategy
+from .multi_range import MultiRangeStrategy
+from .dedup import DedupStrategy
+from .motion import MotionStrategy
 
 __all__ = [
     'ExtractionStrategy',
     'AllFramesStrategy', 
     'TimeRangeStrategy',
-    'SceneChangeStrategy'
+    'SceneChangeStrategy',
+    'IntervalStrategy',
+    'MultiRangeStrategy',
+    'DedupStrategy',
+    'MotionStrategy'
 ]
@@ -3,6 +3,8 @@
 Strategy for extracting all frames from a video.
 """
 
+from typing import Optional
+
 import numpy as np
 from .base import ExtractionStrategy
 
@@ -17,7 +19,12 @@ class AllFramesStrategy(ExtractionStrategy):
     def name(self) -> str:
         return "All Frames"
     
-    def should_save_frame(self, frame: np.ndarray, frame_index: int) -> bool:
+    @property
+    def needs_pixels(self) -> bool:
+        """Every frame is saved, so decisions never need pixels."""
+        return False
+    
+    def should_save_frame(self, frame: Optional[np.ndarray], frame_index: int) -> bool:
         """
         Always returns True - save every frame.
         
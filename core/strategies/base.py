@@ -5,9 +5,11 @@ Part of Strategy Pattern implementation for Open/Closed Principle.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, Optional, Sequence
 import numpy as np
 
+from core.analysis import DEFAULT_INTERPOLATION, SharedAnalysis, downscale_gray
+
 
 class ExtractionStrategy(ABC):
     """
@@ -17,6 +19,10 @@ class ExtractionStrategy(ABC):
     a frame should be saved or not.
     """
     
+    # Shared per-frame artefacts, attached by the processor when several
+    # strategies consume one decode stream
+    analysis: Optional[SharedAnalysis] = None
+    
     def __init__(self, fps: float, total_frames: int, **kwargs):
         """
         Initialize the strategy.
@@ -30,12 +36,13 @@ class ExtractionStrategy(ABC):
         self.total_frames = total_frames
     
     @abstractmethod
-    def should_save_frame(self, frame: np.ndarray, frame_index: int) -> bool:
+    def should_save_frame(self, frame: Optional[np.ndarray], frame_index: int) -> bool:
         """
         Determine if the current frame should be saved.
         
         Args:
-            frame: The current frame as numpy array
+            frame: The current frame as numpy array, or None if the
+                strategy does not need pixels (see needs_pixels)
             frame_index: The index of the current frame (0-based)
             
         Returns:
@@ -49,9 +56,151 @@ class ExtractionStrategy(ABC):
         """Return the strategy name for display purposes."""
         pass
     
+    def select_batch(
+        self,
+        frames: Sequence[np.ndarray],
+        indices: Sequence[int]
+    ) -> np.ndarray:
+        """
+        Decide for a batch of consecutive frames at once.
+        
+        The default falls back to should_save_frame() per frame; strategies
+        that gain from deciding several frames together (decoding into a
+        reused buffer, comparing all rows at once) override this and set
+        batch_size > 1.
+        Frames may live in a reused buffer and must not be kept.
+        
+        Args:
+            frames: Frames in decode order (array of shape (N, H, W, 3) or list)
+            indices: Frame index of each frame
+            
+        Returns:
+            Boolean mask, True for frames that should be saved
+        """
+        return np.fromiter(
+            (self.should_save_frame(frame, index) for frame, index in zip(frames, indices)),
+            dtype=bool,
+            count=len(indices)
+        )
+    
+    @property
+    def batch_size(self) -> int:
+        """
+        Number of frames the processor collects before calling select_batch().
+        1 (default) means frames are decided one by one via should_save_frame().
+        """
+        return 1
+    
+    @property
+    def needs_pixels(self) -> bool:
+        """
+        Whether should_save_frame() inspects frame pixels.
+        
+        Index-only strategies return False; the processor then only
+        grab()s each frame and retrieve()s (decodes to BGR) the ones
+        that will actually be saved.
+        """
+        return True
+    
+    @property
+    def segmentable(self) -> bool:
+        """
+        Whether a dense scan may be split into independently decided
+        segments (see VideoProcessor.segments).
+        
+        Each segment runs a fresh copy of the strategy that only sees the
+        frame before the segment. Strategies whose decisions depend on
+        more history than that return False and run in a single pass.
+        """
+        return True
+    
+    def planned_frames(self) -> Optional[Sequence[int]]:
+        """
+        Return the frame indices this strategy needs, if known in advance.
+        
+        When a sequence is returned, the processor decodes only those
+        frames and seeks or grab()s across the gaps between them.
+        Override in sparse strategies; the default visits every frame.
+        
+        Returns:
+            Frame indices, or None to visit every frame
+        """
+        return None
+    
+    def grayscale(
+        self,
+        frame: np.ndarray,
+        frame_index: int,
+        width: int = 0,
+        interpolation: int = DEFAULT_INTERPOLATION
+    ) -> np.ndarray:
+        """
+        Return the frame shrunk to width and converted to grayscale,
+        reusing another strategy's result for the same frame if possible.
+        
+        Args:
+            frame: BGR frame from OpenCV
+            frame_index: The 0-based frame index
+            width: Target width in pixels (0 = full size)
+            interpolation: OpenCV interpolation flag used for resizing
+            
+        Returns:
+            Grayscale image, must not be modified
+        """
+        if self.analysis is not None:
+            return self.analysis.gray(frame, frame_index, width, interpolation)
+        return downscale_gray(frame, width, interpolation)
+    
+    @property
+    def groups_output(self) -> bool:
+        """
+        Whether saved frames are grouped into subfolders by output_group().
+        Only the directory sink creates subfolders; other sinks ignore it.
+        """
+        return False
+    
+    def output_group(self, frame_index: int) -> Optional[str]:
+        """
+        Return the subfolder name for a saved frame (see groups_output).
+        
+        Args:
+            frame_index: The 0-based frame index
+            
+        Returns:
+            Subfolder name, or None to save in the output directory itself
+        """
+        return None
+    
     def reset(self) -> None:
         """
         Reset any internal state. Called before processing starts.
         Override in subclasses if needed.
         """
         pass
+    
+    def get_state(self) -> Dict:
+        """
+        Return the JSON-serializable state needed to resume a run.
+        Override in strategies whose decisions depend on earlier frames.
+        
+        Returns:
+            State dictionary passed back to set_state() on resume
+        """
+        return {}
+    
+    def set_state(self, state: Dict) -> None:
+        """
+        Restore state saved by get_state(). Called after reset() when a
+        run resumes from a checkpoint.
+        
+        Args:
+            state: Dictionary returned by get_state()
+        """
+        pass
+    
+    def finish(self) -> None:
+        """
+        Called after the last frame was processed (not on cancellation).
+        Override in subclasses that persist analysis results.
+        """
+        pass
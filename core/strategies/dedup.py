@@ -0,0 +1,124 @@
+# Frame_Ayirici/core/strategies/dedup.py
+"""
+Strategy for suppressing near-duplicate frames with perceptual hashes.
+"""
+
+from typing import Dict, Optional
+
+import numpy as np
+from .base import ExtractionStrategy
+from core.perceptual_hash import HASHES, BKTree
+
+
+class DedupStrategy(ExtractionStrategy):
+    """
+    Strategy that saves a frame only if no already saved frame looks alike.
+    
+    Each frame is reduced to a 64-bit perceptual hash and looked up in a
+    BK-tree of the hashes saved so far; frames within max_distance bits of
+    any of them are skipped. Unlike scene change detection this compares
+    against every saved frame, not just the previous one, so static slides
+    or screens that reappear later are not saved again.
+    """
+    
+    # Hash function (key of core.perceptual_hash.HASHES)
+    DEFAULT_HASH = 'dhash'
+    
+    # Largest Hamming distance (of 64 bits) still treated as a duplicate
+    DEFAULT_MAX_DISTANCE = 4
+    
+    # Frames are hashed from a grayscale copy at this width; matches scene
+    # change detection so a shared pass converts each frame only once
+    DEFAULT_ANALYSIS_WIDTH = 256
+    
+    # Bits per hash row and column (8 = 64-bit hash)
+    HASH_SIZE = 8
+    
+    def __init__(self, fps: float, total_frames: int, **kwargs):
+        """
+        Initialize DedupStrategy.
+        
+        Args:
+            fps: Frames per second
+            total_frames: Total frame count
+            **kwargs: Optional 'hash' ('dhash' or 'phash'), 'max_distance'
+                (Hamming distance treated as a duplicate) and 'analysis_width'
+                
+        Raises:
+            ValueError: If the hash is not recognized or max_distance is negative
+        """
+        super().__init__(fps, total_frames, **kwargs)
+        
+        self.hash_name = kwargs.get('hash', self.DEFAULT_HASH)
+        if self.hash_name not in HASHES:
+            available = ', '.join(HASHES.keys())
+            raise ValueError(
+                f"Unknown hash: '{self.hash_name}'. Available hashes: {available}"
+            )
+        self._hash = HASHES[self.hash_name]
+        
+        self.max_distance = int(kwargs.get('max_distance', self.DEFAULT_MAX_DISTANCE))
+        if self.max_distance < 0:
+            raise ValueError("max_distance must not be negative")
+        
+        self.analysis_width = kwargs.get('analysis_width', self.DEFAULT_ANALYSIS_WIDTH)
+        self._index = BKTree()
+        
+        # Frames skipped as duplicates in this run
+        self.duplicate_count = 0
+    
+    @property
+    def name(self) -> str:
+        return f"Duplicate Suppression ({self.hash_name}, ≤{self.max_distance} bit)"
+    
+    @property
+    def segmentable(self) -> bool:
+        """Every frame is compared with all frames saved before it."""
+        return False
+    
+    def reset(self) -> None:
+        """Forget the saved hashes for a new processing run."""
+        self._index = BKTree()
+        self.duplicate_count = 0
+    
+    def get_state(self) -> Dict:
+        """Return the saved hashes so a resumed run keeps skipping them."""
+        return {'hashes': self._index.values()}
+    
+    def set_state(self, state: Dict) -> None:
+        """Rebuild the index from the hashes saved by get_state()."""
+        self._index = BKTree(state.get('hashes', []))
+    
+    def frame_hash(self, frame: np.ndarray, frame_index: int) -> int:
+        """
+        Compute the perceptual hash of a frame.
+        
+        Args:
+            frame: The current BGR frame
+            frame_index: The 0-based frame index
+            
+        Returns:
+            Hash as an integer
+        """
+        gray = self.grayscale(frame, frame_index, self.analysis_width)
+        return self._hash(gray, self.HASH_SIZE)
+    
+    def should_save_frame(self, frame: Optional[np.ndarray], frame_index: int) -> bool:
+        """
+        Check whether a frame differs from every frame saved so far.
+        
+        Args:
+            frame: The current BGR frame
+            frame_index: The 0-based frame index
+            
+        Returns:
+            True if no saved frame is within max_distance, False otherwise
+        """
+        value = self.frame_hash(frame, frame_index)
+        
+        if self._index.find(value, self.max_distance) is not None:
+            self.duplicate_count += 1
+            return False
+        
+        self._index.add(value)
+        return True
@@ -0,0 +1,93 @@
+# Frame_Ayirici/core/strategies/interval.py
+"""
+Strategy for sampling frames at a fixed interval or target frame rate.
+"""
+
+from typing import Optional, Sequence
+
+import numpy as np
+from .base import ExtractionStrategy
+
+
+class IntervalStrategy(ExtractionStrategy):
+    """
+    Strategy that saves one frame every N seconds ('interval') or resamples
+    the video to a lower frame rate ('target_fps').
+    
+    The frames are known in advance, so the processor seeks or grab()s
+    between them instead of decoding every frame.
+    """
+    
+    # Seconds between saved frames when neither option is given
+    DEFAULT_INTERVAL = 1.0
+    
+    def __init__(self, fps: float, total_frames: int, **kwargs):
+        """
+        Initialize IntervalStrategy.
+        
+        Args:
+            fps: Frames per second
+            total_frames: Total frame count
+            **kwargs: 'interval' in seconds between saved frames, or
+                'target_fps' (takes precedence) for the output frame rate
+                
+        Raises:
+            ValueError: If interval or target_fps is not positive
+        """
+        super().__init__(fps, total_frames, **kwargs)
+        
+        target_fps = kwargs.get('target_fps')
+        if target_fps is not None:
+            if float(target_fps) <= 0:
+                raise ValueError("target_fps must be positive")
+            interval = 1.0 / float(target_fps)
+        else:
+            interval = float(kwargs.get('interval', self.DEFAULT_INTERVAL))
+            if interval <= 0:
+                raise ValueError("interval must be positive")
+        
+        self.interval = interval
+        
+        # Source frames per saved frame; below 1 every frame is saved
+        self.step = max(interval * fps, 1.0)
+    
+    @property
+    def name(self) -> str:
+        return f"Fixed Interval ({self.interval:g}s)"
+    
+    @property
+    def needs_pixels(self) -> bool:
+        """Decision depends on the frame index only."""
+        return False
+    
+    def _sample_index(self, sample: int) -> int:
+        """Frame index of the given sample (nearest frame to its timestamp)."""
+        return int(sample * self.step + 0.5)
+    
+    def planned_frames(self) -> Optional[Sequence[int]]:
+        """
+        Return the frame index of every sample.
+        
+        Returns:
+            Frame indices, or None if the frame count is unknown
+            (every frame is then visited and checked one by one)
+        """
+        if self.total_frames <= 0:
+            return None
+        
+        count = int(self.total_frames / self.step) + 1
+        indices = (self._sample_index(sample) for sample in range(count))
+        return [index for index in indices if index < self.total_frames]
+    
+    def should_save_frame(self, frame: Optional[np.ndarray], frame_index: int) -> bool:
+        """
+        Check whether a frame is the nearest frame to a sample timestamp.
+        
+        Args:
+            frame: The current frame (unused)
+            frame_index: The 0-based frame index
+            
+        Returns:
+            True if the frame is a sample, False otherwise
+        """
+        return self._sample_index(int(frame_index / self.step + 0.5)) == frame_index
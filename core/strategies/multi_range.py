@@ -0,0 +1,118 @@
+# Frame_Ayirici/core/strategies/multi_range.py
+"""
+Strategy for extracting frames within several time ranges in one pass.
+"""
+
+import bisect
+from typing import List, Optional, Sequence
+
+import numpy as np
+from .base import ExtractionStrategy
+from core.ranges import FrameRange, merge_ranges, parse_range, parse_range_spec, read_ranges_file
+from utils.formatters import format_duration
+
+
+class MultiRangeStrategy(ExtractionStrategy):
+    """
+    Strategy that saves the frames of a list of time ranges.
+    
+    Ranges are sorted and merged, and the frames are planned in advance,
+    so one pass decodes linearly inside each range and seeks across the
+    gaps between them. Saved frames are grouped per range.
+    """
+    
+    def __init__(self, fps: float, total_frames: int, **kwargs):
+        """
+        Initialize MultiRangeStrategy.
+        
+        Args:
+            fps: Frames per second
+            total_frames: Total frame count
+            **kwargs: 'ranges' as an inline spec ("00:00:05-00:00:12, 95-101")
+                or a list of (start, end) time pairs, and/or 'ranges_file'
+                with a CSV or EDL range list (see core.ranges)
+                
+        Raises:
+            ValueError: If no ranges are given or a range cannot be parsed
+        """
+        super().__init__(fps, total_frames, **kwargs)
+        
+        frame_ranges: List[FrameRange] = []
+        
+        ranges = kwargs.get('ranges')
+        if isinstance(ranges, str):
+            frame_ranges.extend(parse_range_spec(ranges, fps))
+        elif ranges:
+            frame_ranges.extend(parse_range(str(start), str(end), fps) for start, end in ranges)
+        
+        ranges_file = kwargs.get('ranges_file')
+        if ranges_file:
+            frame_ranges.extend(read_ranges_file(ranges_file, fps))
+        
+        if not frame_ranges:
+            raise ValueError("No time ranges given")
+        
+        self.ranges = merge_ranges(frame_ranges, total_frames)
+        self._starts = [start for start, _ in self.ranges]
+    
+    @property
+    def name(self) -> str:
+        return f"Multi Range ({len(self.ranges)} ranges)"
+    
+    @property
+    def needs_pixels(self) -> bool:
+        """Decision depends on the frame index only."""
+        return False
+    
+    @property
+    def groups_output(self) -> bool:
+        return True
+    
+    def range_of(self, frame_index: int) -> Optional[int]:
+        """
+        Find the merged range containing a frame.
+        
+        Args:
+            frame_index: The 0-based frame index
+            
+        Returns:
+            0-based range number, or None outside every range
+        """
+        number = bisect.bisect_right(self._starts, frame_index) - 1
+        if number >= 0 and frame_index < self.ranges[number][1]:
+            return number
+        return None
+    
+    def output_group(self, frame_index: int) -> Optional[str]:
+        """Subfolder such as 'range_003_00-01-05' (number and start time)."""
+        number = self.range_of(frame_index)
+        if number is None:
+            return None
+        
+        start_time = format_duration(self.ranges[number][0] / self.fps)
+        return f"range_{number + 1:03d}_{start_time.replace(':', '-')}"
+    
+    def planned_frames(self) -> Optional[Sequence[int]]:
+        """
+        Return every frame of every range.
+        
+        Returns:
+            Frame indices, or None if the frame count is unknown
+            (every frame is then visited and checked one by one)
+        """
+        if self.total_frames <= 0:
+            return None
+        return [index for start, end in self.ranges for index in range(start, end)]
+    
+    def should_save_frame(self, frame: Optional[np.ndarray], frame_index: int) -> bool:
+        """
+        Check if frame is within one of the ranges.
+        
+        Args:
+            frame: The current frame (unused)
+            frame_index: The 0-based frame index
+            
+        Returns:
+            True if frame is within a range, False otherwise
+        """
+        return self.range_of(frame_index) is not None
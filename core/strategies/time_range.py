@@ -3,6 +3,8 @@
 Strategy for extracting frames within a specific time range.
 """
 
+from typing import Optional
+
 import numpy as np
 from .base import ExtractionStrategy
 from utils.formatters import time_str_to_frame
@@ -38,7 +40,12 @@ class TimeRangeStrategy(ExtractionStrategy):
     def name(self) -> str:
         return "Time Range"
     
-    def should_save_frame(self, frame: np.ndarray, frame_index: int) -> bool:
+    @property
+    def needs_pixels(self) -> bool:
+        """Decision depends on the frame index only."""
+        return False
+    
+    def should_save_frame(self, frame: Optional[np.ndarray], frame_index: int) -> bool:
         """
         Check if frame is within the specified time range.
         
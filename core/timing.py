@@ -0,0 +1,290 @@
+# Frame_Ayirici/core/timing.py
+"""
+Per-stage timing instrumentation for the processing loop.
+Stages are timed by wrapping the callables the loop uses once, before
+the loop starts; with instrumentation disabled the loop calls the
+original functions and pays nothing per frame.
+"""
+
+import threading
+import time
+from typing import Any, BinaryIO, Callable, Dict, List, Optional
+
+import numpy as np
+
+from core.encoders import FrameEncoder
+
+
+# Turkish display names of the stages the processor records
+STAGE_LABELS = {
+    'seek': "seek",
+    'decode': "decode",
+    'analysis': "analiz",
+    'sink': "kuyruk",
+    'encode': "kodlama",
+    'write': "yazma",
+    'flush': "bekleme",
+}
+
+# Stages that mostly wait for other stages (the writer queue, a flush)
+WAIT_STAGES = ('sink', 'flush')
+
+
+class StageHistogram:
+    """
+    Duration histogram of one stage with power-of-two microsecond buckets.
+    Bucket k counts durations in [2^(k-1), 2^k) microseconds.
+    """
+    
+    # Bucket count; the last one holds everything from ~9 minutes up
+    BUCKETS = 30
+    
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+        self.buckets = [0] * self.BUCKETS
+    
+    def add(self, seconds: float) -> None:
+        """Record one duration in seconds."""
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+        
+        bucket = min(int(seconds * 1e6).bit_length(), self.BUCKETS - 1)
+        self.buckets[bucket] += 1
+    
+    @property
+    def mean(self) -> float:
+        """Mean duration in seconds."""
+        return self.total / self.count if self.count else 0.0
+    
+    def percentile(self, fraction: float) -> float:
+        """
+        Estimate a percentile from the buckets.
+        
+        Args:
+            fraction: 0.5 for the median, 0.95 for p95, ...
+            
+        Returns:
+            Upper bound of the bucket holding the percentile, in seconds
+            (clamped to the observed maximum)
+        """
+        if not self.count:
+            return 0.0
+        
+        rank = fraction * self.count
+        seen = 0
+        for bucket, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank:
+                return min((1 << bucket) / 1e6, self.max)
+        return self.max
+    
+    def to_dict(self) -> Dict:
+        """Summary in milliseconds, with non-empty buckets keyed by upper bound (µs)."""
+        return {
+            'count': self.count,
+            'total_ms': round(self.total * 1000, 3),
+            'mean_ms': round(self.mean * 1000, 4),
+            'min_ms': round(self.min * 1000, 4) if self.count else 0.0,
+            'p50_ms': round(self.percentile(0.5) * 1000, 4),
+            'p95_ms': round(self.percentile(0.95) * 1000, 4),
+            'p99_ms': round(self.percentile(0.99) * 1000, 4),
+            'max_ms': round(self.max * 1000, 4),
+            'histogram_us': {
+                str(1 << bucket): count
+                for bucket, count in enumerate(self.buckets) if count
+            },
+        }
+
+
+class StageTimings:
+    """
+    Collects stage histograms of one run.
+    
+    Recording is thread-safe, so encode/write stages running on the
+    writer's thread pool can report into the same instance.
+    """
+    
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        """
+        Initialize StageTimings.
+        
+        Args:
+            clock: High-resolution clock (seconds)
+        """
+        self.clock = clock
+        self._stages: Dict[str, StageHistogram] = {}
+        self._lock = threading.Lock()
+        self._start = clock()
+    
+    def record(self, stage: str, seconds: float) -> None:
+        """Add one duration to a stage."""
+        with self._lock:
+            histogram = self._stages.get(stage)
+            if histogram is None:
+                histogram = self._stages[stage] = StageHistogram()
+            histogram.add(seconds)
+    
+    def wrap(self, stage: str, function: Callable) -> Callable:
+        """
+        Return a version of function that records its duration under stage.
+        
+        Args:
+            stage: Stage name
+            function: Callable to time
+            
+        Returns:
+            Timed callable with the same signature
+        """
+        clock = self.clock
+        record = self.record
+        
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record(stage, clock() - start)
+        
+        return timed
+    
+    def stages(self) -> Dict[str, StageHistogram]:
+        """Snapshot of the recorded stages."""
+        with self._lock:
+            return dict(self._stages)
+    
+    def busy_seconds(self) -> float:
+        """
+        Total time spent in the working stages, across all threads.
+        
+        Returns:
+            Seconds recorded outside WAIT_STAGES
+        """
+        return sum(
+            histogram.total
+            for stage, histogram in self.stages().items()
+            if stage not in WAIT_STAGES
+        )
+    
+    def summary(self, limit: int = 3) -> str:
+        """
+        One-line summary of the most expensive stages.
+        
+        Args:
+            limit: Number of stages to show
+            
+        Returns:
+            Text such as "decode 2.1ms • kodlama 5.3ms"
+        """
+        ranked = sorted(self.stages().items(), key=lambda item: -item[1].total)
+        return " • ".join(
+            f"{STAGE_LABELS.get(stage, stage)} {histogram.mean * 1000:.1f}ms"
+            for stage, histogram in ranked[:limit]
+        )
+    
+    def report(self) -> Dict:
+        """
+        Structured report of the run so far.
+        
+        Returns:
+            JSON-serializable dict with the wall time and every stage
+        """
+        return {
+            'wall_ms': round((self.clock() - self._start) * 1000, 3),
+            'stages': {
+                stage: histogram.to_dict()
+                for stage, histogram in sorted(self.stages().items())
+            },
+        }
+
+
+class _TimedFile:
+    """File wrapper recording the time spent in write() calls."""
+    
+    def __init__(self, file: BinaryIO, clock: Callable[[], float]):
+        self._file = file
+        self._clock = clock
+        self.elapsed = 0.0
+    
+    def write(self, data) -> int:
+        start = self._clock()
+        try:
+            return self._file.write(data)
+        finally:
+            self.elapsed += self._clock() - start
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._file, name)
+
+
+class TimedEncoder(FrameEncoder):
+    """
+    Encoder proxy recording 'encode' and 'write' stages.
+    
+    write() splits the wrapped encoder's write() into the time spent in
+    file.write() ('write') and everything else ('encode'). Only usable
+    with the thread writer backend, since timings stay in this process.
+    """
+    
+    def __init__(self, encoder: FrameEncoder, timings: StageTimings):
+        """
+        Initialize TimedEncoder.
+        
+        Args:
+            encoder: Encoder doing the actual work
+            timings: Receives the stage durations
+        """
+        self.encoder = encoder
+        self.timings = timings
+        self.extension = encoder.extension
+        self.lossless = encoder.lossless
+    
+    @property
+    def name(self) -> str:
+        return self.encoder.name
+    
+    def encode(self, frame: np.ndarray) -> Optional[bytes]:
+        clock = self.timings.clock
+        start = clock()
+        try:
+            return self.encoder.encode(frame)
+        finally:
+            self.timings.record('encode', clock() - start)
+    
+    def write(self, frame: np.ndarray, file: BinaryIO) -> bool:
+        clock = self.timings.clock
+        timed_file = _TimedFile(file, clock)
+        start = clock()
+        try:
+            return self.encoder.write(frame, timed_file)
+        finally:
+            total = clock() - start
+            self.timings.record('encode', total - timed_file.elapsed)
+            self.timings.record('write', timed_file.elapsed)
+
+
+def format_report(report: Dict) -> List[str]:
+    """
+    Render a StageTimings.report() as aligned text lines.
+    
+    Args:
+        report: Dict returned by StageTimings.report()
+        
+    Returns:
+        One line per stage, most expensive first
+    """
+    stages = sorted(report['stages'].items(), key=lambda item: -item[1]['total_ms'])
+    lines = [f"Toplam süre: {report['wall_ms'] / 1000:.2f} sn"]
+    for stage, data in stages:
+        lines.append(
+            f"  {STAGE_LABELS.get(stage, stage):<8} n={data['count']:<7} "
+            f"toplam={data['total_ms']:>10.1f}ms  ort={data['mean_ms']:.3f}ms  "
+            f"p95={data['p95_ms']:.3f}ms  max={data['max_ms']:.3f}ms"
+        )
+    return lines
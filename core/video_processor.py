@@ -7,20 +7,71 @@ Refactored to follow SOLID principles:
 - Dependency Inversion: Uses SignalProtocol abstraction
 """
 
+import bisect
 import os
+from contextlib import nullcontext
 import cv2
+import numpy as np
 from pathlib import Path
-from typing import Dict, Type
+from typing import (
+    Any, Callable, ContextManager, Dict, FrozenSet, List, Optional, Sequence, Tuple, Type, Union
+)
 
-from core.protocols import SignalProtocol
+from core.protocols import SignalProtocol, CancellationProtocol, ProcessingCancelled
+from core.checkpoint import Checkpoint, CheckpointJournal
+from core.encoders import FrameEncoder, JpegEncoder, create_encoder
+from core.frame_writer import FrameWriter, encode_and_write
+from core.frame_buffer import FrameRingBuffer
+from core.probe import VideoMetadata, probe_video
+from core.progress import ProgressReporter
+from core.sinks import SINKS, DirectorySink, FrameSink, create_sink
+from core.seeking import SeekPlanner, scan_keyframes
+from core.segments import (
+    plan_segments,
+    run_segments,
+    rename_segment_frames,
+    segment_frame_name
+)
+from core.timing import StageTimings, TimedEncoder
+from core.analysis import SharedAnalysis
 from core.strategies import (
     ExtractionStrategy,
     AllFramesStrategy,
     TimeRangeStrategy,
-    SceneChangeStrategy
+    SceneChangeStrategy,
+    IntervalStrategy,
+    MultiRangeStrategy,
+    DedupStrategy,
+    MotionStrategy
 )
 
 
+class _StrategyLane:
+    """One strategy of a shared decode pass with its own sink and counter."""
+    
+    def __init__(
+        self,
+        mode: str,
+        strategy: ExtractionStrategy,
+        wanted: Union[range, FrozenSet[int]],
+        sink: FrameSink
+    ):
+        """
+        Initialize a lane.
+        
+        Args:
+            mode: Mode name, also the output subfolder
+            strategy: The extraction strategy
+            wanted: Frame indices the strategy decides on
+            sink: Destination of the strategy's saved frames
+        """
+        self.mode = mode
+        self.strategy = strategy
+        self.wanted = wanted
+        self.sink = sink
+        self.saved_count = 0
+
+
 class VideoProcessor:
     """
     Processes video files and extracts frames based on a given strategy.
@@ -30,6 +81,7 @@ class VideoProcessor:
         output_dir: Directory for output frames
         strategy: The extraction strategy to use
         signals: Signal protocol for progress/status updates
+        cancel_token: Optional cancellation token polled once per frame
     """
     
     # Strategy registry - maps mode names to strategy classes
@@ -38,13 +90,36 @@ class VideoProcessor:
         'all': AllFramesStrategy,
         'range': TimeRangeStrategy,
         'scene': SceneChangeStrategy,
+        'interval': IntervalStrategy,
+        'ranges': MultiRangeStrategy,
+        'dedup': DedupStrategy,
+        'motion': MotionStrategy,
     }
     
+    # Output format for saved frames (key of core.encoders.ENCODERS)
+    OUTPUT_FORMAT = 'jpg'
+    
+    # Output sink (key of core.sinks.SINKS)
+    OUTPUT_SINK = 'directory'
+    
     # JPEG quality for saved frames
-    JPEG_QUALITY = 95
+    JPEG_QUALITY = JpegEncoder.DEFAULT_QUALITY
+    
+    # Encode/write pool defaults (0 workers = CPU count)
+    WRITER_WORKERS = 0
+    WRITER_BACKEND = 'thread'
     
-    # Status update interval (frames)
-    STATUS_UPDATE_INTERVAL = 50
+    # Maximum progress/status updates per second
+    PROGRESS_MAX_HZ = ProgressReporter.MAX_HZ
+    
+    # Segment-parallel extraction (1 = single process, 0 = CPU count)
+    SEGMENTS = 1
+    
+    # Count frames with a container scan instead of trusting the header
+    EXACT_FRAME_COUNT = False
+    
+    # Record per-stage timing histograms (see core.timing)
+    COLLECT_TIMINGS = False
     
     def __init__(
         self, 
@@ -52,6 +127,17 @@ class VideoProcessor:
         output_dir: str, 
         mode: str, 
         signals: SignalProtocol,
+        workers: int = WRITER_WORKERS,
+        writer_backend: str = WRITER_BACKEND,
+        cancel_token: Optional[CancellationProtocol] = None,
+        segments: int = SEGMENTS,
+        output_format: str = OUTPUT_FORMAT,
+        encoder_options: Optional[Dict] = None,
+        output_sink: str = OUTPUT_SINK,
+        sink_options: Optional[Dict] = None,
+        exact_frame_count: bool = EXACT_FRAME_COUNT,
+        timings: bool = COLLECT_TIMINGS,
+        profiler: Optional[ContextManager] = None,
         **kwargs
     ):
         """
@@ -60,16 +146,79 @@ class VideoProcessor:
         Args:
             video_path: Path to the video file
             output_dir: Output directory (empty string for auto-desktop)
-            mode: Extraction mode ('all', 'range', 'scene')
+            mode: Extraction mode ('all', 'range', 'scene', 'interval', 'ranges',
+                'dedup', 'motion'), or several comma-separated modes sharing one
+                decode pass (e.g. 'scene,interval'), each saved into its own subfolder
             signals: Object implementing SignalProtocol for updates
+            workers: Encode/write pool size (0 = CPU count)
+            writer_backend: Encode/write pool type ('thread' or 'process')
+            cancel_token: Object implementing CancellationProtocol (optional)
+            segments: Number of processes decoding keyframe-aligned
+                segments of the video in parallel (1 = disabled, 0 = CPU count)
+            output_format: Output format ('jpg', 'webp', 'png', 'npy', 'raw')
+            encoder_options: Encoder options such as 'quality' or 'compression'
+            output_sink: Where frames are stored ('directory', 'zip', 'tensor'
+                or 'store')
+            sink_options: Sink options such as 'store_dir' or 'materialize'
+            exact_frame_count: Count frames with a demux-only container scan
+            timings: Record per-stage timing histograms; the result is
+                available as timing_report after run()
+            profiler: Context manager wrapped around the decode loop,
+                e.g. cProfile.Profile() (optional)
             **kwargs: Additional parameters for the strategy
+            
+        Raises:
+            ValueError: If output_format is not recognized
         """
         self.video_path = video_path
         self.output_dir = output_dir
         self.mode = mode
+        self.modes = self.split_modes(mode)
         self.signals = signals
+        self.workers = workers
+        self.writer_backend = writer_backend
+        self.cancel_token = cancel_token
+        self.segments = segments if segments > 0 else (os.cpu_count() or 1)
+        self.output_format = output_format
+        self.encoder_options = dict(encoder_options or {})
+        self.encoder = self._create_encoder()
+        self.output_sink = output_sink
+        self.sink_options = dict(sink_options or {})
+        self.exact_frame_count = exact_frame_count
+        self.timings: Optional[StageTimings] = StageTimings() if timings else None
+        self.timing_report: Optional[Dict] = None
+        self.profiler = profiler
         self.kwargs = kwargs
     
+    @staticmethod
+    def split_modes(mode: str) -> List[str]:
+        """
+        Split a comma-separated mode list, dropping duplicates.
+        
+        Args:
+            mode: One mode or several, e.g. 'scene,interval'
+            
+        Returns:
+            Mode names in the given order
+        """
+        modes = [name.strip() for name in mode.split(',') if name.strip()]
+        return list(dict.fromkeys(modes)) or [mode]
+    
+    def _create_encoder(self) -> FrameEncoder:
+        """
+        Create the output encoder for saved frames.
+        
+        Returns:
+            FrameEncoder instance
+            
+        Raises:
+            ValueError: If output_format is not recognized
+        """
+        options = dict(self.encoder_options)
+        if self.output_format == 'jpg':
+            options.setdefault('quality', self.JPEG_QUALITY)
+        return create_encoder(self.output_format, **options)
+    
     def _setup_output_directory(self) -> Path:
         """
         Create output directory if not specified.
@@ -87,13 +236,19 @@ class VideoProcessor:
         os.makedirs(output_path, exist_ok=True)
         return output_path
     
-    def _create_strategy(self, fps: float, total_frames: int) -> ExtractionStrategy:
+    def _create_strategy(
+        self,
+        fps: float,
+        total_frames: int,
+        mode: Optional[str] = None
+    ) -> ExtractionStrategy:
         """
         Factory method to create the appropriate strategy.
         
         Args:
             fps: Video frames per second
             total_frames: Total number of frames
+            mode: Mode to create (default: the first of self.modes)
             
         Returns:
             ExtractionStrategy instance
@@ -101,15 +256,65 @@ class VideoProcessor:
         Raises:
             ValueError: If mode is not recognized
         """
-        strategy_class = self.STRATEGIES.get(self.mode)
+        mode = mode or self.modes[0]
+        strategy_class = self.STRATEGIES.get(mode)
         
         if strategy_class is None:
             available = ', '.join(self.STRATEGIES.keys())
             raise ValueError(
-                f"Unknown mode: '{self.mode}'. Available modes: {available}"
+                f"Unknown mode: '{mode}'. Available modes: {available}"
             )
         
-        return strategy_class(fps=fps, total_frames=total_frames, **self.kwargs)
+        strategy_kwargs = {'video_path': self.video_path}
+        strategy_kwargs.update(self.kwargs)
+        
+        return strategy_class(fps=fps, total_frames=total_frames, **strategy_kwargs)
+    
+    def _probe(self) -> VideoMetadata:
+        """
+        Read video properties through the shared, cached metadata probe.
+        
+        Returns:
+            VideoMetadata instance
+            
+        Raises:
+            IOError: If video cannot be opened
+        """
+        return probe_video(self.video_path, self.exact_frame_count)
+    
+    def _open_capture(self) -> cv2.VideoCapture:
+        """
+        Open the video file.
+        
+        Returns:
+            Opened VideoCapture
+            
+        Raises:
+            IOError: If video cannot be opened
+        """
+        cap = cv2.VideoCapture(self.video_path)
+        
+        if not cap.isOpened():
+            raise IOError(
+                "Video dosyası açılamadı. Dosya yolu veya format bozuk olabilir."
+            )
+        
+        return cap
+    
+    @staticmethod
+    def _frame_bounds(strategy: ExtractionStrategy, total_frames: int) -> Tuple[int, int]:
+        """
+        Return the frame range a strategy can save from.
+        For time range modes, only frames inside the ranges are visited.
+        
+        Returns:
+            Tuple of (start_frame, end_frame)
+        """
+        if isinstance(strategy, TimeRangeStrategy):
+            return strategy.start_frame, strategy.end_frame
+        if isinstance(strategy, MultiRangeStrategy) and strategy.ranges:
+            return strategy.ranges[0][0], strategy.ranges[-1][1]
+        return 0, total_frames
     
     def _save_frame(self, frame, save_path: str) -> bool:
         """
@@ -122,107 +327,818 @@ class VideoProcessor:
         Returns:
             True if save was successful, False otherwise
         """
-        # Encode frame to JPEG in memory
-        encode_params = [cv2.IMWRITE_JPEG_QUALITY, self.JPEG_QUALITY]
-        is_success, buffer = cv2.imencode(".jpg", frame, encode_params)
+        return encode_and_write(frame, save_path, self._output_encoder())
+    
+    def _output_encoder(self) -> FrameEncoder:
+        """
+        Return the encoder used for saved frames, recording encode and
+        write stages when timings are enabled.
+        """
+        if self.timings is None or self.writer_backend != 'thread':
+            # Process workers cannot report back into this process's timings
+            return self.encoder
+        return TimedEncoder(self.encoder, self.timings)
+    
+    def _plan_frames(
+        self,
+        strategy: ExtractionStrategy,
+        fps: float,
+        start_frame: int,
+        end_frame: int
+    ) -> Tuple[Sequence[int], SeekPlanner]:
+        """
+        Determine which frames to visit and how to move between them.
         
-        if not is_success:
-            return False
+        Strategies that know their frames in advance get a planner backed by
+        the container's keyframe index; all others visit every frame in
+        [start_frame, end_frame) and only need a distance-based seek.
         
-        # Write buffer to file (handles Unicode paths correctly)
-        with open(save_path, "wb") as f:
-            f.write(buffer)
+        Args:
+            strategy: The extraction strategy
+            fps: Video frames per second
+            start_frame: First frame to consider
+            end_frame: Frame index to stop before
+            
+        Returns:
+            Tuple of (sorted frame indices, SeekPlanner)
+        """
+        planned = strategy.planned_frames()
         
-        return True
+        if planned is None:
+            return range(start_frame, end_frame), SeekPlanner(fps=fps)
+        
+        frame_indices = sorted(
+            {i for i in planned if start_frame <= i < end_frame}
+        )
+        return frame_indices, SeekPlanner.from_video(self.video_path, fps)
     
-    def run(self) -> str:
+    @staticmethod
+    def _expected_frames(
+        strategy: ExtractionStrategy,
+        frame_indices: Union[Sequence[int], FrozenSet[int]]
+    ) -> int:
         """
-        Execute the frame extraction process.
+        Number of frames the strategy will save, if known before decoding.
+        
+        Planned frame sets and index-only strategies save every frame they
+        visit. Pixel-based strategies on a dense scan save an unknown
+        fraction, so sinks must not preallocate for the whole video.
         
+        Args:
+            strategy: The extraction strategy
+            frame_indices: Frames the strategy visits (a range for dense scans)
+            
         Returns:
-            Success message with extraction details
+            Frame count, or 0 if unknown
+        """
+        if isinstance(frame_indices, range) and strategy.needs_pixels:
+            return 0
+        return len(frame_indices)
+    
+    def _frame_path(self, output_path: Path, number: int) -> str:
+        """
+        Build the deterministic file name of a saved frame.
+        
+        Args:
+            output_path: Output directory
+            number: 1-based saved frame number
+            
+        Returns:
+            Full path as string
+        """
+        return str(output_path / DirectorySink.frame_name(number, self.encoder.extension))
+    
+    def _create_sink(
+        self,
+        strategy: ExtractionStrategy,
+        output_path: Path,
+        fps: float,
+        expected_frames: int,
+        writer: Optional[FrameWriter] = None
+    ) -> FrameSink:
+        """
+        Create the output sink, routing frames into per-group subfolders
+        when the strategy groups its output and frames go to a directory.
+        
+        Args:
+            strategy: The extraction strategy
+            output_path: Output directory
+            fps: Video frames per second
+            expected_frames: Estimated number of frames to save
+            writer: Encode/write pool shared with other sinks (default: a new one)
+            
+        Returns:
+            FrameSink instance
+        """
+        writer = writer if writer is not None else self._create_writer()
+        
+        if not (strategy.groups_output and self.output_sink == 'directory'):
+            return create_sink(
+                self.output_sink, output_path, writer, fps, expected_frames,
+                **self.sink_options
+            )
+        
+        created = set()
+        
+        def name_frame(number: int, frame_index: int) -> str:
+            group = strategy.output_group(frame_index)
+            if group is None:
+                return self._frame_path(output_path, number)
+            
+            if group not in created:
+                (output_path / group).mkdir(exist_ok=True)
+                created.add(group)
+            return self._frame_path(output_path / group, number)
+        
+        return DirectorySink(output_path, writer, fps, expected_frames, name_frame=name_frame)
+    
+    def _flush_batch(
+        self,
+        strategy: ExtractionStrategy,
+        batch: FrameRingBuffer,
+        sink: FrameSink,
+        saved_count: int
+    ) -> int:
+        """
+        Run select_batch() on buffered frames and queue the selected ones.
+        
+        Args:
+            strategy: The extraction strategy
+            batch: Buffer holding the decoded frames
+            sink: Destination of saved frames
+            saved_count: Frames saved before this batch
+            
+        Returns:
+            Updated saved frame count
+        """
+        mask = self._timed('analysis', strategy.select_batch)(batch.frames, batch.indices)
+        add = self._timed('sink', sink.add)
+        
+        for slot in np.flatnonzero(mask):
+            saved_count += 1
+            # Copy out of the ring buffer; its slots are reused
+            add(batch.frames[slot].copy(), saved_count, batch.indices[slot])
+        
+        batch.clear()
+        return saved_count
+    
+    def _timed(self, stage: str, function: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Return function timed under stage, or function itself when timings
+        are disabled. Call outside the per-frame loop and keep the result.
+        """
+        if self.timings is None:
+            return function
+        return self.timings.wrap(stage, function)
+    
+    def _is_cancelled(self) -> bool:
+        """Check whether cancellation was requested."""
+        return self.cancel_token is not None and self.cancel_token.is_cancelled()
+    
+    def _create_writer(self) -> FrameWriter:
+        """
+        Create the bounded encode/write pool for this run.
+        
+        Returns:
+            FrameWriter instance
+        """
+        return FrameWriter(
+            encoder=self._output_encoder(),
+            workers=self.workers,
+            backend=self.writer_backend
+        )
+    
+    def _extract(
+        self,
+        cap: cv2.VideoCapture,
+        strategy: ExtractionStrategy,
+        frame_indices: Sequence[int],
+        planner: SeekPlanner,
+        sink: FrameSink,
+        reporter: ProgressReporter,
+        position: int = 0,
+        journal: Optional[CheckpointJournal] = None,
+        saved_count: int = 0,
+        processed_count: int = 0
+    ) -> int:
+        """
+        Decode the given frames and queue the ones the strategy selects.
+        
+        Args:
+            cap: Opened VideoCapture
+            strategy: The extraction strategy (already reset)
+            frame_indices: Sorted frame indices to visit
+            planner: Seek planner used to move between frames
+            sink: Destination of saved frames
+            reporter: Receives the processed frame count
+            position: Index of the next frame cap.read() returns
+            journal: Checkpoint journal to commit progress to (optional)
+            saved_count: Frames saved before the first index (on resume)
+            processed_count: Frames processed before the first index (on resume)
+            
+        Returns:
+            Total number of frames saved
             
         Raises:
-            IOError: If video cannot be opened
+            ProcessingCancelled: If the cancellation token was set
         """
-        output_path = self._setup_output_directory()
-        video_name = Path(self.video_path).name
+        needs_pixels = strategy.needs_pixels
         
-        self.signals.emit_status(f"Video açılıyor: {video_name}")
+        # Batch strategies get frames decoded into a reused ring buffer
+        batch = None
+        if needs_pixels and strategy.batch_size > 1:
+            batch = FrameRingBuffer(strategy.batch_size)
         
-        # Open video file
-        cap = cv2.VideoCapture(self.video_path)
+        # Bind the per-frame calls once; they are only wrapped when timing
+        advance = self._timed('seek', planner.advance)
+        read = self._timed('decode', cap.read)
+        grab = self._timed('decode', cap.grab)
+        retrieve = self._timed('decode', cap.retrieve)
+        should_save_frame = self._timed('analysis', strategy.should_save_frame)
+        add = self._timed('sink', sink.add)
+        read_batch = self._timed('decode', batch.read) if batch is not None else None
         
-        if not cap.isOpened():
-            raise IOError(
-                "Video dosyası açılamadı. Dosya yolu veya format bozuk olabilir."
-            )
+        for frame_index in frame_indices:
+            # Buffered frames are not yet reflected in the strategy state,
+            # so a checkpoint resumes from the first of them
+            next_frame = batch.indices[0] if batch is not None and len(batch) else frame_index
+            
+            if self._is_cancelled():
+                if journal is not None:
+                    # Keep everything decoded so far for a resumed run
+                    self._commit(journal, sink, strategy, next_frame, saved_count)
+                else:
+                    # Drop queued frames; in-flight writes finish in close()
+                    sink.cancel()
+                raise ProcessingCancelled("İşlem iptal edildi.")
+            
+            if journal is not None and next_frame == frame_index and journal.due():
+                self._commit(journal, sink, strategy, next_frame, saved_count)
+            
+            # Seek or grab() past skipped frames without decoding them
+            if position != frame_index:
+                position = advance(cap, position, frame_index)
+                if position != frame_index:
+                    break
+            
+            if batch is not None:
+                if not read_batch(cap, frame_index):
+                    break
+                position += 1
+                processed_count += 1
+                
+                if batch.full:
+                    saved_count = self._flush_batch(strategy, batch, sink, saved_count)
+                
+                reporter.update(processed_count)
+                continue
+            
+            if needs_pixels:
+                ret, frame = read()
+            else:
+                # Index-only strategy: skip pixel conversion until needed
+                ret, frame = grab(), None
+            if not ret:
+                break
+            position += 1
+            
+            # Ask strategy if this frame should be saved
+            if should_save_frame(frame, frame_index):
+                if frame is None:
+                    ret, frame = retrieve()
+                    if not ret:
+                        break
+                saved_count += 1
+                add(frame, saved_count, frame_index)
+            
+            processed_count += 1
+            
+            # Throttled: emits only on percentage change or at PROGRESS_MAX_HZ
+            reporter.update(processed_count)
+        
+        if batch is not None and len(batch) > 0:
+            saved_count = self._flush_batch(strategy, batch, sink, saved_count)
+        
+        return saved_count
+    
+    @staticmethod
+    def _commit(
+        journal: CheckpointJournal,
+        sink: FrameSink,
+        strategy: ExtractionStrategy,
+        next_frame: int,
+        saved_count: int
+    ) -> None:
+        """
+        Wait for queued frames to reach disk, then write a checkpoint.
+        
+        Args:
+            journal: Checkpoint journal
+            sink: Destination of saved frames
+            strategy: The extraction strategy
+            next_frame: First frame index not yet processed
+            saved_count: Frames saved before next_frame
+        """
+        sink.flush()
+        journal.save(next_frame, saved_count, strategy.get_state())
+    
+    def _open_journal(self, output_path: Path) -> Optional[CheckpointJournal]:
+        """
+        Create the checkpoint journal if the output sink can resume.
+        Appending sinks (zip, tensor) always start over.
+        
+        Args:
+            output_path: Output directory
+            
+        Returns:
+            CheckpointJournal instance, or None
+        """
+        sink_class = SINKS.get(self.output_sink)
+        if sink_class is None or not sink_class.RESUMABLE:
+            return None
+        
+        params_hash = CheckpointJournal.make_params_hash(
+            self.video_path,
+            mode=self.mode,
+            kwargs=self.kwargs,
+            output_format=self.output_format,
+            encoder_options=self.encoder_options
+        )
+        return CheckpointJournal(output_path, params_hash)
+    
+    def _resume(
+        self,
+        strategy: ExtractionStrategy,
+        checkpoint: Checkpoint,
+        frame_indices: Sequence[int]
+    ) -> Tuple[int, int]:
+        """
+        Restore a checkpoint of an interrupted run.
+        
+        Args:
+            strategy: The extraction strategy (already reset)
+            checkpoint: Checkpoint loaded from the journal
+            frame_indices: Sorted frame indices of the full run
+            
+        Returns:
+            Tuple of (frames already saved, frames to skip in frame_indices)
+        """
+        strategy.set_state(checkpoint.strategy_state)
+        skipped = bisect.bisect_left(frame_indices, checkpoint.next_frame)
+        
+        self.signals.emit_status(
+            f"Kaldığı yerden devam ediliyor: Frame {checkpoint.next_frame} "
+            f"({checkpoint.saved_count} frame kayıtlı)"
+        )
+        return checkpoint.saved_count, skipped
+    
+    def run_segment(
+        self,
+        output_path: Path,
+        start_frame: int,
+        end_frame: int,
+        reporter
+    ) -> List[int]:
+        """
+        Extract one segment of the video; runs inside a worker process.
+        
+        Stateful strategies (those that need pixels) are primed with the
+        frame before the segment, so a cut on the boundary is not lost.
+        Frames are written under temporary names carrying their global frame
+        index and renamed into sequential order once all segments finished.
+        
+        Args:
+            output_path: Output directory
+            start_frame: First frame of the segment
+            end_frame: Frame index to stop before
+            reporter: Object with update(processed) receiving progress
+            
+        Returns:
+            Frame indices that were saved
+        """
+        cap = self._open_capture()
+        saved_indices: List[int] = []
+        
+        def name_frame(number: int, frame_index: int) -> str:
+            saved_indices.append(frame_index)
+            return str(output_path / segment_frame_name(frame_index, self.encoder.extension))
+        
+        sink = DirectorySink(output_path, self._create_writer(), name_frame=name_frame)
         
         try:
-            # Get video properties
-            total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-            fps = cap.get(cv2.CAP_PROP_FPS)
+            metadata = self._probe()
+            fps = metadata.fps
+            strategy = self._create_strategy(fps, metadata.frame_count)
+            strategy.reset()
+            planner = SeekPlanner(fps=fps)
             
-            # Validate FPS (some videos report invalid values)
-            if fps is None or fps <= 0 or fps > 1000:
-                fps = 30.0
+            position = 0
+            if start_frame > 0 and strategy.needs_pixels:
+                # One-frame overlap: the decision on it is discarded
+                position = planner.advance(cap, position, start_frame - 1)
+                ret, frame = cap.read()
+                if ret:
+                    strategy.should_save_frame(frame, start_frame - 1)
+                    position += 1
             
-            # Create extraction strategy
+            self._extract(
+                cap, strategy, range(start_frame, end_frame), planner,
+                sink, reporter, position
+            )
+            sink.flush()
+        
+        finally:
+            sink.close()
+            cap.release()
+        
+        return saved_indices
+    
+    def _run_segmented(
+        self,
+        output_path: Path,
+        fps: float,
+        start_frame: int,
+        end_frame: int
+    ) -> int:
+        """
+        Split [start_frame, end_frame) into keyframe-aligned segments and
+        decode them in parallel worker processes.
+        
+        Args:
+            output_path: Output directory
+            fps: Video frames per second
+            start_frame: First frame to consider
+            end_frame: Frame index to stop before
+            
+        Returns:
+            Number of frames saved
+            
+        Raises:
+            ProcessingCancelled: If the cancellation token was set
+        """
+        segments = plan_segments(
+            start_frame, end_frame, self.segments, scan_keyframes(self.video_path)
+        )
+        self.signals.emit_status(f"{len(segments)} segment paralel işleniyor...")
+        
+        reporter = ProgressReporter(
+            self.signals, end_frame - start_frame, max_hz=self.PROGRESS_MAX_HZ
+        )
+        
+        saved_indices = run_segments(
+            self, output_path, segments, reporter, self._is_cancelled
+        )
+        if saved_indices is None:
+            raise ProcessingCancelled("İşlem iptal edildi.")
+        
+        self.signals.emit_status("Segmentler birleştiriliyor...")
+        return rename_segment_frames(
+            output_path, saved_indices, self.encoder.extension,
+            lambda number: self._frame_path(output_path, number)
+        )
+    
+    def _run_strategy(
+        self,
+        cap: cv2.VideoCapture,
+        output_path: Path,
+        fps: float,
+        total_frames: int
+    ) -> Tuple[int, Path, str]:
+        """
+        Run a single strategy, resuming from a checkpoint if one exists.
+        
+        Args:
+            cap: Opened VideoCapture
+            output_path: Output directory
+            fps: Video frames per second
+            total_frames: Total number of frames
+            
+        Returns:
+            Tuple of (frames saved, output location, location label)
+        """
+        sink = None
+        
+        try:
             strategy = self._create_strategy(fps, total_frames)
             strategy.reset()
             
             self.signals.emit_status(f"Strateji: {strategy.name}")
             
-            # For time range mode, optimize by seeking to start frame
-            start_frame = 0
-            end_frame = total_frames
+            start_frame, end_frame = self._frame_bounds(strategy, total_frames)
+            
+            if isinstance(strategy, TimeRangeStrategy) and start_frame > 0:
+                self.signals.emit_status(
+                    f"Zaman aralığı: Frame {start_frame} - {end_frame}"
+                )
+            
+            if isinstance(strategy, MultiRangeStrategy):
+                self.signals.emit_status(
+                    f"{len(strategy.ranges)} zaman aralığı: Frame {start_frame} - {end_frame}"
+                )
+            
+            frame_indices, planner = self._plan_frames(
+                strategy, fps, start_frame, end_frame
+            )
+            
+            journal = self._open_journal(output_path)
+            checkpoint = journal.load() if journal is not None else None
             
-            if isinstance(strategy, TimeRangeStrategy):
-                start_frame = strategy.start_frame
-                end_frame = strategy.end_frame
+            # Dense scans of long videos can be split across processes;
+            # sparse plans are already cheap and stay in this process.
+            # Segments write flat per-frame files, so archive sinks and
+            # grouped output run here too, as do strategies that need the
+            # whole history to decide
+            if (
+                self.segments > 1
+                and isinstance(frame_indices, range)
+                and strategy.segmentable
+                and self.output_sink == 'directory'
+                and not strategy.groups_output
+                and checkpoint is None
+            ):
+                cap.release()
+                output_location, location_label = output_path, DirectorySink.LOCATION_LABEL
+                saved_count = self._run_segmented(
+                    output_path, fps, start_frame, end_frame
+                )
+            else:
+                sink = self._create_sink(
+                    strategy, output_path, fps,
+                    self._expected_frames(strategy, frame_indices)
+                )
+                output_location = sink.location
+                location_label = sink.LOCATION_LABEL
+                
+                saved_count, skipped = 0, 0
+                if checkpoint is not None:
+                    saved_count, skipped = self._resume(strategy, checkpoint, frame_indices)
                 
-                # Seek to start frame
-                if start_frame > 0:
-                    cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
-                    self.signals.emit_status(
-                        f"Zaman aralığı: Frame {start_frame} - {end_frame}"
+                # Calculate frames to process for accurate progress
+                reporter = ProgressReporter(
+                    self.signals, len(frame_indices), max_hz=self.PROGRESS_MAX_HZ,
+                    initial=skipped, timings=self.timings
+                )
+                
+                with self.profiler if self.profiler is not None else nullcontext():
+                    saved_count = self._extract(
+                        cap, strategy, frame_indices[skipped:], planner, sink, reporter,
+                        journal=journal, saved_count=saved_count, processed_count=skipped
                     )
+                
+                # Let the strategy persist analysis results
+                strategy.finish()
+                
+                # Wait for the encode/write pool to finish queued frames
+                self._timed('flush', sink.flush)()
             
-            # Calculate frames to process for accurate progress
-            frames_to_process = end_frame - start_frame
-            
-            saved_count = 0
-            frame_index = start_frame
-            processed_count = 0
+            if journal is not None:
+                journal.clear()
+        
+        finally:
+            if sink is not None:
+                sink.close()
+        
+        return saved_count, output_location, location_label
+    
+    def _run_shared(
+        self,
+        cap: cv2.VideoCapture,
+        output_path: Path,
+        fps: float,
+        total_frames: int
+    ) -> int:
+        """
+        Run several strategies over one decode pass.
+        
+        Every strategy gets its own sink in a subfolder named after its
+        mode and its own saved frame numbering. The sinks share one
+        encode/write pool and the strategies share per-frame analysis
+        artefacts. Checkpoints and segment-parallel decoding are only
+        used for single-strategy runs.
+        
+        Args:
+            cap: Opened VideoCapture
+            output_path: Output directory
+            fps: Video frames per second
+            total_frames: Total number of frames
             
-            while frame_index < end_frame:
-                ret, frame = cap.read()
-                if not ret:
-                    break
+        Returns:
+            Total number of frames saved
+        """
+        analysis = SharedAnalysis()
+        writer = self._create_writer()
+        lanes: List[_StrategyLane] = []
+        
+        try:
+            for mode in self.modes:
+                strategy = self._create_strategy(fps, total_frames, mode)
+                strategy.reset()
+                strategy.analysis = analysis
                 
-                # Ask strategy if this frame should be saved
-                if strategy.should_save_frame(frame, frame_index):
-                    saved_count += 1
-                    save_path = str(output_path / f"frame_{saved_count:06d}.jpg")
-                    self._save_frame(frame, save_path)
+                start_frame, end_frame = self._frame_bounds(strategy, total_frames)
+                planned = strategy.planned_frames()
+                if planned is None:
+                    wanted = range(start_frame, end_frame)
+                else:
+                    wanted = frozenset(i for i in planned if start_frame <= i < end_frame)
                 
-                frame_index += 1
-                processed_count += 1
+                mode_path = output_path / mode
+                mode_path.mkdir(exist_ok=True)
+                sink = self._create_sink(
+                    strategy, mode_path, fps, self._expected_frames(strategy, wanted), writer
+                )
+                lanes.append(_StrategyLane(mode, strategy, wanted, sink))
+            
+            self.signals.emit_status(
+                "Ortak decode: " + " + ".join(lane.strategy.name for lane in lanes)
+            )
+            
+            frame_indices, planner = self._plan_shared(lanes, fps)
+            reporter = ProgressReporter(
+                self.signals, len(frame_indices), max_hz=self.PROGRESS_MAX_HZ,
+                timings=self.timings
+            )
+            
+            with self.profiler if self.profiler is not None else nullcontext():
+                self._extract_shared(cap, lanes, frame_indices, planner, analysis, reporter)
+            
+            for lane in lanes:
+                lane.strategy.finish()
+                self._timed('flush', lane.sink.flush)()
+        
+        finally:
+            for lane in lanes:
+                lane.sink.close()
+            writer.close()
+        
+        self.signals.emit_status(
+            " • ".join(f"{lane.mode}: {lane.saved_count} frame" for lane in lanes)
+        )
+        return sum(lane.saved_count for lane in lanes)
+    
+    def _plan_shared(
+        self,
+        lanes: Sequence[_StrategyLane],
+        fps: float
+    ) -> Tuple[Sequence[int], SeekPlanner]:
+        """
+        Determine the frames a shared pass visits: the union of every
+        strategy's planned frames, or a dense span if any strategy needs
+        to see every frame in its bounds.
+        
+        Args:
+            lanes: Strategies of the pass
+            fps: Video frames per second
+            
+        Returns:
+            Tuple of (sorted frame indices, SeekPlanner)
+        """
+        if all(isinstance(lane.wanted, frozenset) for lane in lanes):
+            frame_indices = sorted(frozenset().union(*(lane.wanted for lane in lanes)))
+            return frame_indices, SeekPlanner.from_video(self.video_path, fps)
+        
+        start_frame, end_frame = None, 0
+        for lane in lanes:
+            wanted = lane.wanted
+            if not wanted:
+                continue
+            if isinstance(wanted, range):
+                first, last = wanted[0], wanted[-1]
+            else:
+                first, last = min(wanted), max(wanted)
+            start_frame = first if start_frame is None else min(start_frame, first)
+            end_frame = max(end_frame, last + 1)
+        
+        return range(start_frame or 0, end_frame), SeekPlanner(fps=fps)
+    
+    def _extract_shared(
+        self,
+        cap: cv2.VideoCapture,
+        lanes: Sequence[_StrategyLane],
+        frame_indices: Sequence[int],
+        planner: SeekPlanner,
+        analysis: SharedAnalysis,
+        reporter: ProgressReporter
+    ) -> None:
+        """
+        Decode the given frames once and let every strategy that wants a
+        frame decide on it. Strategies decide frame by frame; batch
+        analysis is only used by single-strategy runs.
+        
+        Args:
+            cap: Opened VideoCapture
+            lanes: Strategies (already reset) with their sinks
+            frame_indices: Sorted frame indices to visit
+            planner: Seek planner used to move between frames
+            analysis: Artefact cache shared by the strategies
+            reporter: Receives the processed frame count
+            
+        Raises:
+            ProcessingCancelled: If the cancellation token was set
+        """
+        needs_pixels = any(lane.strategy.needs_pixels for lane in lanes)
+        
+        advance = self._timed('seek', planner.advance)
+        read = self._timed('decode', cap.read)
+        grab = self._timed('decode', cap.grab)
+        retrieve = self._timed('decode', cap.retrieve)
+        
+        # (wanted, needs pixels, decide, add, lane) bound once per lane
+        deciders = [
+            (
+                lane.wanted,
+                lane.strategy.needs_pixels,
+                self._timed('analysis', lane.strategy.should_save_frame),
+                self._timed('sink', lane.sink.add),
+                lane
+            )
+            for lane in lanes
+        ]
+        
+        position, processed_count = 0, 0
+        
+        for frame_index in frame_indices:
+            if self._is_cancelled():
+                for lane in lanes:
+                    lane.sink.cancel()
+                raise ProcessingCancelled("İşlem iptal edildi.")
+            
+            if position != frame_index:
+                position = advance(cap, position, frame_index)
+                if position != frame_index:
+                    break
+            
+            if needs_pixels:
+                ret, frame = read()
+            else:
+                ret, frame = grab(), None
+            if not ret:
+                break
+            position += 1
+            
+            for wanted, lane_needs_pixels, should_save_frame, add, lane in deciders:
+                if frame_index not in wanted:
+                    continue
                 
-                # Update progress based on frames to process, not total
-                if frames_to_process > 0:
-                    progress = int((processed_count / frames_to_process) * 100)
-                    self.signals.emit_progress(progress)
-                    
-                    if processed_count % self.STATUS_UPDATE_INTERVAL == 0:
-                        self.signals.emit_status(
-                            f"İşleniyor... Frame {processed_count}/{frames_to_process}"
-                        )
+                if should_save_frame(frame if lane_needs_pixels else None, frame_index):
+                    if frame is None:
+                        ret, frame = retrieve()
+                        if not ret:
+                            break
+                    lane.saved_count += 1
+                    # Sinks only read the frame, so one decode serves all
+                    add(frame, lane.saved_count, frame_index)
+            
+            if not ret:
+                break
+            
+            analysis.clear()
+            processed_count += 1
+            reporter.update(processed_count)
+    
+    def run(self) -> str:
+        """
+        Execute the frame extraction process.
+        
+        Returns:
+            Success message with extraction details
+            
+        Raises:
+            IOError: If video cannot be opened
+            ProcessingCancelled: If the cancellation token was set
+        """
+        output_path = self._setup_output_directory()
+        video_name = Path(self.video_path).name
+        
+        self.signals.emit_status(f"Video açılıyor: {video_name}")
+        
+        # Open video file
+        cap = self._open_capture()
+        
+        try:
+            metadata = self._probe()
+            fps, total_frames = metadata.fps, metadata.frame_count
+            
+            if len(self.modes) > 1:
+                # Several strategies share one decode stream
+                output_location, location_label = output_path, DirectorySink.LOCATION_LABEL
+                saved_count = self._run_shared(cap, output_path, fps, total_frames)
+            else:
+                saved_count, output_location, location_label = self._run_strategy(
+                    cap, output_path, fps, total_frames
+                )
         
         finally:
             cap.release()
+            
+            if self.timings is not None:
+                # Also kept for cancelled and failed runs
+                self.timing_report = self.timings.report()
+        
+        if self.timings is not None:
+            self.signals.emit_status(f"Aşama süreleri: {self.timings.summary()}")
         
         return (
-            f"İşlem tamamlandı! '{output_path}' klasörüne "
+            f"İşlem tamamlandı! '{output_location}' {location_label} "
             f"{saved_count} adet frame kaydedildi."
-        )
\ No newline at end of file
+        )
@@ -51,6 +51,11 @@ def main():
     backend = Backend()
     engine.rootContext().setContextProperty("backend", backend)
     
+    # Serve filmstrip thumbnails as image://filmstrip/... URLs
+    engine.addImageProvider(
+        backend.thumbnail_provider.PROVIDER_ID, backend.thumbnail_provider
+    )
+    
     # Add QML import paths
     qml_dir = Path(__file__).parent / "qml"
     engine.addImportPath(str(qml_dir))
@@ -11,12 +11,43 @@ ApplicationWindow {
     
     visible: true
     width: 980
-    height: 780
+    height: 910
     minimumWidth: 950
-    minimumHeight: 750
+    minimumHeight: 880
     
     title: "Frame Extractor"
     
+    // Extraction mode chosen in the options card
+    function selectedMode() {
+        if (radioTimeRange.checked) return "range";
+        if (radioSceneChange.checked) return "scene";
+        if (radioInterval.checked) return "interval";
+        if (radioMultiRange.checked) return "ranges";
+        if (radioDedup.checked) return "dedup";
+        if (radioMotion.checked) return "motion";
+        return "all";
+    }
+    
+    // Show how many frames scene mode would save at the current threshold.
+    // Needs the scene index; while scene mode is selected a missing index
+    // is built in the background without writing frames.
+    function refreshSceneCutPreview() {
+        var cuts = backend ? backend.previewSceneCuts(sceneThresholdSlider.value) : -1;
+        if (cuts < 0 && backend && radioSceneChange.checked) {
+            backend.prepareSceneIndex();
+        }
+        
+        if (cuts >= 0) {
+            sceneCutPreview.text = "Bu eşikle " + cuts + " frame kaydedilir";
+        } else if (backend && backend.sceneIndexBuilding) {
+            sceneCutPreview.text = "Sahneler analiz ediliyor...";
+        } else {
+            sceneCutPreview.text = "Sahne modu seçilince önizleme hazırlanır";
+        }
+    }
+    
+    Component.onCompleted: refreshSceneCutPreview()
+    
     // Gradient background
     Rectangle {
         anchors.fill: parent
@@ -202,7 +233,7 @@ ApplicationWindow {
             Components.GlassCard {
                 title: "3. Ayırma Seçenekleri ⚙️"
                 Layout.fillWidth: true
-                Layout.preferredHeight: 200
+                Layout.preferredHeight: 330
                 
                 ColumnLayout {
                     anchors.fill: parent
@@ -210,7 +241,7 @@ ApplicationWindow {
                     
                     ButtonGroup { id: modeGroup }
                     
-                    // Row 1: All Frames and Scene Change side by side
+                    // Row 1: All Frames, Scene Change and Interval side by side
                     RowLayout {
                         Layout.fillWidth: true
                         spacing: 50
@@ -230,12 +261,117 @@ ApplicationWindow {
                             emoji: "🎭"
                             ButtonGroup.group: modeGroup
                             font.pixelSize: 14
+                            onCheckedChanged: refreshSceneCutPreview()
+                        }
+                        
+                        // Interval: "Her [1] sn'de bir frame"
+                        RowLayout {
+                            spacing: 8
+                            
+                            Components.StyledRadioButton {
+                                id: radioInterval
+                                text: "Her"
+                                emoji: "⏱️"
+                                ButtonGroup.group: modeGroup
+                                font.pixelSize: 14
+                            }
+                            
+                            Components.StyledTextField {
+                                id: intervalField
+                                implicitWidth: 60
+                                enabled: radioInterval.checked
+                                opacity: enabled ? 1.0 : 0.3
+                                text: backend ? backend.intervalSeconds.toString() : "1"
+                                onEditingFinished: if (backend) backend.intervalSeconds = Number(text.replace(",", "."))
+                                font.pixelSize: 13
+                                
+                                Behavior on opacity { NumberAnimation { duration: 200 } }
+                            }
+                            
+                            Text {
+                                text: "sn'de bir frame"
+                                color: "#CCCCCC"
+                                font.pixelSize: 14
+                                opacity: radioInterval.checked ? 1.0 : 0.3
+                            }
+                        }
+                        
+                        Item { Layout.fillWidth: true }
+                    }
+                    
+                    // Row 2: Scene threshold with a cut count preview from the scene index
+                    RowLayout {
+                        Layout.fillWidth: true
+                        Layout.leftMargin: 35
+                        spacing: 14
+                        opacity: radioSceneChange.checked ? 1.0 : 0.3
+                        enabled: radioSceneChange.checked
+                        
+                        Behavior on opacity { NumberAnimation { duration: 200 } }
+                        
+                        Text { text: "Sahne eşiği:"; color: "#CCCCCC"; font.pixelSize: 14 }
+                        
+                        Slider {
+                            id: sceneThresholdSlider
+                            implicitWidth: 220
+                            from: 0.3
+                            to: 0.95
+                            stepSize: 0.05
+                            value: backend ? backend.sceneThreshold : 0.7
+                            onMoved: {
+                                if (backend) backend.sceneThreshold = value;
+                                refreshSceneCutPreview();
+                            }
+                        }
+                        
+                        Text {
+                            text: sceneThresholdSlider.value.toFixed(2)
+                            color: "#E0E0E0"
+                            font.pixelSize: 14
+                        }
+                        
+                        Text {
+                            id: sceneCutPreview
+                            color: "#A0A0A0"
+                            font.pixelSize: 12
+                            elide: Text.ElideRight
+                            Layout.fillWidth: true
+                        }
+                    }
+                    
+                    // Row 3: Near-duplicate suppression and motion activity
+                    RowLayout {
+                        Layout.fillWidth: true
+                        spacing: 14
+                        
+                        Components.StyledRadioButton {
+                            id: radioDedup
+                            text: "Birbirine benzeyen frame'leri tekrar kaydetme"
+                            emoji: "🧹"
+                            ButtonGroup.group: modeGroup
+                            font.pixelSize: 14
+                        }
+                        
+                        Text {
+                            text: "Sunum ve ekran kayıtları için"
+                            color: "#A0A0A0"
+                            font.pixelSize: 12
+                            opacity: radioDedup.checked ? 1.0 : 0.5
+                        }
+                        
+                        Components.StyledRadioButton {
+                            id: radioMotion
+                            text: "Hareketli anları ayır"
+                            emoji: "🏃"
+                            ButtonGroup.group: modeGroup
+                            font.pixelSize: 14
+                            Layout.leftMargin: 36
                         }
                         
                         Item { Layout.fillWidth: true }
                     }
                     
-                    // Row 2: Time Range option
+                    // Row 4: Time Range option
                     Components.StyledRadioButton {
                         id: radioTimeRange
                         text: "Belirli bir zaman aralığını ayır"
@@ -244,7 +380,7 @@ ApplicationWindow {
                         font.pixelSize: 14
                     }
                     
-                    // Row 3: Time range controls
+                    // Row 5: Time range controls
                     RowLayout {
                         Layout.fillWidth: true
                         Layout.leftMargin: 35
@@ -268,11 +404,12 @@ ApplicationWindow {
                             id: rangeSlider
                             Layout.fillWidth: true
                             Layout.minimumWidth: 200
-                            implicitHeight: 30
                             minValue: 0
                             maxValue: backend ? backend.videoDuration : 100
                             lowValue: 0
                             highValue: backend ? backend.videoDuration : 100
+                            filmstripSource: backend ? backend.filmstripSource : ""
+                            filmstripCount: backend ? backend.filmstripCount : 0
                             
                             onRangeChanged: function(low, high) {
                                 if (backend) {
@@ -291,6 +428,36 @@ ApplicationWindow {
                             font.pixelSize: 13
                         }
                     }
+                    
+                    // Row 6: Multiple ranges from an editor's CSV/EDL list
+                    RowLayout {
+                        Layout.fillWidth: true
+                        spacing: 14
+                        
+                        Components.StyledRadioButton {
+                            id: radioMultiRange
+                            text: "Birden çok zaman aralığını ayır (CSV/EDL)"
+                            emoji: "🎞️"
+                            ButtonGroup.group: modeGroup
+                            font.pixelSize: 14
+                        }
+                        
+                        Components.SecondaryButton {
+                            text: "📄 Liste Seç"
+                            enabled: radioMultiRange.checked
+                            opacity: enabled ? 1.0 : 0.3
+                            onClicked: rangesFileDialog.open()
+                        }
+                        
+                        Text {
+                            text: backend && backend.rangesFile ? backend.rangesFile : "Liste seçilmedi"
+                            color: "#CCCCCC"
+                            font.pixelSize: 13
+                            elide: Text.ElideMiddle
+                            opacity: radioMultiRange.checked ? 1.0 : 0.3
+                            Layout.fillWidth: true
+                        }
+                    }
                 }
             }
             
@@ -339,14 +506,34 @@ ApplicationWindow {
                     
                     onClicked: {
                         if (backend) {
-                            var mode = "all";
-                            if (radioTimeRange.checked) mode = "range";
-                            else if (radioSceneChange.checked) mode = "scene";
-                            backend.startProcessing(mode);
+                            backend.startProcessing(window.selectedMode());
                         }
                     }
                 }
                 
+                // Queue Button - runs alongside the current process
+                Components.SecondaryButton {
+                    text: "➕ Kuyruğa Ekle"
+                    Layout.preferredWidth: 160
+                    Layout.preferredHeight: 48
+                    enabled: backend ? backend.videoPath !== "" : false
+                    font.pixelSize: 14
+                    
+                    onClicked: {
+                        if (backend) {
+                            backend.enqueueJob(window.selectedMode());
+                        }
+                    }
+                }
+                
+                Components.SecondaryButton {
+                    text: "📋 Kuyruk (" + (backend ? backend.pendingJobCount : 0) + ")"
+                    Layout.preferredWidth: 140
+                    Layout.preferredHeight: 48
+                    font.pixelSize: 14
+                    onClicked: jobQueuePanel.open()
+                }
+                
                 // Cancel Button - only visible during processing
                 Button {
                     id: cancelButton
@@ -391,6 +578,21 @@ ApplicationWindow {
         }
     }
     
+    // Job queue
+    Components.JobQueuePanel {
+        id: jobQueuePanel
+        anchors.centerIn: parent
+        width: Math.min(window.width - 80, 760)
+        height: Math.min(window.height - 80, 520)
+        model: backend ? backend.jobModel : null
+        
+        onPauseRequested: (jobId) => backend.pauseJob(jobId)
+        onResumeRequested: (jobId) => backend.resumeJob(jobId)
+        onCancelRequested: (jobId) => backend.cancelJob(jobId)
+        onPriorityRequested: (jobId, priority) => backend.setJobPriority(jobId, priority)
+        onClearRequested: backend.clearFinishedJobs()
+    }
+    
     // File Dialogs
     FileDialog {
         id: videoFileDialog
@@ -403,6 +605,17 @@ ApplicationWindow {
         }
     }
     
+    FileDialog {
+        id: rangesFileDialog
+        title: "Aralık Listesi Seç"
+        nameFilters: ["Aralık Listeleri (*.csv *.edl *.txt)", "Tüm Dosyalar (*)"]
+        onAccepted: {
+            if (backend) {
+                backend.setRangesFile(selectedFile);
+            }
+        }
+    }
+    
     FolderDialog {
         id: folderDialog
         title: "Çıktı Klasörü Seç"
@@ -422,6 +635,23 @@ ApplicationWindow {
             messageDialogContent.text = message;
             messageDialog.open();
         }
+        
+        function onThumbnailReady(index) {
+            rangeSlider.refreshThumbnail(index);
+        }
+        
+        // A new video or a finished scene pass changes the preview
+        function onVideoPathChanged() {
+            refreshSceneCutPreview();
+        }
+        
+        function onProcessingChanged() {
+            refreshSceneCutPreview();
+        }
+        
+        function onSceneIndexChanged() {
+            refreshSceneCutPreview();
+        }
     }
     
     Dialog {
@@ -0,0 +1,50 @@
+// Frame_Ayirici/qml/components/Filmstrip.qml
+import QtQuick
+
+Item {
+    id: root
+    
+    // Base image URL; thumbnail i is loaded from "<source>/<i>"
+    property string source: ""
+    property int count: 0
+    
+    implicitHeight: 40
+    implicitWidth: 300
+    
+    // Reload one thumbnail once the backend has decoded it
+    function refresh(index) {
+        var item = thumbnails.itemAt(index);
+        if (item) item.revision++;
+    }
+    
+    Rectangle {
+        anchors.fill: parent
+        radius: 4
+        color: Qt.rgba(0, 0, 0, 0.3)
+        clip: true
+        
+        Row {
+            anchors.fill: parent
+            
+            Repeater {
+                id: thumbnails
+                model: root.source ? root.count : 0
+                
+                Image {
+                    property int revision: 0
+                    
+                    width: root.width / Math.max(root.count, 1)
+                    height: root.height
+                    fillMode: Image.PreserveAspectCrop
+                    // Decoded on QML's loader threads, never on the GUI thread
+                    asynchronous: true
+                    cache: false
+                    source: root.source + "/" + index + "?" + revision
+                    
+                    opacity: status === Image.Ready ? 1.0 : 0.0
+                    Behavior on opacity { NumberAnimation { duration: 200 } }
+                }
+            }
+        }
+    }
+}
@@ -0,0 +1,171 @@
+// Frame_Ayirici/qml/components/JobQueuePanel.qml
+import QtQuick
+import QtQuick.Controls
+import QtQuick.Layouts
+
+// Qualified: ProgressBar also exists in QtQuick.Controls
+import "." as Components
+
+Popup {
+    id: root
+    
+    // JobListModel from the backend
+    property var model: null
+    
+    signal pauseRequested(int jobId)
+    signal resumeRequested(int jobId)
+    signal cancelRequested(int jobId)
+    signal priorityRequested(int jobId, int priority)
+    signal clearRequested()
+    
+    modal: true
+    padding: 0
+    
+    function stateText(state) {
+        switch (state) {
+        case "queued": return "⏳ Sırada";
+        case "running": return "▶️ Çalışıyor";
+        case "paused": return "⏸️ Duraklatıldı";
+        case "done": return "✅ Tamamlandı";
+        case "failed": return "⚠️ Hata";
+        case "cancelled": return "❌ İptal edildi";
+        }
+        return state;
+    }
+    
+    background: Rectangle {
+        color: "#2A2648"
+        border.color: Qt.rgba(1, 1, 1, 0.15)
+        border.width: 1
+        radius: 12
+    }
+    
+    contentItem: ColumnLayout {
+        spacing: 12
+        
+        RowLayout {
+            Layout.fillWidth: true
+            Layout.margins: 16
+            Layout.bottomMargin: 0
+            
+            Text {
+                text: "İş Kuyruğu 📋"
+                color: "#E0E0E0"
+                font.pixelSize: 17
+                font.weight: Font.Bold
+                Layout.fillWidth: true
+            }
+            
+            Components.SecondaryButton {
+                text: "🧹 Bitenleri Temizle"
+                implicitWidth: 150
+                font.pixelSize: 12
+                onClicked: root.clearRequested()
+            }
+            
+            Components.SecondaryButton {
+                text: "✕"
+                font.pixelSize: 14
+                onClicked: root.close()
+            }
+        }
+        
+        Text {
+            text: "Kuyrukta iş yok."
+            color: "#A0A0A0"
+            font.pixelSize: 13
+            visible: jobList.count === 0
+            Layout.alignment: Qt.AlignHCenter
+            Layout.topMargin: 20
+        }
+        
+        ListView {
+            id: jobList
+            Layout.fillWidth: true
+            Layout.fillHeight: true
+            Layout.margins: 16
+            Layout.topMargin: 0
+            clip: true
+            spacing: 8
+            model: root.model
+            
+            ScrollBar.vertical: ScrollBar {}
+            
+            delegate: Rectangle {
+                width: ListView.view.width
+                height: 72
+                color: Qt.rgba(1, 1, 1, 0.05)
+                border.color: Qt.rgba(1, 1, 1, 0.1)
+                border.width: 1
+                radius: 8
+                
+                readonly property bool isActive: model.state === "running" || model.state === "paused"
+                readonly property bool isFinished: model.state === "done" || model.state === "failed" || model.state === "cancelled"
+                
+                RowLayout {
+                    anchors.fill: parent
+                    anchors.margins: 10
+                    spacing: 10
+                    
+                    ColumnLayout {
+                        Layout.fillWidth: true
+                        spacing: 4
+                        
+                        Text {
+                            text: model.videoName + "  •  " + model.mode + "  •  " + root.stateText(model.state)
+                            color: "#E0E0E0"
+                            font.pixelSize: 13
+                            font.bold: true
+                            elide: Text.ElideMiddle
+                            Layout.fillWidth: true
+                        }
+                        
+                        Components.ProgressBar {
+                            Layout.fillWidth: true
+                            implicitHeight: 12
+                            value: model.progress / 100.0
+                        }
+                        
+                        Text {
+                            text: model.message
+                            color: "#A0A0A0"
+                            font.pixelSize: 11
+                            elide: Text.ElideRight
+                            Layout.fillWidth: true
+                        }
+                    }
+                    
+                    // Priority: higher starts first among queued jobs
+                    Components.SecondaryButton {
+                        text: "▲"
+                        visible: !isFinished
+                        onClicked: root.priorityRequested(model.jobId, model.priority + 1)
+                    }
+                    
+                    Components.SecondaryButton {
+                        text: "▼"
+                        visible: !isFinished
+                        onClicked: root.priorityRequested(model.jobId, model.priority - 1)
+                    }
+                    
+                    Components.SecondaryButton {
+                        text: model.state === "paused" ? "▶" : "⏸"
+                        font.pixelSize: 12
+                        visible: model.state === "queued" || isActive
+                        onClicked: {
+                            if (model.state === "paused") root.resumeRequested(model.jobId);
+                            else root.pauseRequested(model.jobId);
+                        }
+                    }
+                    
+                    Components.SecondaryButton {
+                        text: "✕"
+                        font.pixelSize: 12
+                        visible: !isFinished
+                        onClicked: root.cancelRequested(model.jobId)
+                    }
+                }
+            }
+        }
+    }
+}
@@ -10,9 +10,14 @@ Item {
     property real lowValue: 0
     property real highValue: 100
     
+    // Optional filmstrip shown above the track (see Filmstrip.qml)
+    property string filmstripSource: ""
+    property int filmstripCount: 0
+    readonly property bool hasFilmstrip: filmstripSource !== "" && filmstripCount > 0
+    
     signal rangeChanged(real low, real high)
     
-    implicitHeight: 28
+    implicitHeight: hasFilmstrip ? 28 + filmstrip.height + 4 : 28
     implicitWidth: 300
     
     // Calculate positions
@@ -31,9 +36,47 @@ Item {
         return minValue + normalizedPos * (maxValue - minValue);
     }
     
+    function refreshThumbnail(index) {
+        filmstrip.refresh(index);
+    }
+    
+    Filmstrip {
+        id: filmstrip
+        visible: root.hasFilmstrip
+        anchors.top: parent.top
+        x: root.trackPadding
+        width: root.trackWidth
+        source: root.filmstripSource
+        count: root.filmstripCount
+        
+        // Dim the part of the timeline outside the selected range
+        Rectangle {
+            x: 0
+            width: root.valueToPos(root.lowValue) - root.trackPadding
+            height: parent.height
+            color: Qt.rgba(0, 0, 0, 0.5)
+        }
+        
+        Rectangle {
+            x: root.valueToPos(root.highValue) - root.trackPadding
+            width: parent.width - x
+            height: parent.height
+            color: Qt.rgba(0, 0, 0, 0.5)
+        }
+    }
+    
+    // Area holding the track and the handles
+    Item {
+        id: trackArea
+        anchors.left: parent.left
+        anchors.right: parent.right
+        anchors.bottom: parent.bottom
+        height: 28
+    }
+    
     // Background track
     Rectangle {
-        anchors.verticalCenter: parent.verticalCenter
+        anchors.verticalCenter: trackArea.verticalCenter
         x: root.trackPadding
         width: root.trackWidth
         height: 4
@@ -54,7 +97,7 @@ Item {
     Rectangle {
         id: lowHandle
         x: root.valueToPos(root.lowValue) - handleRadius
-        anchors.verticalCenter: parent.verticalCenter
+        anchors.verticalCenter: trackArea.verticalCenter
         width: handleRadius * 2
         height: handleRadius * 2
         radius: handleRadius
@@ -95,7 +138,7 @@ Item {
     Rectangle {
         id: highHandle
         x: root.valueToPos(root.highValue) - handleRadius
-        anchors.verticalCenter: parent.verticalCenter
+        anchors.verticalCenter: trackArea.verticalCenter
         width: handleRadius * 2
         height: handleRadius * 2
         radius: handleRadius
@@ -0,0 +1,79 @@
+# Frame_Ayirici/tests/conftest.py
+"""
+Shared fixtures for the test suite.
+The analysis cache and the frame store are redirected to a temporary
+directory before any project module reads their location.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+_TEMP_ROOT = tempfile.mkdtemp(prefix="frame_extractor_tests_")
+os.environ["FRAME_EXTRACTOR_CACHE_DIR"] = os.path.join(_TEMP_ROOT, "cache")
+os.environ["FRAME_EXTRACTOR_STORE_DIR"] = os.path.join(_TEMP_ROOT, "store")
+
+from core.benchmark import synthetic_video  # noqa: E402
+from core.checkpoint import CheckpointJournal  # noqa: E402
+from core.video_processor import VideoProcessor  # noqa: E402
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(_TEMP_ROOT, ignore_errors=True)
+
+
+class RecordingSignals:
+    """SignalProtocol implementation that keeps every status message."""
+    
+    def __init__(self):
+        self.statuses: List[str] = []
+    
+    def emit_progress(self, value: int) -> None:
+        pass
+    
+    def emit_status(self, message: str) -> None:
+        self.statuses.append(message)
+
+
+class CancelAfter:
+    """CancellationProtocol implementation that cancels after N polls."""
+    
+    def __init__(self, polls: int):
+        self.polls = polls
+    
+    def is_cancelled(self) -> bool:
+        self.polls -= 1
+        return self.polls < 0
+
+
+@pytest.fixture(scope="session")
+def video(tmp_path_factory) -> Path:
+    """120-frame 360p video with a scene cut every 30 frames and a keyframe every 12."""
+    return synthetic_video(tmp_path_factory.mktemp("videos"), '360p', 120)
+
+
+@pytest.fixture
+def extract(video):
+    """Run VideoProcessor on the test video; returns (message, status messages)."""
+    def run(output_dir: Path, mode: str, **kwargs) -> Tuple[str, List[str]]:
+        signals = RecordingSignals()
+        processor = VideoProcessor(str(video), str(output_dir), mode, signals, **kwargs)
+        return processor.run(), signals.statuses
+    return run
+
+
+def output_files(path: Path) -> Dict[str, bytes]:
+    """Contents of every output file below path, keyed by relative path."""
+    return {
+        str(file.relative_to(path)): file.read_bytes()
+        for file in sorted(path.rglob("*"))
+        if file.is_file() and file.name != CheckpointJournal.FILE_NAME
+    }
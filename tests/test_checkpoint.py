@@ -0,0 +1,63 @@
+# Frame_Ayirici/tests/test_checkpoint.py
+"""
+Tests for the checkpoint journal and resumed extraction runs.
+"""
+
+import pytest
+
+from conftest import CancelAfter, output_files
+from core.checkpoint import Checkpoint, CheckpointJournal
+from core.protocols import ProcessingCancelled
+
+
+def test_journal_round_trip(tmp_path, video):
+    params_hash = CheckpointJournal.make_params_hash(str(video), mode='scene')
+    journal = CheckpointJournal(tmp_path, params_hash)
+    
+    assert journal.load() is None
+    
+    journal.save(40, 3, {'prev': [1, 2]})
+    assert journal.load() == Checkpoint(40, 3, {'prev': [1, 2]})
+    
+    journal.clear()
+    assert journal.load() is None
+
+
+def test_journal_ignores_other_parameters(tmp_path, video):
+    CheckpointJournal(
+        tmp_path, CheckpointJournal.make_params_hash(str(video), mode='scene')
+    ).save(40, 3, {})
+    
+    other = CheckpointJournal(tmp_path, CheckpointJournal.make_params_hash(str(video), mode='all'))
+    assert other.load() is None
+
+
+def test_journal_due_uses_the_clock(tmp_path):
+    now = [0.0]
+    journal = CheckpointJournal(tmp_path, "hash", interval=10.0, clock=lambda: now[0])
+    
+    assert not journal.due()
+    now[0] = 10.0
+    assert journal.due()
+    
+    journal.save(1, 0, {})
+    assert not journal.due()
+
+
+@pytest.mark.parametrize("mode, kwargs", [
+    ('all', {}),
+    ('scene', {'use_index': False}),
+    ('dedup', {}),
+    ('motion', {}),
+])
+def test_resumed_run_matches_uninterrupted_run(tmp_path, extract, mode, kwargs):
+    extract(tmp_path / "full", mode, **kwargs)
+    
+    with pytest.raises(ProcessingCancelled):
+        extract(tmp_path / "resumed", mode, cancel_token=CancelAfter(50), **kwargs)
+    assert (tmp_path / "resumed" / CheckpointJournal.FILE_NAME).exists()
+    
+    extract(tmp_path / "resumed", mode, **kwargs)
+    
+    assert not (tmp_path / "resumed" / CheckpointJournal.FILE_NAME).exists()
+    assert output_files(tmp_path / "resumed") == output_files(tmp_path / "full")
@@ -0,0 +1,32 @@
+# Frame_Ayirici/tests/test_filmstrip.py
+"""
+Tests for filmstrip thumbnail positions and generation.
+"""
+
+from core import seeking
+from core.filmstrip import Filmstrip
+
+
+def test_positions_are_slice_centres_without_keyframes():
+    assert Filmstrip.positions(100, 4) == [12, 37, 62, 87]
+    assert Filmstrip.positions(0, 4) == []
+
+
+def test_positions_snap_only_to_keyframes_inside_the_slice():
+    # Slices of 100 frames; keyframe 510 lies in slice 5, 0 only in slice 0
+    positions = Filmstrip.positions(1000, 10, [0, 510])
+    
+    assert positions == [0, 150, 250, 350, 450, 510, 650, 750, 850, 950]
+    assert len(set(positions)) == 10
+
+
+def test_generate_does_not_wait_for_a_container_scan(video, monkeypatch):
+    seeking._scan_container.cache_clear()
+    monkeypatch.setattr(seeking, '_load_scan', lambda video_path: None)
+    monkeypatch.setattr(seeking, '_scan_container', None)
+    
+    thumbnails = {}
+    Filmstrip(str(video), count=6).generate(thumbnails.__setitem__)
+    
+    assert sorted(thumbnails) == list(range(6))
+    assert len(set(thumbnails.values())) == 6
@@ -0,0 +1,94 @@
+# Frame_Ayirici/tests/test_perceptual_hash.py
+"""
+Tests for perceptual hashes, the BK-tree index and duplicate suppression.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from core.perceptual_hash import HASHES, BKTree, hamming
+from core.strategies import DedupStrategy
+
+
+def _slide(seed: int) -> np.ndarray:
+    """Blocky BGR test image; different seeds give unrelated images."""
+    rng = np.random.default_rng(seed)
+    blocks = rng.integers(0, 256, (9, 16, 3), dtype=np.uint8)
+    return np.kron(blocks, np.ones((40, 40, 1), dtype=np.uint8))
+
+
+def test_hamming():
+    assert hamming(0b1011, 0b0001) == 2
+    assert hamming(2 ** 64 - 1, 0) == 64
+
+
+@pytest.mark.parametrize("name", sorted(HASHES))
+def test_hash_is_stable_under_noise(name):
+    gray = _slide(1)[:, :, 0]
+    noisy = np.clip(gray.astype(np.int16) + np.random.default_rng(0).integers(-3, 4, gray.shape), 0, 255)
+    
+    original = HASHES[name](gray, 8)
+    assert 0 <= original < 2 ** 64
+    assert hamming(original, HASHES[name](noisy.astype(np.uint8), 8)) <= 4
+    assert hamming(original, HASHES[name](_slide(2)[:, :, 0], 8)) > 10
+
+
+def test_bk_tree_matches_brute_force():
+    rng = random.Random(7)
+    values = [rng.getrandbits(64) for _ in range(300)]
+    # Near-duplicates of a few stored hashes
+    values += [value ^ (1 << rng.randrange(64)) for value in values[:20]]
+    tree = BKTree(values)
+    
+    assert len(tree) == len(set(values))
+    
+    for _ in range(200):
+        query = rng.choice(values) ^ rng.getrandbits(64) & rng.getrandbits(64) & rng.getrandbits(64)
+        for radius in (0, 3, 10):
+            found = tree.find(query, radius)
+            expected = [value for value in values if hamming(query, value) <= radius]
+            if expected:
+                assert found is not None and hamming(query, found) <= radius
+            else:
+                assert found is None
+
+
+def test_bk_tree_values_rebuild_the_same_tree():
+    rng = random.Random(3)
+    tree = BKTree(rng.getrandbits(64) for _ in range(100))
+    
+    assert BKTree(tree.values())._root == tree._root
+
+
+def test_dedup_skips_frames_seen_earlier():
+    strategy = DedupStrategy(25.0, 0)
+    first, second = _slide(1), _slide(2)
+    
+    decisions = [
+        strategy.should_save_frame(frame, index)
+        for index, frame in enumerate([first, first, second, first, second])
+    ]
+    
+    assert decisions == [True, False, True, False, False]
+    assert strategy.duplicate_count == 3
+
+
+def test_dedup_state_survives_resume():
+    strategy = DedupStrategy(25.0, 0)
+    strategy.should_save_frame(_slide(1), 0)
+    
+    resumed = DedupStrategy(25.0, 0)
+    resumed.reset()
+    resumed.set_state(strategy.get_state())
+    
+    assert not resumed.should_save_frame(_slide(1), 1)
+    assert resumed.should_save_frame(_slide(2), 2)
+
+
+def test_dedup_rejects_invalid_options():
+    with pytest.raises(ValueError):
+        DedupStrategy(25.0, 0, hash='md5')
+    with pytest.raises(ValueError):
+        DedupStrategy(25.0, 0, max_distance=-1)
@@ -0,0 +1,105 @@
+# Frame_Ayirici/tests/test_ranges.py
+"""
+Tests for range list parsing and multi-range mode.
+"""
+
+import pytest
+
+from core.ranges import (
+    merge_ranges,
+    parse_range_spec,
+    parse_time,
+    read_csv_ranges,
+    read_edl_ranges,
+    read_ranges_file
+)
+from core.strategies import MultiRangeStrategy
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("12", 300),
+    ("2.4", 60),
+    ("01:02", 1550),
+    ("00:01:02.5", 1562),
+    ("00:00:01:05", 30),
+])
+def test_parse_time(text, expected):
+    assert parse_time(text, 25.0) == expected
+
+
+def test_parse_time_is_not_one_frame_early():
+    assert parse_time("2.3", 30.0) == 69
+
+
+@pytest.mark.parametrize("text", ["", "abc", "-1", "1:2:3:4:5"])
+def test_parse_time_rejects_invalid(text):
+    with pytest.raises(ValueError):
+        parse_time(text, 25.0)
+
+
+def test_parse_range_spec():
+    assert parse_range_spec("00:00:01-00:00:02, 4-4.5\n", 10.0) == [(10, 20), (40, 45)]
+    
+    with pytest.raises(ValueError):
+        parse_range_spec("1-2-3", 10.0)
+
+
+def test_merge_ranges_sorts_merges_and_clamps():
+    ranges = [(50, 60), (0, 10), (10, 20), (15, 18), (30, 30), (90, 200)]
+    
+    assert merge_ranges(ranges) == [(0, 20), (50, 60), (90, 200)]
+    assert merge_ranges(ranges, total_frames=100) == [(0, 20), (50, 60), (90, 100)]
+    assert merge_ranges([(120, 130)], total_frames=100) == []
+
+
+def test_read_csv_ranges(tmp_path):
+    path = tmp_path / "ranges.csv"
+    path.write_text(
+        "start;end;label\n"
+        "# comment\n"
+        "00:00:01;00:00:02;intro\n"
+        "\n"
+        "3;3.5;shot\n",
+        encoding="utf-8"
+    )
+    
+    assert read_csv_ranges(path, 10.0) == [(10, 20), (30, 35)]
+
+
+def test_read_csv_ranges_reports_bad_rows(tmp_path):
+    path = tmp_path / "ranges.csv"
+    path.write_text("1,2\nx,y\n", encoding="utf-8")
+    
+    with pytest.raises(ValueError, match=":2:"):
+        read_csv_ranges(path, 10.0)
+
+
+def test_read_edl_ranges(tmp_path):
+    path = tmp_path / "cut.edl"
+    path.write_text(
+        "TITLE: cut\n"
+        "FCM: NON-DROP FRAME\n"
+        "001  AX  V  C  00:00:01:00 00:00:02:12 01:00:00:00 01:00:01:12\n"
+        "* FROM CLIP NAME: a.mp4\n"
+        "002  AX  V  C  00:00:10:00 00:00:11:00 01:00:01:12 01:00:02:12\n",
+        encoding="utf-8"
+    )
+    
+    assert read_edl_ranges(path, 25.0) == [(25, 62), (250, 275)]
+    assert read_ranges_file(path, 25.0) == [(25, 62), (250, 275)]
+
+
+def test_multi_range_strategy_plans_merged_ranges():
+    strategy = MultiRangeStrategy(10.0, 100, ranges="5-6, 1-2, 1.5-3")
+    
+    assert strategy.ranges == [(10, 30), (50, 60)]
+    assert strategy.planned_frames() == list(range(10, 30)) + list(range(50, 60))
+    assert strategy.range_of(29) == 0
+    assert strategy.range_of(30) is None
+    assert strategy.output_group(55).startswith("range_002_")
+    assert strategy.output_group(40) is None
+
+
+def test_multi_range_strategy_requires_ranges():
+    with pytest.raises(ValueError):
+        MultiRangeStrategy(10.0, 100)
@@ -0,0 +1,102 @@
+# Frame_Ayirici/tests/test_scene_change.py
+"""
+Tests for scene change analysis on downscaled frames and in batches.
+"""
+
+import cv2
+import numpy as np
+
+from core.scene_index import SceneIndex
+from core.strategies import SceneChangeStrategy
+
+# Largest allowed difference from full-resolution correlations
+CORRELATION_TOLERANCE = 0.01
+
+
+def _analyse(video, analysis_width: int):
+    strategy = SceneChangeStrategy(30.0, 120, analysis_width=analysis_width)
+    strategy.reset()
+    
+    cap = cv2.VideoCapture(str(video))
+    cuts = []
+    try:
+        frame_index = 0
+        while True:
+            ok, frame = cap.read()
+            if not ok:
+                break
+            if strategy.should_save_frame(frame, frame_index):
+                cuts.append(frame_index)
+            frame_index += 1
+    finally:
+        cap.release()
+    
+    return np.array(strategy._correlations[1:]), cuts
+
+
+def test_downscaled_correlations_match_full_resolution(video):
+    full, full_cuts = _analyse(video, 0)
+    small, small_cuts = _analyse(video, SceneChangeStrategy.DEFAULT_ANALYSIS_WIDTH)
+    
+    assert len(full) == len(small) == 119
+    assert np.abs(full - small).max() <= CORRELATION_TOLERANCE
+    assert small_cuts == full_cuts
+    assert len(full_cuts) > 1
+
+
+def test_batch_path_matches_per_frame_path(video):
+    single = SceneChangeStrategy(30.0, 120)
+    batched = SceneChangeStrategy(30.0, 120)
+    single.reset()
+    batched.reset()
+    
+    cap = cv2.VideoCapture(str(video))
+    frames = []
+    try:
+        while True:
+            ok, frame = cap.read()
+            if not ok:
+                break
+            frames.append(frame)
+    finally:
+        cap.release()
+    
+    expected = [single.should_save_frame(frame, index) for index, frame in enumerate(frames)]
+    mask = []
+    for start in range(0, len(frames), batched.batch_size):
+        chunk = frames[start:start + batched.batch_size]
+        mask += batched.select_batch(chunk, range(start, start + len(chunk))).tolist()
+    
+    assert mask == expected
+    np.testing.assert_allclose(
+        batched._correlations[1:], single._correlations[1:], atol=1e-6
+    )
+
+
+def test_index_is_keyed_by_every_analysis_setting(tmp_path, extract, video, monkeypatch):
+    extract(tmp_path, 'scene')
+    index = SceneChangeStrategy.load_index(str(video))
+    assert index is not None and len(index) == 120
+    
+    monkeypatch.setattr(SceneChangeStrategy, 'ANALYSIS_INTERPOLATION', cv2.INTER_AREA)
+    assert SceneChangeStrategy.load_index(str(video)) is None
+    
+    monkeypatch.undo()
+    monkeypatch.setattr(SceneChangeStrategy, 'HIST_BINS', 64)
+    assert SceneChangeStrategy.load_index(str(video)) is None
+
+
+def test_build_index_matches_an_extraction(tmp_path, extract, video):
+    SceneIndex._index_path(str(video), *SceneChangeStrategy.index_settings(
+        SceneChangeStrategy.DEFAULT_ANALYSIS_WIDTH
+    )).unlink(missing_ok=True)
+    
+    assert SceneChangeStrategy.build_index(str(video), is_cancelled=lambda: True) is None
+    assert SceneChangeStrategy.load_index(str(video)) is None
+    
+    index = SceneChangeStrategy.build_index(str(video))
+    assert index is not None and len(index) == 120
+    
+    extract(tmp_path, 'scene', use_index=False)
+    saved = len(list(tmp_path.rglob("*.jpg")))
+    assert index.count_cuts(SceneChangeStrategy.DEFAULT_THRESHOLD) == saved
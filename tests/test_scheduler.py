@@ -0,0 +1,145 @@
+# Frame_Ayirici/tests/test_scheduler.py
+"""
+Tests for the job queue: slots, pausing through checkpoints, cancelling
+and the adaptive concurrency limit.
+"""
+
+import pytest
+
+from core.checkpoint import CheckpointJournal
+from core.protocols import ProcessingCancelled
+from core.scheduler import JobScheduler, JobState
+from core.timing import StageTimings
+
+
+def _scheduler(jobs: int = 2, max_concurrent: int = 1):
+    scheduler = JobScheduler(max_concurrent=max_concurrent)
+    for _ in range(jobs):
+        scheduler.add("video.mp4", "", 'all')
+    return scheduler
+
+
+def test_next_jobs_respects_priority_and_slots():
+    scheduler = _scheduler(3, max_concurrent=2)
+    scheduler.set_priority(3, 5)
+    
+    assert [job.job_id for job in scheduler.next_jobs()] == [3, 1]
+    assert scheduler.next_jobs() == []
+    assert scheduler.active_count == 2
+
+
+def test_pause_stops_the_run_without_blocking():
+    scheduler = _scheduler()
+    job = scheduler.next_jobs()[0]
+    
+    assert not job.is_cancelled()
+    assert scheduler.pause(job.job_id)
+    assert job.is_cancelled()
+    assert job.state == JobState.PAUSED
+
+
+def test_paused_job_keeps_its_slot_until_it_stops():
+    scheduler = _scheduler()
+    job = scheduler.next_jobs()[0]
+    scheduler.pause(job.job_id)
+    
+    assert scheduler.next_jobs() == []
+    
+    scheduler.stopped(job)
+    assert job.state == JobState.PAUSED
+    assert [other.job_id for other in scheduler.next_jobs()] == [2]
+
+
+def test_resumed_job_is_queued_again():
+    scheduler = _scheduler(1)
+    job = scheduler.next_jobs()[0]
+    scheduler.pause(job.job_id)
+    scheduler.stopped(job)
+    
+    assert scheduler.resume(job.job_id)
+    assert job.state == JobState.QUEUED
+    assert not job.is_cancelled()
+    assert scheduler.next_jobs() == [job]
+
+
+def test_resume_before_the_run_stopped():
+    scheduler = _scheduler(1)
+    job = scheduler.next_jobs()[0]
+    scheduler.pause(job.job_id)
+    scheduler.resume(job.job_id)
+    
+    assert job.state == JobState.RUNNING
+    assert not job.is_cancelled()
+    
+    # The run saw the pause before resume() and stopped anyway
+    scheduler.stopped(job)
+    assert job.state == JobState.QUEUED
+    assert scheduler.next_jobs() == [job]
+
+
+def test_cancelling_a_stopped_paused_job_ends_it():
+    scheduler = _scheduler(1)
+    job = scheduler.next_jobs()[0]
+    scheduler.pause(job.job_id)
+    scheduler.stopped(job)
+    
+    assert scheduler.cancel(job.job_id)
+    assert job.state == JobState.CANCELLED
+    assert not scheduler.resume(job.job_id)
+
+
+def test_cancelled_running_job_ends_when_it_stops():
+    scheduler = _scheduler(1)
+    job = scheduler.next_jobs()[0]
+    scheduler.cancel(job.job_id)
+    
+    assert job.is_cancelled()
+    assert job.state == JobState.RUNNING
+    
+    scheduler.stopped(job, "İşlem iptal edildi.")
+    assert job.state == JobState.CANCELLED
+    assert scheduler.active_count == 0
+
+
+def test_paused_run_commits_a_checkpoint(tmp_path, extract):
+    scheduler = _scheduler(1)
+    job = scheduler.next_jobs()[0]
+    scheduler.pause(job.job_id)
+    
+    with pytest.raises(ProcessingCancelled):
+        extract(tmp_path, 'all', cancel_token=job)
+    
+    assert (tmp_path / CheckpointJournal.FILE_NAME).exists()
+
+
+def test_job_cost_comes_from_the_jobs_busy_time():
+    now = [0.0]
+    scheduler = JobScheduler(cpu_count=8, clock=lambda: now[0])
+    for _ in range(4):
+        scheduler.add("video.mp4", "", 'all')
+    jobs = scheduler.next_jobs()
+    assert len(jobs) == 4
+    
+    # First sample only records each job's baseline
+    now[0] = JobScheduler.SAMPLE_INTERVAL
+    scheduler.sample_load()
+    assert scheduler.job_cost == JobScheduler.DEFAULT_JOB_COST
+    
+    # Every job keeps one core busy
+    now[0] += 10.0
+    for job in jobs:
+        job.busy_seconds += 10.0
+    scheduler.sample_load()
+    
+    expected = JobScheduler.DEFAULT_JOB_COST + JobScheduler.SAMPLE_WEIGHT * (1.0 - JobScheduler.DEFAULT_JOB_COST)
+    assert scheduler.job_cost == pytest.approx(expected)
+
+
+def test_busy_seconds_skip_wait_stages():
+    timings = StageTimings()
+    timings.record('decode', 0.5)
+    timings.record('encode', 0.25)
+    timings.record('sink', 2.0)
+    timings.record('flush', 1.0)
+    
+    assert timings.busy_seconds() == pytest.approx(0.75)
@@ -0,0 +1,90 @@
+# Frame_Ayirici/tests/test_seeking.py
+"""
+Tests for the keyframe-aware seek planner.
+"""
+
+import cv2
+import numpy as np
+
+from core import seeking
+from core.seeking import SeekPlanner, scan_container, scan_keyframes
+
+
+def test_preceding_keyframe():
+    planner = SeekPlanner([0, 90, 250])
+    
+    assert planner.preceding_keyframe(0) == 0
+    assert planner.preceding_keyframe(89) == 0
+    assert planner.preceding_keyframe(90) == 90
+    assert planner.preceding_keyframe(1000) == 250
+    assert SeekPlanner([10]).preceding_keyframe(5) is None
+
+
+def test_distance_threshold_without_keyframes():
+    planner = SeekPlanner(fps=10, seek_seconds=2.0)
+    
+    assert planner.seek_target(0, 20) is None
+    assert planner.seek_target(0, 21) == 21
+
+
+def test_seeks_to_the_target_when_a_keyframe_lies_ahead():
+    planner = SeekPlanner([0, 90, 250])
+    
+    # The backend lands on keyframe 250 and decodes 50 frames, against
+    # 200 grabs; the target itself is requested, not keyframe 250
+    assert planner.seek_target(100, 300) == 300
+
+
+def test_grabs_when_the_landing_keyframe_is_behind():
+    planner = SeekPlanner([0, 90, 250])
+    
+    assert planner.seek_target(100, 200) is None
+    
+    # Within SEEK_BACKOFF after a keyframe the backend lands one GOP earlier
+    assert planner.seek_target(100, 250 + SeekPlanner.SEEK_BACKOFF - 1) is None
+    assert planner.seek_target(100, 250 + SeekPlanner.SEEK_BACKOFF) == 250 + SeekPlanner.SEEK_BACKOFF
+
+
+def test_backward_targets_always_seek():
+    assert SeekPlanner([0, 90, 250]).seek_target(200, 50) == 50
+    assert SeekPlanner(fps=30).seek_target(200, 50) == 50
+
+
+def test_advance_returns_the_exact_frame(video):
+    cap = cv2.VideoCapture(str(video))
+    sequential = []
+    while True:
+        ok, frame = cap.read()
+        if not ok:
+            break
+        sequential.append(frame)
+    cap.release()
+    
+    keyframes = scan_keyframes(str(video))
+    assert len(keyframes) > 1
+    
+    planner = SeekPlanner(keyframes, fps=30)
+    cap = cv2.VideoCapture(str(video))
+    position = 0
+    try:
+        for target in [5, 40, 41, 100, 20, 119]:
+            position = planner.advance(cap, position, target)
+            assert position == target
+            
+            ok, frame = cap.read()
+            position += 1
+            assert ok
+            assert np.array_equal(frame, sequential[target])
+    finally:
+        cap.release()
+
+
+def test_container_scan_is_persisted(video, monkeypatch):
+    scan = scan_container(str(video))
+    assert scan.frame_count == 120
+    
+    # A new process has an empty lru_cache and must not demux again
+    seeking._scan_container.cache_clear()
+    monkeypatch.setattr(seeking.cv2, 'VideoCapture', None)
+    
+    assert scan_container(str(video)) == scan
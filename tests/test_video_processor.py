@@ -0,0 +1,109 @@
+# Frame_Ayirici/tests/test_video_processor.py
+"""
+Tests for VideoProcessor runs. Every execution path must save exactly
+what a plain single pass saves.
+"""
+
+import numpy as np
+import pytest
+
+from conftest import output_files
+from core.benchmark import strategy_kwargs
+from core.frame_writer import FrameWriter
+from core.protocols import CancellationToken, ProcessingCancelled
+from core.sinks import TensorSink
+from core.video_processor import VideoProcessor
+
+# Strategy options that keep every pass a full analysis of the video
+FULL_PASS_KWARGS = {'use_index': False, 'interval': 0.5, 'ranges': "0.5-1, 2.5-3"}
+
+
+def _segmented(statuses):
+    return any("segment paralel" in status for status in statuses)
+
+
+@pytest.mark.parametrize("mode, segmentable", [
+    ('all', True),
+    ('scene', True),
+    ('dedup', False),
+    ('motion', False),
+])
+def test_segmented_run_matches_single_pass(tmp_path, extract, mode, segmentable):
+    extract(tmp_path / "single", mode, segments=1, **FULL_PASS_KWARGS)
+    _, statuses = extract(tmp_path / "segmented", mode, segments=3, **FULL_PASS_KWARGS)
+    
+    assert _segmented(statuses) == segmentable
+    assert output_files(tmp_path / "segmented") == output_files(tmp_path / "single")
+
+
+def test_shared_run_matches_separate_runs(tmp_path, extract):
+    modes = ['scene', 'interval', 'dedup', 'motion', 'ranges']
+    extract(tmp_path / "shared", ",".join(modes), **FULL_PASS_KWARGS)
+    
+    for mode in modes:
+        extract(tmp_path / mode, mode, **FULL_PASS_KWARGS)
+        assert output_files(tmp_path / "shared" / mode) == output_files(tmp_path / mode), mode
+
+
+def test_split_modes():
+    assert VideoProcessor.split_modes("scene, interval,scene") == ['scene', 'interval']
+    assert VideoProcessor.split_modes("all") == ['all']
+
+
+@pytest.mark.parametrize("mode, preallocated", [
+    ('all', 120),
+    ('interval', 8),
+    ('motion', TensorSink.GROW_CHUNK),
+])
+def test_tensor_sink_preallocates_only_known_counts(tmp_path, extract, monkeypatch, mode, preallocated):
+    grown = []
+    original = TensorSink._grow
+    
+    def record(sink, rows):
+        grown.append(rows)
+        original(sink, rows)
+    
+    monkeypatch.setattr(TensorSink, '_grow', record)
+    extract(tmp_path, mode, output_sink='tensor', interval=0.5)
+    
+    assert grown[0] == preallocated
+    frames = np.load(tmp_path / TensorSink.ARRAY_NAME, mmap_mode='r')
+    assert frames.shape[1:] == (360, 640, 3)
+
+
+@pytest.mark.parametrize("mode", sorted(VideoProcessor.STRATEGIES))
+def test_benchmark_kwargs_build_every_strategy(mode):
+    strategy_class = VideoProcessor.STRATEGIES[mode]
+    strategy = strategy_class(30.0, 120, **strategy_kwargs(mode, 120))
+    
+    assert strategy.name
+
+
+@pytest.mark.parametrize("output_sink", ['directory', 'zip'])
+def test_cancel_stops_within_a_frame(tmp_path, extract, monkeypatch, output_sink):
+    token = CancellationToken()
+    futures = []
+    cancel_at = 20
+    original_start = FrameWriter.start
+    
+    def start(writer):
+        original_start(writer)
+        submit = writer._executor.submit
+        
+        def record(fn, *args):
+            future = submit(fn, *args)
+            futures.append(future)
+            if len(futures) == cancel_at:
+                token.cancel()
+            return future
+        writer._executor.submit = record
+    
+    monkeypatch.setattr(FrameWriter, 'start', start)
+    
+    with pytest.raises(ProcessingCancelled):
+        extract(tmp_path, 'all', output_sink=output_sink, cancel_token=token)
+    
+    # The frame loop polls the token before every frame it decodes
+    assert cancel_at <= len(futures) <= cancel_at + 1
+    assert all(future.done() for future in futures)
+    assert not list(tmp_path.rglob("*.part"))
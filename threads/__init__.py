@@ -1,5 +1,7 @@
 # Frame_Ayirici/threads/__init__.py
 
 from .worker import ProcessingWorker
+from .filmstrip_worker import FilmstripWorker
+from .scene_index_worker import SceneIndexWorker
 
-__all__ = ['ProcessingWorker']
+__all__ = ['ProcessingWorker', 'FilmstripWorker', 'SceneIndexWorker']
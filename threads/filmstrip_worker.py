@@ -0,0 +1,44 @@
+# Frame_Ayirici/threads/filmstrip_worker.py
+"""
+Background thread that generates timeline thumbnails.
+"""
+
+from PySide6.QtCore import QThread, Signal
+
+from core.filmstrip import Filmstrip
+
+
+class FilmstripWorker(QThread):
+    """
+    QThread subclass that decodes filmstrip thumbnails off the GUI thread.
+    
+    Signals:
+        thumbnail_ready: Emitted per thumbnail (int index, bytes JPEG data)
+    """
+    
+    thumbnail_ready = Signal(int, bytes)
+    
+    def __init__(self, filmstrip: Filmstrip):
+        """
+        Initialize the filmstrip worker.
+        
+        Args:
+            filmstrip: Filmstrip describing the thumbnails to generate
+        """
+        super().__init__()
+        self.filmstrip = filmstrip
+    
+    def run(self) -> None:
+        """
+        Generate thumbnails, emitting each one as soon as it is ready.
+        This method runs in a separate thread.
+        """
+        try:
+            self.filmstrip.generate(
+                self.thumbnail_ready.emit,
+                is_cancelled=self.isInterruptionRequested
+            )
+        except Exception:
+            # Thumbnails are a preview only; a broken filmstrip must not
+            # interfere with loading or processing the video
+            pass
@@ -0,0 +1,40 @@
+# Frame_Ayirici/threads/scene_index_worker.py
+"""
+Background thread that builds the scene index of a video.
+"""
+
+from PySide6.QtCore import QThread
+
+from core.strategies import SceneChangeStrategy
+
+
+class SceneIndexWorker(QThread):
+    """
+    QThread subclass that runs a signature-only scene analysis pass.
+    No frames are written; QThread.finished tells the UI to refresh the
+    cut count preview.
+    """
+    
+    def __init__(self, video_path: str):
+        """
+        Initialize the scene index worker.
+        
+        Args:
+            video_path: Path to the video file
+        """
+        super().__init__()
+        self.video_path = video_path
+    
+    def run(self) -> None:
+        """
+        Build and save the scene index.
+        This method runs in a separate thread.
+        """
+        try:
+            SceneChangeStrategy.build_index(
+                self.video_path, is_cancelled=self.isInterruptionRequested
+            )
+        except Exception:
+            # The index only feeds the threshold preview; extraction
+            # builds it again and reports real errors
+            pass
@@ -4,10 +4,12 @@ Background worker thread for video processing.
 Uses PySide6 and follows Dependency Inversion Principle.
 """
 
+from typing import Optional
+
 from PySide6.QtCore import QThread, Signal
 
-from core.video_processor import VideoProcessor
-from core.protocols import SignalAdapter
+from core.video_processor import VideoProcessor, ProcessingCancelled
+from core.protocols import SignalAdapter, InterruptionAdapter
 
 
 class ProcessingWorker(QThread):
@@ -17,6 +19,7 @@ class ProcessingWorker(QThread):
     Signals:
         finished: Emitted when processing completes successfully (str message)
         error: Emitted when an error occurs (str error message)
+        cancelled: Emitted once a cancelled run has stopped (str message)
         progress_update: Emitted for progress updates (int 0-100)
         status_update: Emitted for status text updates (str message)
     """
@@ -24,6 +27,7 @@ class ProcessingWorker(QThread):
     # Qt Signals for communication with UI
     finished = Signal(str)
     error = Signal(str)
+    cancelled = Signal(str)
     progress_update = Signal(int)
     status_update = Signal(str)
     
@@ -32,6 +36,7 @@ class ProcessingWorker(QThread):
         video_path: str, 
         output_dir: str, 
         mode: str, 
+        cancel_token=None,
         **kwargs
     ):
         """
@@ -40,14 +45,29 @@ class ProcessingWorker(QThread):
         Args:
             video_path: Path to the video file
             output_dir: Output directory for frames
-            mode: Extraction mode ('all', 'range', 'scene')
+            mode: Extraction mode ('all', 'range', 'scene', 'interval', 'ranges',
+                'dedup', 'motion'), or several comma-separated modes sharing one
+                decode pass
+            cancel_token: CancellationProtocol to poll (default: thread interruption)
             **kwargs: Additional arguments for the strategy
         """
         super().__init__()
         self.video_path = video_path
         self.output_dir = output_dir
         self.mode = mode
+        self.cancel_token = cancel_token or InterruptionAdapter(self.isInterruptionRequested)
         self.kwargs = kwargs
+        self.processor: Optional[VideoProcessor] = None
+    
+    def busy_seconds(self) -> float:
+        """
+        Working seconds of the run so far; 0 unless started with timings=True.
+        Safe to call from the GUI thread.
+        """
+        processor = self.processor
+        if processor is None or processor.timings is None:
+            return 0.0
+        return processor.timings.busy_seconds()
     
     def run(self) -> None:
         """
@@ -63,16 +83,22 @@ class ProcessingWorker(QThread):
             )
             
             # Create and run processor
-            processor = VideoProcessor(
+            self.processor = processor = VideoProcessor(
                 video_path=self.video_path,
                 output_dir=self.output_dir,
                 mode=self.mode,
                 signals=signal_adapter,
+                cancel_token=self.cancel_token,
                 **self.kwargs
             )
             
             result_message = processor.run()
             self.finished.emit(result_message)
             
+        except ProcessingCancelled as e:
+            # Emitted after queued writes have drained, so the UI is only
+            # released once the output folder is consistent
+            self.cancelled.emit(str(e))
+            
         except Exception as e:
             self.error.emit(str(e))
\ No newline at end of file
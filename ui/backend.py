@@ -5,13 +5,21 @@ Provides data bindings and operations to the QML frontend.
 """
 
 import os
-import cv2
+from functools import partial
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
-from PySide6.QtCore import QObject, Property, Signal, Slot, QUrl
+from PySide6.QtCore import QObject, Property, Signal, Slot, QTimer, QUrl
 
+from core.filmstrip import Filmstrip
+from core.probe import probe_video
+from core.scheduler import Job, JobScheduler, JobState
+from core.strategies import IntervalStrategy, SceneChangeStrategy
+from threads.filmstrip_worker import FilmstripWorker
+from threads.scene_index_worker import SceneIndexWorker
 from threads.worker import ProcessingWorker
+from ui.job_model import JobListModel
+from ui.thumbnail_provider import ThumbnailProvider
 from utils.formatters import format_duration, format_size
 
 
@@ -29,7 +37,17 @@ class Backend(QObject):
     statusChanged = Signal()
     processingChanged = Signal()
     timeRangeChanged = Signal()
+    intervalChanged = Signal()
+    sceneThresholdChanged = Signal()
+    rangesFileChanged = Signal()
     showMessage = Signal(str, str, bool)  # title, message, isError
+    filmstripChanged = Signal()
+    thumbnailReady = Signal(int)  # thumbnail index
+    jobsChanged = Signal()
+    sceneIndexChanged = Signal()
+    
+    # Milliseconds between scheduler load samples
+    SCHEDULER_INTERVAL_MS = 1000
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -48,8 +66,31 @@ class Backend(QObject):
         self._is_processing: bool = False
         self._start_time: str = "00:00:00"
         self._end_time: str = "00:00:00"
+        self._interval: float = IntervalStrategy.DEFAULT_INTERVAL
+        self._scene_threshold: float = SceneChangeStrategy.DEFAULT_THRESHOLD
+        self._ranges_file: str = ""
         
         self._worker: Optional[ProcessingWorker] = None
+        
+        # Filmstrip state; the provider is registered with the QML engine
+        self.thumbnail_provider = ThumbnailProvider()
+        self._filmstrip_source: str = ""
+        self._filmstrip_count: int = 0
+        self._filmstrip_worker: Optional[FilmstripWorker] = None
+        self._retired_filmstrip_workers: List[FilmstripWorker] = []
+        
+        # Background scene analysis feeding the threshold preview
+        self._scene_index_worker: Optional[SceneIndexWorker] = None
+        self._retired_scene_index_workers: List[SceneIndexWorker] = []
+        
+        # Job queue; runs independently of the single startProcessing job
+        self._scheduler = JobScheduler()
+        self._job_model = JobListModel(self)
+        self._job_workers: Dict[int, ProcessingWorker] = {}
+        self._retired_job_workers: List[ProcessingWorker] = []
+        self._scheduler_timer = QTimer(self)
+        self._scheduler_timer.setInterval(self.SCHEDULER_INTERVAL_MS)
+        self._scheduler_timer.timeout.connect(self._schedule_jobs)
     
     # ============ Video Path Property ============
     @Property(str, notify=videoPathChanged)
@@ -132,6 +173,61 @@ class Backend(QObject):
             self._end_time = value
             self.timeRangeChanged.emit()
     
+    # ============ Interval Property ============
+    @Property(float, notify=intervalChanged)
+    def intervalSeconds(self) -> float:
+        """Seconds between saved frames in interval mode."""
+        return self._interval
+    
+    @intervalSeconds.setter
+    def intervalSeconds(self, value: float) -> None:
+        if value > 0 and self._interval != value:
+            self._interval = value
+            self.intervalChanged.emit()
+    
+    # ============ Scene Threshold Property ============
+    @Property(float, notify=sceneThresholdChanged)
+    def sceneThreshold(self) -> float:
+        """Correlation threshold of scene mode (lower = fewer cuts)."""
+        return self._scene_threshold
+    
+    @sceneThreshold.setter
+    def sceneThreshold(self, value: float) -> None:
+        if 0.0 <= value <= 1.0 and self._scene_threshold != value:
+            self._scene_threshold = value
+            self.sceneThresholdChanged.emit()
+    
+    @Property(bool, notify=sceneIndexChanged)
+    def sceneIndexBuilding(self) -> bool:
+        """Whether the scene index of the current video is being built."""
+        return self._scene_index_worker is not None
+    
+    # ============ Range List Property ============
+    @Property(str, notify=rangesFileChanged)
+    def rangesFile(self) -> str:
+        """CSV or EDL range list used in multi-range mode."""
+        return self._ranges_file
+    
+    # ============ Filmstrip Properties ============
+    @Property(str, notify=filmstripChanged)
+    def filmstripSource(self) -> str:
+        """Base image URL; thumbnail i is <filmstripSource>/<i>."""
+        return self._filmstrip_source
+    
+    @Property(int, notify=filmstripChanged)
+    def filmstripCount(self) -> int:
+        return self._filmstrip_count
+    
+    # ============ Job Queue Properties ============
+    @Property(QObject, constant=True)
+    def jobModel(self) -> JobListModel:
+        return self._job_model
+    
+    @Property(int, notify=jobsChanged)
+    def pendingJobCount(self) -> int:
+        """Jobs that are queued, running or paused."""
+        return sum(1 for job in self._scheduler.jobs if not job.finished)
+    
     # ============ Slots (Methods callable from QML) ============
     @Slot(QUrl)
     def loadVideo(self, file_url: QUrl) -> None:
@@ -144,42 +240,31 @@ class Backend(QObject):
             return
         
         try:
-            cap = cv2.VideoCapture(file_path)
-            if not cap.isOpened():
-                raise IOError("Video dosyası açılamadı veya bozuk.")
-            
-            # Extract video properties
-            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-            fps = cap.get(cv2.CAP_PROP_FPS)
-            frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-            
-            # Validate FPS
-            if fps is None or fps <= 0 or fps > 1000:
-                fps = 30.0
-            
-            duration_seconds = frame_count / fps if fps > 0 else 0
-            file_size_bytes = os.path.getsize(file_path)
-            
-            cap.release()
+            # Cached; VideoProcessor reuses the same probe when processing
+            metadata = probe_video(file_path)
+            duration_seconds = metadata.duration
             
             # Update properties
             self._video_path = file_path
-            self._resolution = f"{width} × {height} px"
+            self._resolution = f"{metadata.width} × {metadata.height} px"
             self._duration = format_duration(duration_seconds)
-            self._fps = fps
-            self._frame_count = frame_count
-            self._file_size = format_size(file_size_bytes)
+            self._fps = metadata.fps
+            self._frame_count = metadata.frame_count
+            self._file_size = format_size(metadata.file_size)
             self._video_duration = int(duration_seconds)
             self._start_time = "00:00:00"
             self._end_time = format_duration(duration_seconds)
             
+            # The previous video's analysis is of no use any more
+            self._stop_scene_index()
+            
             # Emit all signals
             self.videoPathChanged.emit()
             self.videoInfoChanged.emit()
             self.timeRangeChanged.emit()
             
             self._update_status("Video başarıyla yüklendi.")
+            self._start_filmstrip(file_path)
             
         except Exception as e:
             self.showMessage.emit("Hata", f"Video bilgileri okunurken hata: {e}", True)
@@ -191,6 +276,60 @@ class Backend(QObject):
         self._end_time = format_duration(high_sec)
         self.timeRangeChanged.emit()
     
+    @Slot(QUrl)
+    def setRangesFile(self, file_url: QUrl) -> None:
+        """Select the range list file for multi-range mode."""
+        file_path = file_url.toLocalFile()
+        
+        if not file_path or not os.path.exists(file_path):
+            self.showMessage.emit("Hata", "Dosya bulunamadı.", True)
+            return
+        
+        self._ranges_file = file_path
+        self.rangesFileChanged.emit()
+    
+    @Slot(float, result=int)
+    def previewSceneCuts(self, threshold: float) -> int:
+        """
+        Count scene cuts for a threshold using the persisted scene index.
+        
+        Returns:
+            Number of frames scene mode would save, or -1 if the video
+            has not been analysed yet
+        """
+        if not self._video_path:
+            return -1
+        
+        index = SceneChangeStrategy.load_index(self._video_path)
+        if index is None:
+            return -1
+        
+        return index.count_cuts(threshold)
+    
+    @Slot()
+    def prepareSceneIndex(self) -> None:
+        """
+        Build the scene index of the current video in the background,
+        without writing frames, so previewSceneCuts() has data.
+        sceneIndexChanged is emitted when the pass starts and ends.
+        """
+        if not self._video_path or self._is_processing:
+            return
+        
+        if self._scene_index_worker is not None:
+            if self._scene_index_worker.video_path == self._video_path:
+                return
+            self._stop_scene_index()
+        
+        if SceneChangeStrategy.load_index(self._video_path) is not None:
+            return
+        
+        worker = SceneIndexWorker(self._video_path)
+        worker.finished.connect(self._on_scene_index_finished)
+        self._scene_index_worker = worker
+        worker.start()
+        self.sceneIndexChanged.emit()
+    
     @Slot(str)
     def startProcessing(self, mode: str) -> None:
         """Start the frame extraction process."""
@@ -202,11 +341,10 @@ class Backend(QObject):
             self.showMessage.emit("Bilgi", "Zaten devam eden bir işlem var.", False)
             return
         
-        # Prepare kwargs
-        kwargs = {}
-        if mode == "range":
-            kwargs["start_time"] = self._start_time
-            kwargs["end_time"] = self._end_time
+        if not self._check_mode_settings(mode):
+            return
+        
+        kwargs = self._mode_kwargs(mode)
         
         # Update UI state
         self._is_processing = True
@@ -214,6 +352,9 @@ class Backend(QObject):
         self.processingChanged.emit()
         self.progressChanged.emit()
         
+        # The run decodes the same video; a scene run also writes the index
+        self._stop_scene_index()
+        
         # Create and start worker
         self._worker = ProcessingWorker(
             video_path=self._video_path,
@@ -227,6 +368,7 @@ class Backend(QObject):
         self._worker.status_update.connect(self._update_status)
         self._worker.finished.connect(self._on_finished)
         self._worker.error.connect(self._on_error)
+        self._worker.cancelled.connect(self._on_cancelled)
         
         self._worker.start()
     
@@ -234,21 +376,233 @@ class Backend(QObject):
     def cancelProcessing(self) -> None:
         """Cancel the current processing operation."""
         if self._worker is not None and self._worker.isRunning():
+            # VideoProcessor polls the interruption flag once per frame and
+            # drains in-flight writes; the UI is reset by _on_cancelled
             self._worker.requestInterruption()
-            self._worker.wait(2000)  # Wait up to 2 seconds
+            self._update_status("İptal ediliyor...")
+    
+    @Slot(str)
+    def enqueueJob(self, mode: str) -> None:
+        """Queue an extraction of the current video with the current settings."""
+        if not self._video_path:
+            self.showMessage.emit("Uyarı", "Lütfen önce bir video dosyası seçin.", True)
+            return
+        
+        if not self._check_mode_settings(mode):
+            return
+        
+        kwargs = self._mode_kwargs(mode)
+        self._scheduler.add(self._video_path, self._output_dir, mode, **kwargs)
+        self._update_status("İş kuyruğa eklendi.")
+        self._schedule_jobs()
+    
+    @Slot(int)
+    def pauseJob(self, job_id: int) -> None:
+        """Pause a queued or running job."""
+        if self._scheduler.pause(job_id):
+            # A running job keeps its slot until _on_job_stopped
+            self._schedule_jobs()
+    
+    @Slot(int)
+    def resumeJob(self, job_id: int) -> None:
+        """Resume a paused job."""
+        if self._scheduler.resume(job_id):
+            self._schedule_jobs()
+    
+    @Slot(int)
+    def cancelJob(self, job_id: int) -> None:
+        """Cancel a job; a running job stops at its next frame."""
+        if self._scheduler.cancel(job_id):
+            self._schedule_jobs()
+    
+    @Slot(int, int)
+    def setJobPriority(self, job_id: int, priority: int) -> None:
+        """Change a job's priority (higher starts first)."""
+        if self._scheduler.set_priority(job_id, priority):
+            self._schedule_jobs()
+    
+    @Slot()
+    def clearFinishedJobs(self) -> None:
+        """Remove done, failed and cancelled jobs from the list."""
+        self._scheduler.remove_finished()
+        self._refresh_jobs()
+    
+    # ============ Private Methods ============
+    def _mode_kwargs(self, mode: str) -> Dict:
+        """Strategy parameters for a mode from the current UI settings."""
+        kwargs = {}
+        if mode == "range":
+            kwargs["start_time"] = self._start_time
+            kwargs["end_time"] = self._end_time
+        elif mode == "scene":
+            kwargs["threshold"] = self._scene_threshold
+        elif mode == "interval":
+            kwargs["interval"] = self._interval
+        elif mode == "ranges":
+            kwargs["ranges_file"] = self._ranges_file
+        return kwargs
+    
+    def _check_mode_settings(self, mode: str) -> bool:
+        """Warn and return False if the mode is missing a required setting."""
+        if mode == "ranges" and not self._ranges_file:
+            self.showMessage.emit("Uyarı", "Lütfen bir aralık listesi (CSV/EDL) seçin.", True)
+            return False
+        return True
+    
+    def _schedule_jobs(self) -> None:
+        """Start queued jobs while the scheduler has free slots."""
+        self._reap_jobs()
+        
+        for job_id, worker in self._job_workers.items():
+            job = self._scheduler.get(job_id)
+            if job is not None:
+                job.busy_seconds = worker.busy_seconds()
+        self._scheduler.sample_load()
+        
+        for job in self._scheduler.next_jobs():
+            self._start_job(job)
+        
+        if self._job_workers:
+            self._scheduler_timer.start()
+        else:
+            self._scheduler_timer.stop()
+        
+        self._refresh_jobs()
+    
+    def _start_job(self, job: Job) -> None:
+        worker = ProcessingWorker(
+            video_path=job.video_path,
+            output_dir=job.output_dir,
+            mode=job.mode,
+            cancel_token=job,
+            workers=self._scheduler.writer_workers,
+            # Keep all work in this process's threads so that the stage
+            # timings the scheduler samples cover the whole job
+            writer_backend='thread',
+            segments=1,
+            timings=True,
+            **job.kwargs
+        )
+        
+        worker.progress_update.connect(partial(self._on_job_progress, job))
+        worker.status_update.connect(partial(self._on_job_status, job))
+        worker.finished.connect(partial(self._on_job_done, job, JobState.DONE))
+        worker.error.connect(partial(self._on_job_done, job, JobState.FAILED))
+        worker.cancelled.connect(partial(self._on_job_stopped, job))
+        
+        # A job resumed right after pausing may restart before the thread
+        # of its previous run has returned; keep that one referenced
+        previous = self._job_workers.get(job.job_id)
+        if previous is not None:
+            self._retired_job_workers.append(previous)
+        self._job_workers[job.job_id] = worker
+        
+        job.message = "Başlatılıyor..."
+        worker.start()
+    
+    def _reap_jobs(self) -> None:
+        """Release workers whose thread has ended."""
+        for job_id, worker in list(self._job_workers.items()):
+            if not worker.isFinished():
+                continue
             
-            if self._worker.isRunning():
-                self._worker.terminate()
-                self._worker.wait()
+            # A worker that ended without reporting back frees its job
+            job = self._scheduler.get(job_id)
+            if job is not None and job.running:
+                self._scheduler.stopped(job, "İşlem iptal edildi.")
             
-            self._is_processing = False
-            self._progress = 0
-            self.processingChanged.emit()
-            self.progressChanged.emit()
-            self._update_status("İşlem iptal edildi.")
-            self.showMessage.emit("Bilgi", "İşlem kullanıcı tarafından iptal edildi.", False)
+            del self._job_workers[job_id]
+        
+        self._retired_job_workers = [
+            worker for worker in self._retired_job_workers
+            if not worker.isFinished()
+        ]
+    
+    def _refresh_jobs(self) -> None:
+        self._job_model.refresh(self._scheduler.jobs)
+        self.jobsChanged.emit()
+    
+    def _on_job_progress(self, job: Job, value: int) -> None:
+        job.progress = value
+        self._job_model.job_changed(job)
+    
+    def _on_job_status(self, job: Job, message: str) -> None:
+        job.message = message
+        self._job_model.job_changed(job)
+    
+    def _on_job_done(self, job: Job, state: str, message: str) -> None:
+        # The worker is released by _reap_jobs once its thread has ended
+        self._scheduler.finish(job, state, message)
+        self._schedule_jobs()
+    
+    def _on_job_stopped(self, job: Job, message: str) -> None:
+        # Cancelled or paused; a paused job resumes from its checkpoint
+        self._scheduler.stopped(job, message)
+        self._schedule_jobs()
+    
+    def _start_filmstrip(self, file_path: str) -> None:
+        """Generate timeline thumbnails for a video in the background."""
+        self._stop_filmstrip()
+        
+        try:
+            filmstrip = Filmstrip(file_path)
+        except OSError:
+            return
+        
+        self._filmstrip_source = (
+            f"image://{ThumbnailProvider.PROVIDER_ID}/{filmstrip.key}"
+        )
+        self._filmstrip_count = filmstrip.count
+        self.filmstripChanged.emit()
+        
+        self._filmstrip_worker = FilmstripWorker(filmstrip)
+        self._filmstrip_worker.thumbnail_ready.connect(self._on_thumbnail_ready)
+        self._filmstrip_worker.start()
+    
+    def _stop_filmstrip(self) -> None:
+        """Ask the running filmstrip worker to stop without waiting for it."""
+        # Keep stopping workers referenced until they finish; a QThread
+        # must not be destroyed while it is running
+        self._retired_filmstrip_workers = [
+            worker for worker in self._retired_filmstrip_workers
+            if not worker.isFinished()
+        ]
+        
+        if self._filmstrip_worker is not None:
+            self._filmstrip_worker.requestInterruption()
+            self._retired_filmstrip_workers.append(self._filmstrip_worker)
+            self._filmstrip_worker = None
+    
+    def _stop_scene_index(self) -> None:
+        """Ask the running scene index worker to stop without waiting for it."""
+        self._retired_scene_index_workers = [
+            worker for worker in self._retired_scene_index_workers
+            if not worker.isFinished()
+        ]
+        
+        if self._scene_index_worker is not None:
+            self._scene_index_worker.requestInterruption()
+            self._retired_scene_index_workers.append(self._scene_index_worker)
+            self._scene_index_worker = None
+            self.sceneIndexChanged.emit()
+    
+    def _on_scene_index_finished(self) -> None:
+        # Ignore workers stopped for a previous video or a processing run
+        if self.sender() is not self._scene_index_worker:
+            return
+        
+        self._scene_index_worker = None
+        self.sceneIndexChanged.emit()
+    
+    def _on_thumbnail_ready(self, index: int, data: bytes) -> None:
+        # Ignore thumbnails still queued from a previously loaded video
+        if self.sender() is not self._filmstrip_worker:
+            return
+        
+        key = self._filmstrip_source.rsplit("/", 1)[-1]
+        self.thumbnail_provider.insert(f"{key}/{index}", data)
+        self.thumbnailReady.emit(index)
     
-    # ============ Private Methods ============
     def _update_status(self, message: str) -> None:
         self._status_message = message
         self.statusChanged.emit()
@@ -265,6 +619,14 @@ class Backend(QObject):
         self._update_status(message)
         self.showMessage.emit("Başarılı", message, False)
     
+    def _on_cancelled(self, message: str) -> None:
+        self._is_processing = False
+        self._progress = 0
+        self.processingChanged.emit()
+        self.progressChanged.emit()
+        self._update_status(message)
+        self.showMessage.emit("Bilgi", "İşlem kullanıcı tarafından iptal edildi.", False)
+    
     def _on_error(self, error_message: str) -> None:
         self._is_processing = False
         self._progress = 0
@@ -0,0 +1,83 @@
+# Frame_Ayirici/ui/job_model.py
+"""
+List model exposing the job queue to QML.
+"""
+
+import os
+from typing import List
+
+from PySide6.QtCore import QAbstractListModel, QByteArray, QModelIndex, Qt
+
+from core.scheduler import Job
+
+
+class JobListModel(QAbstractListModel):
+    """
+    Read-only view of JobScheduler.jobs for a QML ListView.
+    The Backend calls refresh() after every scheduler change and
+    job_changed() for progress updates of a single job.
+    """
+    
+    JobIdRole = Qt.UserRole + 1
+    VideoNameRole = Qt.UserRole + 2
+    ModeRole = Qt.UserRole + 3
+    StateRole = Qt.UserRole + 4
+    ProgressRole = Qt.UserRole + 5
+    MessageRole = Qt.UserRole + 6
+    PriorityRole = Qt.UserRole + 7
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._jobs: List[Job] = []
+    
+    def roleNames(self):
+        return {
+            self.JobIdRole: QByteArray(b"jobId"),
+            self.VideoNameRole: QByteArray(b"videoName"),
+            self.ModeRole: QByteArray(b"mode"),
+            self.StateRole: QByteArray(b"state"),
+            self.ProgressRole: QByteArray(b"progress"),
+            self.MessageRole: QByteArray(b"message"),
+            self.PriorityRole: QByteArray(b"priority"),
+        }
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._jobs)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._jobs):
+            return None
+        
+        job = self._jobs[index.row()]
+        
+        if role == self.JobIdRole:
+            return job.job_id
+        if role in (self.VideoNameRole, Qt.DisplayRole):
+            return os.path.basename(job.video_path)
+        if role == self.ModeRole:
+            return job.mode
+        if role == self.StateRole:
+            return job.state
+        if role == self.ProgressRole:
+            return job.progress
+        if role == self.MessageRole:
+            return job.message
+        if role == self.PriorityRole:
+            return job.priority
+        return None
+    
+    def refresh(self, jobs: List[Job]) -> None:
+        """Replace the rows with the scheduler's current job order."""
+        self.beginResetModel()
+        self._jobs = list(jobs)
+        self.endResetModel()
+    
+    def job_changed(self, job: Job) -> None:
+        """Notify views that one job's progress, state or message changed."""
+        for row, candidate in enumerate(self._jobs):
+            if candidate is job:
+                model_index = self.index(row)
+                self.dataChanged.emit(model_index, model_index)
+                return
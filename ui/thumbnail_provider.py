@@ -0,0 +1,87 @@
+# Frame_Ayirici/ui/thumbnail_provider.py
+"""
+QML image provider serving filmstrip thumbnails.
+"""
+
+import threading
+from collections import OrderedDict
+
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QImage
+from PySide6.QtQuick import QQuickImageProvider
+
+from core.filmstrip import Filmstrip
+
+
+class ThumbnailProvider(QQuickImageProvider):
+    """
+    Serves "image://filmstrip/<key>/<index>" URLs from an in-memory LRU
+    cache, falling back to the filmstrip disk cache.
+    
+    requestImage() runs on QML's image loader threads when the Image is
+    asynchronous, so the cache is guarded by a lock.
+    """
+    
+    # Provider id used in image:// URLs
+    PROVIDER_ID = "filmstrip"
+    
+    # Decoded thumbnails kept in memory
+    CACHE_SIZE = 256
+    
+    def __init__(self):
+        super().__init__(QQuickImageProvider.Image)
+        self._images: "OrderedDict[str, QImage]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def insert(self, image_id: str, data: bytes) -> None:
+        """
+        Add an encoded thumbnail to the memory cache.
+        
+        Args:
+            image_id: "<key>/<index>"
+            data: JPEG bytes
+        """
+        image = QImage.fromData(data)
+        if image.isNull():
+            return
+        
+        with self._lock:
+            self._images[image_id] = image
+            self._images.move_to_end(image_id)
+            
+            while len(self._images) > self.CACHE_SIZE:
+                self._images.popitem(last=False)
+    
+    def _lookup(self, image_id: str) -> QImage:
+        """Return a cached image, loading it from disk if necessary."""
+        with self._lock:
+            image = self._images.get(image_id)
+            if image is not None:
+                self._images.move_to_end(image_id)
+                return image
+        
+        key, _, index = image_id.partition("/")
+        if not index.isdigit():
+            return QImage()
+        
+        data = Filmstrip.read_cached(key, int(index))
+        if data is None:
+            return QImage()
+        
+        self.insert(image_id, data)
+        return QImage.fromData(data)
+    
+    def requestImage(self, image_id: str, size: QSize, requested_size: QSize) -> QImage:
+        # QML appends "?<revision>" to force reloads; it is not part of the id
+        image = self._lookup(image_id.split("?", 1)[0])
+        
+        if image.isNull():
+            # Transparent placeholder until the thumbnail streams in
+            width = max(requested_size.width(), 1)
+            height = max(requested_size.height(), 1)
+            image = QImage(width, height, QImage.Format_ARGB32)
+            image.fill(0)
+        
+        size.setWidth(image.width())
+        size.setHeight(image.height())
+        return image
@@ -0,0 +1,50 @@
+# Frame_Ayirici/utils/cache.py
+"""
+Helpers for the on-disk cache shared by analysis indexes.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+
+# Environment variable overriding the cache location (read at import)
+CACHE_ENV = "FRAME_EXTRACTOR_CACHE_DIR"
+
+# Root directory for all cached data
+CACHE_ROOT = Path(os.environ.get(CACHE_ENV) or Path.home() / ".cache" / "FrameExtractor")
+
+
+def cache_dir(name: str) -> Path:
+    """
+    Return (and create) a named cache subdirectory.
+    
+    Args:
+        name: Subdirectory name (e.g. "scene_index")
+        
+    Returns:
+        Path to the cache directory
+    """
+    path = CACHE_ROOT / name
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def file_cache_key(file_path: str, *extra) -> str:
+    """
+    Build a cache key that changes whenever the file changes.
+    
+    Args:
+        file_path: Path to the source file
+        *extra: Additional values that affect the cached data
+        
+    Returns:
+        Hex digest of (absolute path, size, mtime, extra values)
+        
+    Raises:
+        OSError: If the file does not exist
+    """
+    stat = os.stat(file_path)
+    parts = [os.path.abspath(file_path), str(stat.st_size), str(stat.st_mtime_ns)]
+    parts.extend(str(value) for value in extra)
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()